@@ -22,7 +22,8 @@ from freqtrade.commands.list_commands import (start_list_exchanges,
                                               start_list_timeframes,
                                               start_show_trades)
 from freqtrade.commands.optimize_commands import (start_backtesting,
-                                                  start_edge, start_hyperopt)
+                                                  start_edge, start_hyperopt,
+                                                  start_walk_forward)
 from freqtrade.commands.pairlist_commands import start_test_pairlist
 from freqtrade.commands.plot_commands import (start_plot_dataframe,
                                               start_plot_profit)
@@ -16,17 +16,26 @@ ARGS_STRATEGY = ["strategy", "strategy_path"]
 ARGS_TRADE = ["db_url", "sd_notify", "dry_run"]
 
 ARGS_COMMON_OPTIMIZE = ["ticker_interval", "timerange",
-                        "max_open_trades", "stake_amount", "fee"]
+                        "max_open_trades", "stake_amount", "fee", "indicator_cache"]
 
 ARGS_BACKTEST = ARGS_COMMON_OPTIMIZE + ["position_stacking", "use_max_market_positions",
-                                        "strategy_list", "export", "exportfilename"]
+                                        "strategy_list", "backtest_jobs", "export",
+                                        "exportfilename", "backtest_engine"]
 
 ARGS_HYPEROPT = ARGS_COMMON_OPTIMIZE + ["hyperopt", "hyperopt_path",
                                         "position_stacking", "epochs", "spaces",
                                         "use_max_market_positions", "print_all",
                                         "print_colorized", "print_json", "hyperopt_jobs",
                                         "hyperopt_random_state", "hyperopt_min_trades",
-                                        "hyperopt_continue", "hyperopt_loss"]
+                                        "hyperopt_continue", "hyperopt_loss", "backtest_engine",
+                                        "hyperopt_sampler", "hyperopt_surrogate_window",
+                                        "hyperopt_profile",
+                                        "hyperopt_pruning_rungs", "hyperopt_pruning_factor",
+                                        "hyperopt_coordinator", "hyperopt_worker"]
+
+ARGS_WALK_FORWARD = ARGS_COMMON_OPTIMIZE + ["position_stacking", "use_max_market_positions",
+                                            "backtest_engine", "wf_train_days", "wf_test_days",
+                                            "wf_step_days", "wf_jobs"]
 
 ARGS_EDGE = ARGS_COMMON_OPTIMIZE + ["stoploss_range"]
 
@@ -167,7 +176,7 @@ class Arguments:
                                         start_new_hyperopt, start_new_strategy,
                                         start_plot_dataframe, start_plot_profit, start_show_trades,
                                         start_backtesting, start_hyperopt, start_edge,
-                                        start_test_pairlist, start_trading)
+                                        start_test_pairlist, start_trading, start_walk_forward)
 
         subparsers = self.parser.add_subparsers(dest='command',
                                                 # Use custom message when no subhandler is added
@@ -239,6 +248,12 @@ class Arguments:
         backtesting_cmd.set_defaults(func=start_backtesting)
         self._build_args(optionlist=ARGS_BACKTEST, parser=backtesting_cmd)
 
+        # Add walk-forward subcommand
+        walk_forward_cmd = subparsers.add_parser('walk-forward', help='Walk-forward module.',
+                                                 parents=[_common_parser, _strategy_parser])
+        walk_forward_cmd.set_defaults(func=start_walk_forward)
+        self._build_args(optionlist=ARGS_WALK_FORWARD, parser=walk_forward_cmd)
+
         # Add edge subcommand
         edge_cmd = subparsers.add_parser('edge', help='Edge module.',
                                          parents=[_common_parser, _strategy_parser])
@@ -354,7 +369,7 @@ class Arguments:
         plot_profit_cmd = subparsers.add_parser(
             'plot-profit',
             help='Generate plot showing profits.',
-            parents=[_common_parser],
+            parents=[_common_parser, _strategy_parser],
         )
         plot_profit_cmd.set_defaults(func=start_plot_profit)
         self._build_args(optionlist=ARGS_PLOT_PROFIT, parser=plot_profit_cmd)
@@ -152,9 +152,19 @@ AVAILABLE_CLI_OPTIONS = {
         '(so `backtest-data.json` becomes `backtest-data-DefaultStrategy.json`',
         nargs='+',
     ),
+    "backtest_jobs": Arg(
+        '--strategy-jobs',
+        help='Number of strategies from `--strategy-list` to backtest in parallel, '
+        'each in its own worker process. Workers share the OHLCV data loaded once '
+        'by the main process. Requires the `fork` start method (not available on Windows). '
+        '(default: 1).',
+        type=check_int_positive,
+        metavar='INT',
+    ),
     "export": Arg(
         '--export',
-        help='Export backtest results, argument are: trades. '
+        help='Export backtest results, argument are: trades (json file), '
+        'parquet (Parquet dataset, requires pyarrow). '
         'Example: `--export=trades`',
     ),
     "exportfilename": Arg(
@@ -164,12 +174,54 @@ AVAILABLE_CLI_OPTIONS = {
         'Example: `--export-filename=user_data/backtest_results/backtest_today.json`',
         metavar='PATH',
     ),
+    "backtest_engine": Arg(
+        '--backtest-engine',
+        help='Select the backtest engine. `classic` loops over candle rows, '
+        '`columnar` works on per-pair NumPy column arrays and is faster on large datasets. '
+        'Both produce the same results. (default: `classic`).',
+        choices=constants.BACKTEST_ENGINES,
+    ),
+    "wf_train_days": Arg(
+        '--wf-train-days',
+        help='Length of the train (in-sample) period of each walk-forward window in days. '
+        'Without train period, only rolling test windows are backtested.',
+        type=check_int_positive,
+        metavar='INT',
+    ),
+    "wf_test_days": Arg(
+        '--wf-test-days',
+        help='Length of the test (out-of-sample) period of each walk-forward window in days.',
+        type=check_int_positive,
+        metavar='INT',
+    ),
+    "wf_step_days": Arg(
+        '--wf-step-days',
+        help='Number of days each walk-forward window moves forward. '
+        '(default: length of the test period).',
+        type=check_int_positive,
+        metavar='INT',
+    ),
+    "wf_jobs": Arg(
+        '--wf-jobs',
+        help='Number of walk-forward windows to backtest in parallel, each in its own '
+        'worker process. Workers share the indicators populated once by the main process. '
+        'Requires the `fork` start method (not available on Windows). (default: 1).',
+        type=check_int_positive,
+        metavar='INT',
+    ),
     "fee": Arg(
         '--fee',
         help='Specify fee ratio. Will be applied twice (on trade entry and exit).',
         type=float,
         metavar='FLOAT',
     ),
+    "indicator_cache": Arg(
+        '--indicator-cache',
+        help='Cache populated indicators in `user_data/indicator_cache`, and reuse them '
+        'as long as neither the strategy file nor the data has changed.',
+        action='store_true',
+        default=False,
+    ),
     # Edge
     "stoploss_range": Arg(
         '--stoplosses',
@@ -259,6 +311,59 @@ AVAILABLE_CLI_OPTIONS = {
         default=False,
         action='store_true',
     ),
+    "hyperopt_sampler": Arg(
+        '--sampler',
+        help='Select the sampler suggesting the parameters of each epoch. `et` fits an '
+        'Extra-Trees model (Bayesian optimization), `tpe` a Tree-structured Parzen Estimator, '
+        '`random` and `halton` (quasi-random) have no model and the lowest cost per epoch. '
+        '(default: `et`).',
+        choices=constants.HYPEROPT_SAMPLERS,
+    ),
+    "hyperopt_surrogate_window": Arg(
+        '--surrogate-window',
+        help='Fit the model of the `et` and `tpe` samplers on the last INT evaluated epochs '
+        'only, to keep the cost per epoch constant in long runs (default: 0, all epochs).',
+        type=check_int_positive,
+        metavar='INT',
+    ),
+    "hyperopt_profile": Arg(
+        '--profile',
+        help='Profile every 10th epoch (starting with the first one) with cProfile. '
+        'Stats are written to `hyperopt_profile_<epoch>.prof` in the hyperopt results '
+        'directory (`user_data/hyperopt_results/`).',
+        action='store_true',
+        default=False,
+    ),
+    "hyperopt_pruning_rungs": Arg(
+        '--pruning-rungs',
+        help='Backtest each epoch on growing parts of the timerange first (successive halving). '
+        'Epochs not among the best of the epochs evaluated on the same part are pruned. '
+        'Number of parts before the full timerange (default: 0, no pruning).',
+        type=check_int_positive,
+        metavar='INT',
+    ),
+    "hyperopt_pruning_factor": Arg(
+        '--pruning-factor',
+        help='Each part of the timerange is FACTOR times longer than the previous one, '
+        'and only the best 1/FACTOR of the epochs evaluated on a part are promoted '
+        'to the next one (default: 3).',
+        type=check_int_positive,
+        metavar='FACTOR',
+    ),
+    "hyperopt_coordinator": Arg(
+        '--coordinator',
+        help='Run as coordinator of distributed hyperopt: hand out epochs to workers '
+        'connecting to ADDRESS (`host:port`, e.g. `0.0.0.0:8765`) instead of evaluating '
+        'them locally. Requires `hyperopt_remote_secret` in the configuration.',
+        metavar='ADDRESS',
+    ),
+    "hyperopt_worker": Arg(
+        '--worker',
+        help='Run as worker of distributed hyperopt: evaluate epochs for the coordinator '
+        'at ADDRESS (`host:port`) until it is done. Use the same configuration, strategy, '
+        'hyperopt, spaces and data as the coordinator.',
+        metavar='ADDRESS',
+    ),
     "hyperopt_loss": Arg(
         '--hyperopt-loss',
         help='Specify the class name of the hyperopt loss function class (IHyperOptLoss). '
@@ -1,6 +1,6 @@
 import logging
 from operator import itemgetter
-from typing import Any, Dict, List
+from typing import Any, Dict
 
 from colorama import init as colorama_init
 
@@ -16,6 +16,7 @@ def start_hyperopt_list(args: Dict[str, Any]) -> None:
     List hyperopt epochs previously evaluated
     """
     from freqtrade.optimize.hyperopt import Hyperopt
+    from freqtrade.optimize.hyperopt_store import HyperoptResultStore
 
     config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
 
@@ -38,14 +39,13 @@ def start_hyperopt_list(args: Dict[str, Any]) -> None:
         'filter_max_total_profit': config.get('hyperopt_list_max_total_profit', None)
     }
 
-    results_file = (config['user_data_dir'] /
-                    'hyperopt_results' / 'hyperopt_results.pickle')
+    results_store = HyperoptResultStore(config['user_data_dir'] /
+                                        'hyperopt_results' / 'hyperopt_results.sqlite')
 
     # Previous evaluations
-    epochs = Hyperopt.load_previous_results(results_file)
-    total_epochs = len(epochs)
-
-    epochs = _hyperopt_filter_epochs(epochs, filteroptions)
+    total_epochs = results_store.count()
+    epochs = results_store.load(filteroptions)
+    _log_filtered_epochs(len(epochs), filteroptions)
 
     if print_colorized:
         colorama_init(autoreset=True)
@@ -73,13 +73,14 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
     Show details of a hyperopt epoch previously evaluated
     """
     from freqtrade.optimize.hyperopt import Hyperopt
+    from freqtrade.optimize.hyperopt_store import HyperoptResultStore
 
     config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
 
     print_json = config.get('print_json', False)
     no_header = config.get('hyperopt_show_no_header', False)
-    results_file = (config['user_data_dir'] /
-                    'hyperopt_results' / 'hyperopt_results.pickle')
+    results_store = HyperoptResultStore(config['user_data_dir'] /
+                                        'hyperopt_results' / 'hyperopt_results.sqlite')
     n = config.get('hyperopt_show_index', -1)
 
     filteroptions = {
@@ -96,11 +97,9 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
     }
 
     # Previous evaluations
-    epochs = Hyperopt.load_previous_results(results_file)
-    total_epochs = len(epochs)
-
-    epochs = _hyperopt_filter_epochs(epochs, filteroptions)
-    filtered_epochs = len(epochs)
+    total_epochs = results_store.count()
+    filtered_epochs = results_store.count(filteroptions)
+    _log_filtered_epochs(filtered_epochs, filteroptions)
 
     if n > filtered_epochs:
         raise OperationalException(
@@ -109,74 +108,20 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
         raise OperationalException(
             f"The index of the epoch to show should be greater than {-filtered_epochs - 1}.")
 
-    # Translate epoch index from human-readable format to pythonic
+    # Translate epoch index from human-readable format to an offset in the filtered epochs
     if n > 0:
         n -= 1
+    elif n < 0:
+        n += filtered_epochs
 
-    if epochs:
-        val = epochs[n]
+    if filtered_epochs:
+        val = results_store.load(filteroptions, offset=n, limit=1)[0]
         Hyperopt.print_epoch_details(val, total_epochs, print_json, no_header,
                                      header_str="Epoch details")
 
 
-def _hyperopt_filter_epochs(epochs: List, filteroptions: dict) -> List:
-    """
-    Filter our items from the list of hyperopt results
-    """
-    if filteroptions['only_best']:
-        epochs = [x for x in epochs if x['is_best']]
-    if filteroptions['only_profitable']:
-        epochs = [x for x in epochs if x['results_metrics']['profit'] > 0]
-    if filteroptions['filter_min_trades'] > 0:
-        epochs = [
-            x for x in epochs
-            if x['results_metrics']['trade_count'] > filteroptions['filter_min_trades']
-        ]
-    if filteroptions['filter_max_trades'] > 0:
-        epochs = [
-            x for x in epochs
-            if x['results_metrics']['trade_count'] < filteroptions['filter_max_trades']
-        ]
-    if filteroptions['filter_min_avg_time'] is not None:
-        epochs = [x for x in epochs if x['results_metrics']['trade_count'] > 0]
-        epochs = [
-            x for x in epochs
-            if x['results_metrics']['duration'] > filteroptions['filter_min_avg_time']
-        ]
-    if filteroptions['filter_max_avg_time'] is not None:
-        epochs = [x for x in epochs if x['results_metrics']['trade_count'] > 0]
-        epochs = [
-            x for x in epochs
-            if x['results_metrics']['duration'] < filteroptions['filter_max_avg_time']
-        ]
-    if filteroptions['filter_min_avg_profit'] is not None:
-        epochs = [x for x in epochs if x['results_metrics']['trade_count'] > 0]
-        epochs = [
-            x for x in epochs
-            if x['results_metrics']['avg_profit'] > filteroptions['filter_min_avg_profit']
-        ]
-    if filteroptions['filter_max_avg_profit'] is not None:
-        epochs = [x for x in epochs if x['results_metrics']['trade_count'] > 0]
-        epochs = [
-            x for x in epochs
-            if x['results_metrics']['avg_profit'] < filteroptions['filter_max_avg_profit']
-        ]
-    if filteroptions['filter_min_total_profit'] is not None:
-        epochs = [x for x in epochs if x['results_metrics']['trade_count'] > 0]
-        epochs = [
-            x for x in epochs
-            if x['results_metrics']['profit'] > filteroptions['filter_min_total_profit']
-        ]
-    if filteroptions['filter_max_total_profit'] is not None:
-        epochs = [x for x in epochs if x['results_metrics']['trade_count'] > 0]
-        epochs = [
-            x for x in epochs
-            if x['results_metrics']['profit'] < filteroptions['filter_max_total_profit']
-        ]
-
-    logger.info(f"{len(epochs)} " +
+def _log_filtered_epochs(num_epochs: int, filteroptions: dict) -> None:
+    logger.info(f"{num_epochs} " +
                 ("best " if filteroptions['only_best'] else "") +
                 ("profitable " if filteroptions['only_profitable'] else "") +
                 "epochs found.")
-
-    return epochs
@@ -49,6 +49,24 @@ def start_backtesting(args: Dict[str, Any]) -> None:
     backtesting.start()
 
 
+def start_walk_forward(args: Dict[str, Any]) -> None:
+    """
+    Start walk-forward script
+    :param args: Cli args from Arguments()
+    :return: None
+    """
+    # Import here to avoid loading backtesting module when it's not used
+    from freqtrade.optimize.walk_forward import WalkForward
+
+    # Initialize configuration
+    config = setup_optimize_configuration(args, RunMode.BACKTEST)
+
+    logger.info('Starting freqtrade in Walk-forward mode')
+
+    walk_forward = WalkForward(config)
+    walk_forward.start()
+
+
 def start_hyperopt(args: Dict[str, Any]) -> None:
     """
     Start hyperopt script
@@ -67,6 +85,12 @@ def start_hyperopt(args: Dict[str, Any]) -> None:
 
     logger.info('Starting freqtrade in Hyperopt mode')
 
+    if config.get('hyperopt_worker'):
+        # Workers don't store results, several of them can run on one machine
+        logging.getLogger('filelock').setLevel(logging.WARNING)
+        Hyperopt(config).start_worker()
+        return
+
     lock = FileLock(Hyperopt.get_lock_filename(config))
 
     try:
@@ -234,6 +234,9 @@ class Configuration:
                              logstring='Parameter --fee detected, '
                              'setting fee to: {} ...')
 
+        self._args_to_config(config, argname='indicator_cache',
+                             logstring='Parameter --indicator-cache detected ...')
+
         self._args_to_config(config, argname='timerange',
                              logstring='Parameter --timerange detected: {} ...')
 
@@ -242,11 +245,31 @@ class Configuration:
         self._args_to_config(config, argname='strategy_list',
                              logstring='Using strategy list of {} strategies', logfun=len)
 
+        self._args_to_config(config, argname='backtest_jobs',
+                             logstring='Parameter --strategy-jobs detected: {} ...')
+
         self._args_to_config(config, argname='ticker_interval',
                              logstring='Overriding ticker interval with Command line argument')
 
         self._args_to_config(config, argname='export',
                              logstring='Parameter --export detected: {} ...')
+        if config.get('export') == 'parquet' and not self.args.get('exportfilename'):
+            config['exportfilename'] = config['exportfilename'].with_suffix('.parquet')
+
+        self._args_to_config(config, argname='backtest_engine',
+                             logstring='Parameter --backtest-engine detected: {} ...')
+
+        self._args_to_config(config, argname='wf_train_days',
+                             logstring='Parameter --wf-train-days detected: {} ...')
+
+        self._args_to_config(config, argname='wf_test_days',
+                             logstring='Parameter --wf-test-days detected: {} ...')
+
+        self._args_to_config(config, argname='wf_step_days',
+                             logstring='Parameter --wf-step-days detected: {} ...')
+
+        self._args_to_config(config, argname='wf_jobs',
+                             logstring='Parameter --wf-jobs detected: {} ...')
 
         # Edge section:
         if 'stoploss_range' in self.args and self.args["stoploss_range"]:
@@ -298,6 +321,27 @@ class Configuration:
         self._args_to_config(config, argname='hyperopt_continue',
                              logstring='Hyperopt continue: {}')
 
+        self._args_to_config(config, argname='hyperopt_sampler',
+                             logstring='Parameter --sampler detected: {}')
+
+        self._args_to_config(config, argname='hyperopt_surrogate_window',
+                             logstring='Parameter --surrogate-window detected: {}')
+
+        self._args_to_config(config, argname='hyperopt_profile',
+                             logstring='Parameter --profile detected ...')
+
+        self._args_to_config(config, argname='hyperopt_pruning_rungs',
+                             logstring='Parameter --pruning-rungs detected: {}')
+
+        self._args_to_config(config, argname='hyperopt_pruning_factor',
+                             logstring='Parameter --pruning-factor detected: {}')
+
+        self._args_to_config(config, argname='hyperopt_coordinator',
+                             logstring='Parameter --coordinator detected: {}')
+
+        self._args_to_config(config, argname='hyperopt_worker',
+                             logstring='Parameter --worker detected: {}')
+
         self._args_to_config(config, argname='hyperopt_loss',
                              logstring='Using Hyperopt loss class name: {}')
 
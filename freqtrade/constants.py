@@ -23,7 +23,9 @@ ORDERTYPE_POSSIBILITIES = ['limit', 'market']
 ORDERTIF_POSSIBILITIES = ['gtc', 'fok', 'ioc']
 AVAILABLE_PAIRLISTS = ['StaticPairList', 'VolumePairList',
                        'PrecisionFilter', 'PriceFilter', 'ShuffleFilter', 'SpreadFilter']
-AVAILABLE_DATAHANDLERS = ['json', 'jsongz']
+AVAILABLE_DATAHANDLERS = ['json', 'jsongz', 'feather']
+BACKTEST_ENGINES = ['classic', 'columnar']
+HYPEROPT_SAMPLERS = ['et', 'tpe', 'random', 'halton']
 DRY_RUN_WALLET = 1000
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
 DEFAULT_DATAFRAME_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume']
@@ -245,7 +247,23 @@ CONF_SCHEMA = {
             'type': 'string',
                     'enum': AVAILABLE_DATAHANDLERS,
                     'default': 'jsongz'
-        }
+        },
+        'backtest_engine': {'type': 'string', 'enum': BACKTEST_ENGINES},
+        'backtest_jobs': {'type': 'integer', 'minimum': 1},
+        'indicator_cache': {'type': 'boolean'},
+        'indicator_cache_size': {'type': 'integer', 'minimum': 1},
+        'wf_train_days': {'type': 'integer', 'minimum': 0},
+        'wf_test_days': {'type': 'integer', 'minimum': 1},
+        'wf_step_days': {'type': 'integer', 'minimum': 1},
+        'wf_jobs': {'type': 'integer', 'minimum': 1},
+        'hyperopt_sampler': {'type': 'string', 'enum': HYPEROPT_SAMPLERS},
+        'hyperopt_surrogate_window': {'type': 'integer', 'minimum': 0},
+        'hyperopt_profile': {'type': 'boolean'},
+        'hyperopt_pruning_rungs': {'type': 'integer', 'minimum': 0},
+        'hyperopt_pruning_factor': {'type': 'integer', 'minimum': 2},
+        'hyperopt_coordinator': {'type': 'string'},
+        'hyperopt_worker': {'type': 'string'},
+        'hyperopt_remote_secret': {'type': 'string'},
     },
     'definitions': {
         'exchange': {
@@ -293,7 +311,8 @@ CONF_SCHEMA = {
                 'minimum_expectancy': {'type': 'number'},
                 'min_trade_number': {'type': 'number'},
                 'max_trade_duration_minute': {'type': 'integer'},
-                'remove_pumps': {'type': 'boolean'}
+                'remove_pumps': {'type': 'boolean'},
+                'jobs': {'type': 'integer', 'minimum': 1}
             },
             'required': ['process_throttle_secs', 'allowed_risk']
         }
@@ -333,5 +352,7 @@ CANCEL_REASON = {
     "CANCELLED_ON_EXCHANGE": "cancelled on exchange",
 }
 
+# Pair with its timeframe
+PairWithTimeframe = Tuple[str, str]
 # List of pairs with their timeframes
-ListPairsWithTimeframes = List[Tuple[str, str]]
+ListPairsWithTimeframes = List[PairWithTimeframe]
@@ -3,14 +3,15 @@ Helpers when analyzing backtest data
 """
 import logging
 from pathlib import Path
-from typing import Dict, Union, Tuple
+from typing import Any, Dict, List, Optional, Union, Tuple
 
 import numpy as np
 import pandas as pd
 from datetime import timezone
 
 from freqtrade import persistence
-from freqtrade.misc import json_load
+from freqtrade.exceptions import OperationalException
+from freqtrade.misc import json_load, pair_to_filename
 from freqtrade.persistence import Trade
 
 logger = logging.getLogger(__name__)
@@ -20,15 +21,26 @@ BT_DATA_COLUMNS = ["pair", "profitperc", "open_time", "close_time", "index", "du
                    "open_rate", "close_rate", "open_at_end", "sell_reason"]
 
 
-def load_backtest_data(filename: Union[Path, str]) -> pd.DataFrame:
+def load_backtest_data(filename: Union[Path, str], strategy: Optional[str] = None,
+                       pairs: Optional[List[str]] = None,
+                       columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Load backtest data file.
-    :param filename: pathlib.Path object, or string pointing to the file.
+    :param filename: pathlib.Path object, or string pointing to the file (json export)
+                     or directory (Parquet export).
+    :param strategy: Only load trades of this strategy. Parquet exports contain
+                     multiple strategies, json exports are ignoring this.
+    :param pairs: Only load trades of these pairs
+    :param columns: Only load these columns (of BT_DATA_COLUMNS).
+                    Parquet exports don't read other columns from disk.
     :return: a dataframe with the analysis results
     """
     if isinstance(filename, str):
         filename = Path(filename)
 
+    if filename.is_dir():
+        return _load_backtest_data_parquet(filename, strategy, pairs, columns)
+
     if not filename.is_file():
         raise ValueError(f"File {filename} does not exist.")
 
@@ -36,6 +48,8 @@ def load_backtest_data(filename: Union[Path, str]) -> pd.DataFrame:
         data = json_load(file)
 
     df = pd.DataFrame(data, columns=BT_DATA_COLUMNS)
+    if pairs is not None:
+        df = df.loc[df['pair'].isin(pairs)].copy()
 
     df['open_time'] = pd.to_datetime(df['open_time'],
                                      unit='s',
@@ -47,8 +61,49 @@ def load_backtest_data(filename: Union[Path, str]) -> pd.DataFrame:
                                       utc=True,
                                       infer_datetime_format=True
                                       )
-    df['profit'] = df['close_rate'] - df['open_rate']
+    return _finalize_backtest_data(df, columns)
+
+
+def _load_backtest_data_parquet(dirname: Path, strategy: Optional[str],
+                                pairs: Optional[List[str]],
+                                columns: Optional[List[str]]) -> pd.DataFrame:
+    """
+    Load backtest results from a Parquet dataset, partitioned by strategy and pair.
+    Only reads the partitions and columns which were selected.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise OperationalException(
+            f"{e}. Please install pyarrow (`pip3 install pyarrow`) "
+            "to load backtest results exported to Parquet.") from e
+
+    filters: List[Tuple[str, str, Any]] = []
+    if strategy is not None:
+        filters.append(('strategy', '=', strategy))
+    if pairs is not None:
+        filters.append(('pair_key', 'in', [pair_to_filename(pair) for pair in pairs]))
+
+    read_columns = list(BT_DATA_COLUMNS) if columns is None else list(columns)
+    if strategy is None:
+        # Keep trades of different strategies apart
+        read_columns.append('strategy')
+    if 'open_time' not in read_columns:
+        read_columns.append('open_time')
+
+    df = pd.read_parquet(dirname, engine='pyarrow', columns=read_columns,
+                         filters=filters or None)
+    if 'strategy' in df:
+        df['strategy'] = df['strategy'].astype(str)
+    return _finalize_backtest_data(df, columns)
+
+
+def _finalize_backtest_data(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    if 'open_rate' in df and 'close_rate' in df:
+        df['profit'] = df['close_rate'] - df['open_rate']
     df = df.sort_values("open_time").reset_index(drop=True)
+    if columns is not None:
+        df = df[[col for col in df.columns if col in columns or col == 'strategy']]
     return df
 
 
@@ -130,15 +185,18 @@ def load_trades_from_db(db_url: str) -> pd.DataFrame:
 
 
 def load_trades(source: str, db_url: str, exportfilename: Path,
-                no_trades: bool = False) -> pd.DataFrame:
+                no_trades: bool = False, strategy: Optional[str] = None,
+                pairs: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Based on configuration option "trade_source":
     * loads data from DB (using `db_url`)
     * loads data from backtestfile (using `exportfilename`)
     :param source: "DB" or "file" - specify source to load from
     :param db_url: sqlalchemy formatted url to a database
-    :param exportfilename: Json file generated by backtesting
+    :param exportfilename: Json file or Parquet dataset generated by backtesting
     :param no_trades: Skip using trades, only return backtesting data columns
+    :param strategy: Strategy to load backtest results for (Parquet datasets only)
+    :param pairs: Only load backtest results of these pairs
     :return: DataFrame containing trades
     """
     if no_trades:
@@ -148,7 +206,7 @@ def load_trades(source: str, db_url: str, exportfilename: Path,
     if source == "DB":
         return load_trades_from_db(db_url)
     elif source == "file":
-        return load_backtest_data(exportfilename)
+        return load_backtest_data(exportfilename, strategy=strategy, pairs=pairs)
 
 
 def extract_trades_of_period(dataframe: pd.DataFrame, trades: pd.DataFrame,
@@ -5,13 +5,15 @@ including ticker and orderbook data, live and historical candle (OHLCV) data
 Common Interface for bot and strategy to access data.
 """
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, Series, concat
 
+from freqtrade.configuration import TimeRange
 from freqtrade.data.history import load_pair_history
 from freqtrade.exceptions import DependencyException, OperationalException
-from freqtrade.exchange import Exchange
+from freqtrade.exchange import Exchange, timeframe_to_minutes
 from freqtrade.state import RunMode
 from freqtrade.constants import ListPairsWithTimeframes
 
@@ -25,6 +27,11 @@ class DataProvider:
         self._config = config
         self._exchange = exchange
         self._pairlists = pairlists
+        # Historic candle (OHLCV) data, loaded from disk once per (pair, timeframe)
+        # and timerange, if any
+        self._historic_data: Dict[Tuple, DataFrame] = {}
+        # Memoized positions of informative candles aligned to base timeframe candles
+        self._informative_alignments: Dict[Tuple, np.ndarray] = {}
 
     def refresh(self,
                 pairlist: ListPairsWithTimeframes,
@@ -60,35 +67,126 @@ class DataProvider:
         else:
             return DataFrame()
 
-    def historic_ohlcv(self, pair: str, timeframe: str = None) -> DataFrame:
+    def historic_ohlcv(self, pair: str, timeframe: str = None, copy: bool = True,
+                       timerange: Optional[TimeRange] = None) -> DataFrame:
         """
-        Get stored historical candle (OHLCV) data
+        Get stored historical candle (OHLCV) data.
+        Data is read from disk on first access only, and kept in memory afterwards.
         :param pair: pair to get the data for
         :param timeframe: timeframe to get data for
-        """
-        return load_pair_history(pair=pair,
-                                 timeframe=timeframe or self._config['ticker_interval'],
-                                 datadir=self._config['datadir']
-                                 )
-
-    def get_pair_dataframe(self, pair: str, timeframe: str = None) -> DataFrame:
+        :param copy: copy dataframe before returning if True.
+                     Use False only for read-only operations (where the dataframe is not modified)
+        :param timerange: Limit data to this timerange. Data formats supporting it
+                          (feather) only read this timerange from disk.
+        """
+        pair_key = (pair, timeframe or self._config['ticker_interval'])
+        data_key = pair_key + ((timerange.starttype, timerange.startts,
+                                timerange.stoptype, timerange.stopts) if timerange else ())
+        if data_key not in self._historic_data:
+            self._historic_data[data_key] = load_pair_history(
+                pair=pair,
+                timeframe=pair_key[1],
+                datadir=self._config['datadir'],
+                timerange=timerange,
+                data_format=self._config.get('dataformat_ohlcv', 'json'),
+            )
+        data = self._historic_data[data_key]
+        return data.copy() if copy else data
+
+    def preload_historic_ohlcv(self, pairlist: ListPairsWithTimeframes) -> None:
+        """
+        Load historical candle (OHLCV) data for all given (pair, timeframe) combinations,
+        so strategies don't have to wait for disk reads while populating indicators.
+        :param pairlist: List of (pair, timeframe) tuples to load
+        """
+        for pair, timeframe in pairlist:
+            self.historic_ohlcv(pair, timeframe, copy=False)
+
+    def get_pair_dataframe(self, pair: str, timeframe: str = None,
+                           copy: bool = True) -> DataFrame:
         """
         Return pair candle (OHLCV) data, either live or cached historical -- depending
         on the runmode.
         :param pair: pair to get the data for
         :param timeframe: timeframe to get data for
+        :param copy: copy dataframe before returning if True.
+                     Use False only for read-only operations (where the dataframe is not modified)
         :return: Dataframe for this pair
         """
         if self.runmode in (RunMode.DRY_RUN, RunMode.LIVE):
             # Get live OHLCV data.
-            data = self.ohlcv(pair=pair, timeframe=timeframe)
+            data = self.ohlcv(pair=pair, timeframe=timeframe, copy=copy)
         else:
-            # Get historical OHLCV data (cached on disk).
-            data = self.historic_ohlcv(pair=pair, timeframe=timeframe)
+            # Get historical OHLCV data (cached in memory).
+            data = self.historic_ohlcv(pair=pair, timeframe=timeframe, copy=copy)
         if len(data) == 0:
             logger.warning(f"No data found for ({pair}, {timeframe}).")
         return data
 
+    def merge_informative(self, dataframe: DataFrame, pair: str, timeframe: str,
+                          ffill: bool = True) -> DataFrame:
+        """
+        Add the candles of an informative pair / timeframe to a dataframe of the
+        strategy's timeframe. Informative columns are suffixed with `_<timeframe>`
+        (e.g. `close_1h`).
+        Each candle only sees informative candles which are complete at its close:
+        a 1h candle opening at 13:00 is merged into the 5m candle opening at 13:55.
+        Outside of live / dry-run modes, the alignment is computed once per
+        (pair, timeframe) and dataframe date-range, and reused on further calls.
+        :param dataframe: Dataframe of the strategy's timeframe, not modified
+        :param pair: Informative pair
+        :param timeframe: Timeframe of the informative pair
+        :param ffill: Forward fill informative values to all candles until the next
+                      informative candle completes. Otherwise only the last candle of each
+                      informative period gets values, all others get NaN.
+        :return: Dataframe with the informative columns added
+        """
+        base_timeframe = self._config['ticker_interval']
+        informative = self.get_pair_dataframe(pair, timeframe, copy=False)
+        dates = dataframe['date'].values.astype('datetime64[ns]').astype(np.int64)
+
+        key = (pair, timeframe, base_timeframe, len(dates),
+               dates[0] if len(dates) else 0, dates[-1] if len(dates) else 0)
+        positions = self._informative_alignments.get(key)
+        if positions is None:
+            positions = self._align_informative(informative, dates, base_timeframe,
+                                                timeframe)
+            if self.runmode not in (RunMode.DRY_RUN, RunMode.LIVE):
+                # Live data changes with every candle, don't memoize it
+                self._informative_alignments[key] = positions
+
+        if ffill:
+            positions = positions[:, 0]
+        else:
+            positions = np.where(positions[:, 1] == 1, positions[:, 0], -1)
+        missing = positions < 0
+
+        aligned = informative.iloc[np.maximum(positions, 0)]
+        aligned.index = dataframe.index
+        if missing.any():
+            aligned = aligned.where(Series(~missing, index=aligned.index), axis=0)
+        aligned.columns = [f'{col}_{timeframe}' for col in informative.columns]
+        return concat([dataframe, aligned], axis=1)
+
+    @staticmethod
+    def _align_informative(informative: DataFrame, dates: np.ndarray,
+                           base_timeframe: str, timeframe: str) -> np.ndarray:
+        """
+        Get the position of the last informative candle complete at each base candle.
+        :return: 2 column array of <position (-1 if none), candle completes at this date>
+        """
+        result = np.full((len(dates), 2), -1, dtype=np.int64)
+        if informative.empty:
+            return result
+        offset = max(timeframe_to_minutes(timeframe) - timeframe_to_minutes(base_timeframe), 0)
+        # Date of the last base candle within each informative candle
+        inf_dates = (informative['date'].values.astype('datetime64[ns]').astype(np.int64)
+                     + offset * 60 * 1_000_000_000)
+        positions = np.searchsorted(inf_dates, dates, side='right') - 1
+        result[:, 0] = positions
+        result[:, 1] = (positions >= 0) & (inf_dates[np.maximum(positions, 0)] == dates)
+        return result
+
     def market(self, pair: str) -> Optional[Dict[str, Any]]:
         """
         Return market data for the pair
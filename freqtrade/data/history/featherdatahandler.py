@@ -0,0 +1,213 @@
+import logging
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame, read_feather, to_datetime
+
+from freqtrade import misc
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
+from freqtrade.exceptions import OperationalException
+
+from .idatahandler import IDataHandler, TradeList
+
+logger = logging.getLogger(__name__)
+
+
+class FeatherDataHandler(IDataHandler):
+    """
+    Stores data in Feather (Arrow IPC) files: one binary column per field, with dates as
+    int64 timestamps in milliseconds and prices and volumes as float64.
+    Loading doesn't parse any text, columns are read in their final type.
+    Files are written uncompressed, so they can be memory mapped.
+    """
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+
+    def __init__(self, datadir: Path) -> None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise OperationalException(
+                f"{e}. Please install pyarrow (`pip3 install pyarrow`) "
+                "to use the feather data format.") from e
+        super().__init__(datadir)
+
+    @classmethod
+    def ohlcv_get_pairs(cls, datadir: Path, timeframe: str) -> List[str]:
+        """
+        Returns a list of all pairs with ohlcv data available in this datadir
+        for the specified timeframe
+        :param datadir: Directory to search for ohlcv files
+        :param timeframe: Timeframe to search pairs for
+        :return: List of Pairs
+        """
+
+        _tmp = [re.search(r'^(\S+)(?=\-' + timeframe + '.feather)', p.name)
+                for p in datadir.glob(f"*{timeframe}.{cls._get_file_extension()}")]
+        # Check if regex found something and only return these results
+        return [match[0].replace('_', '/') for match in _tmp if match]
+
+    def ohlcv_store(self, pair: str, timeframe: str, data: DataFrame) -> None:
+        """
+        Store data in feather format, one column per field.
+        :param pair: Pair - used to generate filename
+        :timeframe: Timeframe - used to generate filename
+        :data: Dataframe containing OHLCV data
+        :return: None
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        _data = data.reset_index(drop=True).loc[:, self._columns]
+        _data = _data.astype(dtype={'open': 'float64', 'high': 'float64', 'low': 'float64',
+                                    'close': 'float64', 'volume': 'float64'})
+        # Convert date to int (milliseconds)
+        _data['date'] = _data['date'].astype(np.int64) // 1000 // 1000
+        _data.to_feather(filename, compression='uncompressed')
+
+    def _ohlcv_load(self, pair: str, timeframe: str,
+                    timerange: Optional[TimeRange] = None,
+                    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        The file is memory mapped and only the candles within the timerange
+                        are read, plus the closest candle before and after it - so
+                        ohlcv_load() still sees if data is missing, or if the end was trimmed.
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        from pyarrow import ipc, memory_map
+
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        if not filename.exists():
+            return DataFrame(columns=self._columns)
+        with memory_map(str(filename)) as source:
+            # Record batches reference the mapped file, nothing is read yet
+            table = ipc.open_file(source).read_all().select(self._columns)
+            if timerange and (timerange.starttype == 'date' or timerange.stoptype == 'date'):
+                start, stop = self._timerange_slice(table.column('date'), timerange)
+                table = table.slice(start, stop - start)
+            pairdata = table.to_pandas()
+        pairdata['date'] = to_datetime(pairdata['date'], unit='ms', utc=True)
+        return pairdata
+
+    @staticmethod
+    def _timerange_slice(dates, timerange: TimeRange) -> Tuple[int, int]:
+        """
+        Binary search the sorted dates (milliseconds) for the timerange.
+        :param dates: Date column (pyarrow ChunkedArray)
+        :param timerange: Timerange to search
+        :return: start and stop row, including the closest row outside each end
+        """
+        # Only the date column is read from the mapped file
+        timestamps = np.concatenate([chunk.to_numpy() for chunk in dates.chunks]
+                                    or [np.empty(0, dtype=np.int64)])
+        start, stop = 0, len(timestamps)
+        if timerange.starttype == 'date':
+            start = max(int(np.searchsorted(timestamps, timerange.startts * 1000, 'left')) - 1,
+                        0)
+        if timerange.stoptype == 'date':
+            stop = min(int(np.searchsorted(timestamps, timerange.stopts * 1000, 'right')) + 1,
+                       len(timestamps))
+        return start, max(stop, start)
+
+    def ohlcv_purge(self, pair: str, timeframe: str) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        if filename.exists():
+            filename.unlink()
+            return True
+        return False
+
+    def ohlcv_append(self, pair: str, timeframe: str, data: DataFrame) -> None:
+        """
+        Append data to existing data structures
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def trades_get_pairs(cls, datadir: Path) -> List[str]:
+        """
+        Returns a list of all pairs for which trade data is available in this
+        :param datadir: Directory to search for ohlcv files
+        :return: List of Pairs
+        """
+        _tmp = [re.search(r'^(\S+)(?=\-trades.feather)', p.name)
+                for p in datadir.glob(f"*trades.{cls._get_file_extension()}")]
+        # Check if regex found something and only return these results to avoid exceptions.
+        return [match[0].replace('_', '/') for match in _tmp if match]
+
+    def trades_store(self, pair: str, data: TradeList) -> None:
+        """
+        Store trades data (list of Dicts) to file
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        DataFrame(data, columns=DEFAULT_TRADES_COLUMNS).to_feather(
+            filename, compression='uncompressed')
+
+    def trades_append(self, pair: str, data: TradeList):
+        """
+        Append data to existing files
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        raise NotImplementedError()
+
+    def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> TradeList:
+        """
+        Load a pair from file
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for - currently not implemented
+        :return: List of trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return []
+        tradesdata = read_feather(filename, columns=DEFAULT_TRADES_COLUMNS)
+        # Missing ids and types are read as None, as stored
+        return tradesdata.astype(object).where(tradesdata.notnull(), None).values.tolist()
+
+    def trades_purge(self, pair: str) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if filename.exists():
+            filename.unlink()
+            return True
+        return False
+
+    @classmethod
+    def _pair_data_filename(cls, datadir: Path, pair: str, timeframe: str) -> Path:
+        pair_s = misc.pair_to_filename(pair)
+        filename = datadir.joinpath(f'{pair_s}-{timeframe}.{cls._get_file_extension()}')
+        return filename
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "feather"
+
+    @classmethod
+    def _pair_trades_filename(cls, datadir: Path, pair: str) -> Path:
+        pair_s = misc.pair_to_filename(pair)
+        filename = datadir.joinpath(f'{pair_s}-trades.{cls._get_file_extension()}')
+        return filename
@@ -62,7 +62,9 @@ class IDataHandler(ABC):
         :param timeframe: Timeframe (e.g. "5m")
         :param timerange: Limit data to be loaded to this timerange.
                         Optionally implemented by subclasses to avoid loading
-                        all data where possible.
+                        all data where possible. Subclasses doing so have to keep the
+                        closest candle before and after the timerange, so ohlcv_load()
+                        can validate the data and knows if the last candle is incomplete.
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
 
@@ -230,6 +232,9 @@ def get_datahandlerclass(datatype: str) -> Type[IDataHandler]:
     elif datatype == 'jsongz':
         from .jsondatahandler import JsonGzDataHandler
         return JsonGzDataHandler
+    elif datatype == 'feather':
+        from .featherdatahandler import FeatherDataHandler
+        return FeatherDataHandler
     else:
         raise ValueError(f"No datahandler for datatype {datatype} available.")
 
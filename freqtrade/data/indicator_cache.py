@@ -0,0 +1,200 @@
+"""
+Indicator cache
+Persists dataframes populated by a strategy's `populate_indicators()` under user_data,
+so backtesting, hyperopt and edge don't recompute unchanged indicators on every run.
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import pandas as pd
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+# Default maximum size of the indicator cache directory, in MB
+INDICATOR_CACHE_SIZE_DEFAULT = 1024
+
+
+class IndicatorCache:
+    """
+    On-disk cache of dataframes with populated indicators.
+    Entries are keyed by a fingerprint of the strategy's source and its configuration
+    overrides, the content of the informative pairs' data, the pair, the timeframe
+    and the content of the OHLCV data (which covers the timerange as well).
+    Least recently used entries are removed once the cache exceeds its maximum size.
+    """
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self._cache_dir = Path(config['user_data_dir']) / 'indicator_cache'
+        self._max_size = (config.get('indicator_cache_size', INDICATOR_CACHE_SIZE_DEFAULT)
+                          * 1024 * 1024)
+
+    @staticmethod
+    def strategy_fingerprint(strategy: Any) -> str:
+        """
+        Hash the source of the file(s) defining the indicators of this strategy, and of the
+        modules they import from the user_data directory or the strategy's own directory
+        (e.g. helper modules with custom indicators), recursively.
+        Includes the `populate_indicators()` of a hyperopt class if it replaced the
+        strategy's `advise_indicators()`.
+        """
+        functions: List[Callable] = [type(strategy).populate_indicators]
+        if 'advise_indicators' in vars(strategy):
+            functions.append(strategy.advise_indicators)
+
+        fingerprint = hashlib.sha1(type(strategy).__name__.encode())
+        directories = set()
+        if 'user_data_dir' in getattr(strategy, 'config', {}):
+            directories.add(Path(strategy.config['user_data_dir']).resolve())
+        for function in functions:
+            code = function.__code__
+            source_file = Path(code.co_filename)
+            if source_file.is_file():
+                fingerprint.update(source_file.read_bytes())
+                directories.add(source_file.resolve().parent)
+            else:
+                fingerprint.update(code.co_code)
+
+        for module_file in IndicatorCache._imported_files(
+                [function.__globals__ for function in functions], directories):
+            fingerprint.update(module_file.read_bytes())
+        return fingerprint.hexdigest()
+
+    @staticmethod
+    def config_fingerprint(strategy: Any) -> str:
+        """
+        Hash the strategy attributes which can be overridden by the configuration,
+        as resolved for this run.
+        """
+        # Imported here, the resolver imports the strategy interface which uses this cache
+        from freqtrade.resolvers.strategy_resolver import StrategyResolver
+
+        attributes = {attribute: getattr(strategy, attribute, None)
+                      for attribute, _, _ in StrategyResolver.override_attributes}
+        return hashlib.sha1(json.dumps(attributes, sort_keys=True, default=str).encode()
+                            ).hexdigest()
+
+    @staticmethod
+    def informative_fingerprint(strategy: Any) -> str:
+        """
+        Hash the data of the informative pairs of the strategy, which `populate_indicators()`
+        can read through the dataprovider.
+        """
+        fingerprint = hashlib.sha1()
+        if strategy.dp is None:
+            return fingerprint.hexdigest()
+        for pair, timeframe in sorted(strategy.informative_pairs()):
+            dataframe = strategy.dp.get_pair_dataframe(pair, timeframe, copy=False)
+            fingerprint.update(f'{pair}-{timeframe}'.encode())
+            if not dataframe.empty:
+                fingerprint.update(pd.util.hash_pandas_object(dataframe, index=False).values)
+        return fingerprint.hexdigest()
+
+    @staticmethod
+    def _imported_files(namespaces: List[Dict[str, Any]], directories: Set[Path]) -> List[Path]:
+        """
+        Source files of the modules referenced by these module namespaces - either imported
+        as module or by importing objects from them - which are located in one of the
+        directories. Follows the imports of these modules as well.
+        :return: Sorted list of files
+        """
+        files: Set[Path] = set()
+        while namespaces:
+            for value in list(namespaces.pop().values()):
+                module = value if isinstance(value, ModuleType) else sys.modules.get(
+                    getattr(value, '__module__', None) or '')
+                module_file = getattr(module, '__file__', None)
+                if not isinstance(module_file, str):
+                    continue
+                path = Path(module_file).resolve()
+                if (path not in files and path.is_file()
+                        and any(directory in path.parents for directory in directories)):
+                    files.add(path)
+                    namespaces.append(vars(module))
+        return sorted(files)
+
+    def _get_path(self, strategy_fingerprint: str, pair: str, timeframe: str,
+                  dataframe: DataFrame) -> Path:
+        data_hash = hashlib.sha1(pd.util.hash_pandas_object(dataframe, index=False).values)
+        data_hash.update(','.join(dataframe.columns).encode())
+        key = hashlib.sha1(f'{strategy_fingerprint}-{pair}-{timeframe}-'
+                           f'{data_hash.hexdigest()}'.encode()).hexdigest()
+        return self._cache_dir / f"{pair.replace('/', '_')}-{timeframe}-{key}.pkl"
+
+    def populate_indicators(self, strategy: Any,
+                            data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        Populate indicators for all pairs in data, using cached results where available.
+        :param strategy: Strategy to populate indicators with
+        :param data: Dict of OHLCV dataframes, will not be modified
+        :return: Dict of dataframes with populated indicators
+        """
+        fingerprint = '-'.join([self.strategy_fingerprint(strategy),
+                                self.config_fingerprint(strategy),
+                                self.informative_fingerprint(strategy)])
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        result = {}
+        hits = 0
+        for pair, pair_data in data.items():
+            path = self._get_path(fingerprint, pair, strategy.ticker_interval, pair_data)
+            dataframe = self._load(path)
+            if dataframe is None:
+                dataframe = strategy.advise_indicators(pair_data.copy(), {'pair': pair})
+                self._store(path, dataframe)
+            else:
+                hits += 1
+            result[pair] = dataframe
+
+        logger.info(f"Indicator cache: reused indicators for {hits} of {len(data)} pairs.")
+        self.evict()
+        return result
+
+    def _load(self, path: Path) -> Optional[DataFrame]:
+        if not path.is_file():
+            return None
+        try:
+            dataframe = pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"Could not load cached indicators from {path}: {e}")
+            return None
+        # Mark as recently used
+        os.utime(path)
+        return dataframe
+
+    def _store(self, path: Path, dataframe: DataFrame) -> None:
+        # Write to a temporary file first, so concurrent runs never read partial files
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        dataframe.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+    def evict(self) -> None:
+        """
+        Remove least recently used cache entries until the cache fits into its maximum size.
+        """
+        entries = []
+        for path in self._cache_dir.glob('*.pkl'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Removed by a concurrent run
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self._max_size:
+                break
+            logger.debug(f"Indicator cache: removing {path.name}")
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
@@ -1,30 +1,33 @@
 # pragma pylint: disable=W0603
 """ Edge positioning package """
 import logging
-from typing import Any, Dict, List, NamedTuple
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
 
 import arrow
 import numpy as np
-import utils_find_1st as utf1st
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
 from freqtrade.exceptions import OperationalException
 from freqtrade.data.history import get_timerange, load_data, refresh_data
-from freqtrade.strategy.interface import SellType
+from freqtrade.edge.expectancy import PairInfo, RunningExpectancy
+from freqtrade.exchange import timeframe_to_minutes
+from freqtrade.misc import fork_map
+from freqtrade.resolvers import StrategyResolver
+from freqtrade.strategy.interface import IStrategy, SellType
 
 logger = logging.getLogger(__name__)
 
 
-class PairInfo(NamedTuple):
-    stoploss: float
-    winrate: float
-    risk_reward_ratio: float
-    required_risk_reward: float
-    expectancy: float
-    nb_trades: int
-    avg_trade_duration: float
+# Columns of the candles Edge searches trades on
+ANALYZED_COLUMNS = ['date', 'buy', 'open', 'close', 'sell', 'high', 'low']
+
+# Columns of the trades found by Edge._find_trades_for_stoploss_range()
+TRADE_COLUMNS = ['pair', 'stoploss', 'open_time', 'close_time', 'open_index', 'close_index',
+                 'open_rate', 'close_rate', 'exit_type']
 
 
 class Edge:
@@ -65,6 +68,17 @@ class Edge:
         self._last_updated: int = 0  # Timestamp of pairs last updated time
         self._refresh_pairs = True
 
+        # State kept between calculations, by pair: candles (OHLCV), their signals and trades
+        self._pairs: List[str] = []
+        self._candles: Dict[str, DataFrame] = {}
+        self._analyzed: Dict[str, DataFrame] = {}
+        self._trades: Dict[str, DataFrame] = {}
+        # Running statistics of the trades, by pair and stoploss
+        self._expectancy: Dict[str, Dict[float, RunningExpectancy]] = {}
+        self._update_thread: Optional[threading.Thread] = None
+        # Strategy of the updates, apart from the one the bot analyzes candles with
+        self._update_strategy: Optional[IStrategy] = None
+
         self._stoploss_range_min = float(self.edge_config.get('stoploss_range_min', -0.01))
         self._stoploss_range_max = float(self.edge_config.get('stoploss_range_max', -0.05))
         self._stoploss_range_step = float(self.edge_config.get('stoploss_range_step', -0.001))
@@ -84,6 +98,15 @@ class Edge:
             self.fee = self.exchange.get_fee(symbol=self.config['exchange']['pair_whitelist'][0])
 
     def calculate(self) -> bool:
+        """
+        Calculate win rate, risk reward ratio and expectancy of the pairs,
+        every process_throttle_secs.
+        The first calculation loads the history of the pairs and blocks. Afterwards, only the
+        candles closed since are added, taken from the exchange's candle cache, and trades
+        opened before the calculation window roll out. These updates run in a background
+        thread, with their own strategy instance. Their results are used once they are complete.
+        :return: True if Edge was calculated or an update was started
+        """
         pairs = self.config['exchange']['pair_whitelist']
         heartbeat = self.edge_config.get('process_throttle_secs')
 
@@ -91,7 +114,32 @@ class Edge:
                 self._last_updated + heartbeat > arrow.utcnow().timestamp):
             return False
 
-        data: Dict[str, Any] = {}
+        if self._update_thread is not None and self._update_thread.is_alive():
+            logger.info('Previous Edge update is still running ...')
+            return False
+
+        if self._candles and self._pairs == pairs:
+            latest_candles = self._get_latest_candles()
+            if latest_candles is not None:
+                if self._update_strategy is None:
+                    self._update_strategy = StrategyResolver.load_strategy(self.config)
+                self._update_thread = threading.Thread(target=self._update,
+                                                       args=(latest_candles, ), daemon=True)
+                self._update_thread.start()
+                self._last_updated = arrow.utcnow().timestamp
+                return True
+
+        return self._calculate_from_history(pairs)
+
+    def _calculate_from_history(self, pairs: List[str]) -> bool:
+        """
+        Calculate Edge from scratch, from the candle history of the pairs
+        """
+        self._pairs = list(pairs)
+        self._candles = {}
+        self._analyzed = {}
+        self._trades = {}
+
         logger.info('Using stake_currency: %s ...', self.config['stake_currency'])
         logger.info('Using local backtesting data (using whitelist in given config) ...')
 
@@ -129,31 +177,145 @@ class Edge:
             max_date.isoformat(),
             (max_date - min_date).days
         )
-        headers = ['date', 'buy', 'open', 'close', 'sell', 'high', 'low']
 
-        trades: list = []
         for pair, pair_data in preprocessed.items():
             # Sorting dataframe by date and reset index
             pair_data = pair_data.sort_values(by=['date'])
             pair_data = pair_data.reset_index(drop=True)
 
-            df_analyzed = self.strategy.advise_sell(
-                self.strategy.advise_buy(pair_data, {'pair': pair}), {'pair': pair})[headers].copy()
+            self._candles[pair] = data[pair].sort_values(by=['date']).reset_index(drop=True)
+            self._analyzed[pair] = self.strategy.advise_sell(
+                self.strategy.advise_buy(pair_data, {'pair': pair}),
+                {'pair': pair})[ANALYZED_COLUMNS].copy()
 
-            trades += self._find_trades_for_stoploss_range(df_analyzed, pair, self._stoploss_range)
+        self._trades = self._find_trades(self._analyzed)
+        return self._process_trades()
+
+    def _process_trades(self) -> bool:
+        """
+        Calculate the expectancy of the pairs from the trades found
+        :return: False if there are no trades
+        """
+        trades = [pair_trades for pair_trades in self._trades.values() if not pair_trades.empty]
 
         # If no trade found then exit
-        if len(trades) == 0:
+        if not trades:
             logger.info("No trades found.")
             return False
 
         # Fill missing, calculable columns, profit, duration , abs etc.
-        trades_df = self._fill_calculable_fields(DataFrame(trades))
+        trades_df = self._fill_calculable_fields(concat(trades, ignore_index=True))
         self._cached_pairs = self._process_expectancy(trades_df)
         self._last_updated = arrow.utcnow().timestamp
 
         return True
 
+    def _get_latest_candles(self) -> Optional[Dict[str, DataFrame]]:
+        """
+        Latest candles of the pairs, from the exchange's candle cache.
+        Refreshes the cache for the pairs first, so it runs on the main thread.
+        :return: Cached candles by pair. None if the cache doesn't reach back to the last
+            calculation for a pair, then the history has to be loaded again.
+        """
+        timeframe = self.strategy.ticker_interval
+        self.exchange.refresh_latest_ohlcv([(pair, timeframe) for pair in self._candles])
+
+        latest_candles: Dict[str, DataFrame] = {}
+        for pair, candles in self._candles.items():
+            cached = self.exchange.klines((pair, timeframe))
+            last_date = candles['date'].iloc[-1]
+            if cached.empty or cached['date'].iloc[0] > last_date + timedelta(
+                    minutes=timeframe_to_minutes(timeframe)):
+                logger.info('Candles of %s since the last Edge calculation are missing, '
+                            'calculating Edge from history ...', pair)
+                return None
+            latest_candles[pair] = cached
+        return latest_candles
+
+    def _update(self, latest_candles: Dict[str, DataFrame]) -> None:
+        """
+        Update Edge with new candles. Runs in a background thread.
+        :param latest_candles: Latest candles from the exchange's candle cache, by pair
+        """
+        try:
+            window_start = arrow.utcnow().shift(days=-1 * self._since_number_of_days).datetime
+            for pair, latest in latest_candles.items():
+                self._update_pair(pair, latest, window_start)
+            self._cached_pairs = self._select_pairs()
+            self._last_updated = arrow.utcnow().timestamp
+        except Exception:
+            logger.exception('Edge update failed.')
+
+    def _update_pair(self, pair: str, latest: DataFrame, window_start: datetime) -> None:
+        """
+        Add new candles of a pair: populate their indicators and signals, search for trades
+        closed since, and roll out trades opened before the calculation window.
+        """
+        strategy = self._update_strategy or self.strategy
+        startup_candles = strategy.startup_candle_count
+        metadata = {'pair': pair}
+        ohlcv = self._candles[pair]
+        analyzed = self._analyzed[pair]
+        candles = latest[latest['date'] > ohlcv['date'].iloc[-1]]
+        # Indicators are populated from as many candles as dry-run and live trading analyze:
+        # the exchange's candle cache, at least the startup candles before the new candles
+        window = max(len(latest), startup_candles + len(candles))
+        if not candles.empty:
+            ohlcv = concat([ohlcv, candles], ignore_index=True)
+            tail = ohlcv.iloc[-window:].reset_index(drop=True)
+            tail = strategy.advise_sell(strategy.advise_buy(
+                strategy.advise_indicators(tail, metadata), metadata), metadata)
+            analyzed = concat([analyzed, tail[ANALYZED_COLUMNS].iloc[-len(candles):]],
+                              ignore_index=True)
+
+        # Roll out trades opened before, and signals not needed as startup candles anymore.
+        # Candles are kept for the indicators of the next update.
+        first_index = int(analyzed['date'].searchsorted(window_start))
+        trim = max(first_index - startup_candles, 0)
+        trades = self._trades[pair]
+        trades = trades[trades['open_index'] >= first_index].copy()
+        trades[['open_index', 'close_index']] -= trim
+        analyzed = analyzed.iloc[trim:].reset_index(drop=True)
+        ohlcv = ohlcv.iloc[-max(window, len(analyzed)):].reset_index(drop=True)
+
+        # Search trades of each stoploss from the exit of its last trade on
+        stoplosses = [round(stoploss, 6) for stoploss in self._stoploss_range]
+        start_indexes = trades.groupby('stoploss')['close_index'].max().reindex(
+            stoplosses, fill_value=first_index - trim).values.astype(np.int64)
+        offset = int(start_indexes.min()) if len(start_indexes) else 0
+        new_trades = self._find_trades_for_stoploss_range(
+            analyzed.iloc[offset:].reset_index(drop=True), pair, self._stoploss_range,
+            start_indexes - offset)
+        new_trades[['open_index', 'close_index']] += offset
+
+        # Update the statistics: roll out expired trades, add the new ones
+        stats = self._expectancy.setdefault(pair, {})
+        expired_before = np.datetime64(window_start.replace(tzinfo=None), 'ns')
+        for stoploss_stats in stats.values():
+            stoploss_stats.expire(expired_before)
+        if not new_trades.empty:
+            self._add_trades(stats, self._fill_calculable_fields(new_trades.copy()))
+
+        self._candles[pair] = ohlcv
+        self._analyzed[pair] = analyzed
+        self._trades[pair] = concat([frame for frame in (trades, new_trades) if not frame.empty]
+                                    or [new_trades], ignore_index=True)
+
+    def _find_trades(self, analyzed: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        Find the trades of all pairs for the stoploss range.
+        With more than one job configured, pairs are spread across worker processes.
+        :param analyzed: Dataframes with buy and sell signals, by pair
+        :return: DataFrames with the trades, by pair
+        """
+        # Workers are forked after the signals are populated, so they inherit the
+        # dataframes (copy-on-write). Only the trades are pickled back.
+        results = fork_map(
+            lambda pair: self._find_trades_for_stoploss_range(analyzed[pair], pair,
+                                                              self._stoploss_range),
+            list(analyzed), self.edge_config.get('jobs', 1), 'Edge calculation')
+        return dict(zip(analyzed, results))
+
     def stake_amount(self, pair: str, free_capital: float,
                      total_capital: float, capital_in_trade: float) -> float:
         stoploss = self.stoploss(pair)
@@ -271,184 +433,164 @@ class Edge:
         """
         This calculates WinRate, Required Risk Reward, Risk Reward and Expectancy of all pairs
         The calulation will be done per pair and per strategy.
+        Statistics are kept per pair and stoploss, to be updated trade by trade afterwards.
+        :return: Statistics of the stoploss with the highest expectancy, by pair
+        """
+        self._expectancy = {}
+        for pair, pair_results in results.groupby('pair', sort=False):
+            self._add_trades(self._expectancy.setdefault(pair, {}), pair_results)
+        return self._select_pairs()
+
+    def _add_trades(self, stats: Dict[float, RunningExpectancy], results: DataFrame) -> None:
+        """
+        Add trades of one pair to the statistics of their stoploss
+        :param stats: Statistics of the pair, by stoploss
+        :param results: Trades, with calculable fields filled
+        """
+        for stoploss, stoploss_results in results.groupby('stoploss', sort=False):
+            if stoploss not in stats:
+                stats[stoploss] = RunningExpectancy(
+                    min_trade_number=self.edge_config.get('min_trade_number', 10),
+                    max_trade_duration=self.edge_config.get('max_trade_duration_minute', 1440),
+                    remove_pumps=self.edge_config.get('remove_pumps', False),
+                )
+            stats[stoploss].add_trades(stoploss_results['open_time'].values,
+                                       stoploss_results['profit_abs'].values.astype(np.float64),
+                                       stoploss_results['trade_duration'].values.astype(np.int64))
+
+    def _select_pairs(self) -> Dict[str, PairInfo]:
         """
-        # Removing pairs having less than min_trades_number
-        min_trades_number = self.edge_config.get('min_trade_number', 10)
-        results = results.groupby(['pair', 'stoploss']).filter(lambda x: len(x) > min_trades_number)
-        ###################################
-
-        # Removing outliers (Only Pumps) from the dataset
-        # The method to detect outliers is to calculate standard deviation
-        # Then every value more than (standard deviation + 2*average) is out (pump)
-        #
-        # Removing Pumps
-        if self.edge_config.get('remove_pumps', False):
-            results = results.groupby(['pair', 'stoploss']).apply(
-                lambda x: x[x['profit_abs'] < 2 * x['profit_abs'].std() + x['profit_abs'].mean()])
-        ##########################################################################
-
-        # Removing trades having a duration more than X minutes (set in config)
-        max_trade_duration = self.edge_config.get('max_trade_duration_minute', 1440)
-        results = results[results.trade_duration < max_trade_duration]
-        #######################################################################
-
-        if results.empty:
-            return {}
-
-        groupby_aggregator = {
-            'profit_abs': [
-                ('nb_trades', 'count'),  # number of all trades
-                ('profit_sum', lambda x: x[x > 0].sum()),  # cumulative profit of all winning trades
-                ('loss_sum', lambda x: abs(x[x < 0].sum())),  # cumulative loss of all losing trades
-                ('nb_win_trades', lambda x: x[x > 0].count())  # number of winning trades
-            ],
-            'trade_duration': [('avg_trade_duration', 'mean')]
-        }
-
-        # Group by (pair and stoploss) by applying above aggregator
-        df = results.groupby(['pair', 'stoploss'])[['profit_abs', 'trade_duration']].agg(
-            groupby_aggregator).reset_index(col_level=1)
-
-        # Dropping level 0 as we don't need it
-        df.columns = df.columns.droplevel(0)
-
-        # Calculating number of losing trades, average win and average loss
-        df['nb_loss_trades'] = df['nb_trades'] - df['nb_win_trades']
-        df['average_win'] = df['profit_sum'] / df['nb_win_trades']
-        df['average_loss'] = df['loss_sum'] / df['nb_loss_trades']
-
-        # Win rate = number of profitable trades / number of trades
-        df['winrate'] = df['nb_win_trades'] / df['nb_trades']
-
-        # risk_reward_ratio = average win / average loss
-        df['risk_reward_ratio'] = df['average_win'] / df['average_loss']
-
-        # required_risk_reward = (1 / winrate) - 1
-        df['required_risk_reward'] = (1 / df['winrate']) - 1
-
-        # expectancy = (risk_reward_ratio * winrate) - (lossrate)
-        df['expectancy'] = (df['risk_reward_ratio'] * df['winrate']) - (1 - df['winrate'])
-
-        # sort by expectancy and stoploss
-        df = df.sort_values(by=['expectancy', 'stoploss'], ascending=False).groupby(
-            'pair').first().sort_values(by=['expectancy'], ascending=False).reset_index()
+        Pick the stoploss with the highest expectancy for each pair (the highest stoploss
+        on equal expectancy), from the current statistics.
+        :return: Statistics of the selected stoploss by pair, in order of expectancy
+        """
+        def order(info: PairInfo):
+            # Highest expectancy first, unknown (nan) expectancy last
+            return (not np.isnan(info.expectancy),
+                    0 if np.isnan(info.expectancy) else info.expectancy, info.stoploss)
 
         final = {}
-        for x in df.itertuples():
-            final[x.pair] = PairInfo(
-                x.stoploss,
-                x.winrate,
-                x.risk_reward_ratio,
-                x.required_risk_reward,
-                x.expectancy,
-                x.nb_trades,
-                x.avg_trade_duration
-            )
+        for pair, stats in self._expectancy.items():
+            infos = [info for info in (stoploss_stats.pair_info(stoploss)
+                                       for stoploss, stoploss_stats in stats.items()) if info]
+            if infos:
+                final[pair] = max(infos, key=order)
 
         # Returning a list of pairs in order of "expectancy"
-        return final
-
-    def _find_trades_for_stoploss_range(self, df, pair, stoploss_range):
-        buy_column = df['buy'].values
-        sell_column = df['sell'].values
-        date_column = df['date'].values
-        ohlc_columns = df[['open', 'high', 'low', 'close']].values
-
-        result: list = []
-        for stoploss in stoploss_range:
-            result += self._detect_next_stop_or_sell_point(
-                buy_column, sell_column, date_column, ohlc_columns, round(stoploss, 6), pair
-            )
+        return dict(sorted(final.items(), key=lambda item: order(item[1])[:2], reverse=True))
 
-        return result
-
-    def _detect_next_stop_or_sell_point(self, buy_column, sell_column, date_column,
-                                        ohlc_columns, stoploss, pair):
+    def _find_trades_for_stoploss_range(self, df: DataFrame, pair: str, stoploss_range,
+                                        start_indexes: Optional[np.ndarray] = None
+                                        ) -> DataFrame:
         """
-        Iterate through ohlc_columns in order to find the next trade
-        Next trade opens from the first buy signal noticed to
-        The sell or stoploss signal after it.
-        It then cuts OHLC, buy_column, sell_column and date_column.
-        Cut from (the exit trade index) + 1.
-
-        Author: https://github.com/mishaker
+        Find the trades of one pair for every stoploss of the range.
+        A trade opens on the candle after the first buy signal, and closes when the stoploss
+        or the sell signal (on the next candle) is hit, whatever comes first. The next trade
+        is searched from the exit candle on. Open trades at the end of the data are ignored.
+
+        Exits of a trade opening on any candle are searched for all stoplosses at once,
+        as one 2-D (stoplosses x entry candles) problem. Only following the trades from
+        one exit to the next entry is done in steps, for all stoplosses together.
+        :param start_indexes: Candle to search the trades of each stoploss from,
+            defaults to the first candle
+        :return: DataFrame with one row per trade, ordered by stoploss and open time
         """
-
-        result: list = []
-        start_point = 0
-
+        stoplosses = np.array([round(stoploss, 6) for stoploss in stoploss_range],
+                              dtype=np.float64)
+        buy_column = df['buy'].values == 1
+        sell_column = df['sell'].values == 1
+        date_column = df['date'].values
+        open_column = df['open'].values.astype(np.float64)
+        # NaN lows never hit the stoploss
+        low_column = np.nan_to_num(df['low'].values.astype(np.float64), nan=np.inf)
+        length = len(df)
+
+        # Candles on which trades open: the candle after each buy signal
+        entries = np.flatnonzero(buy_column[:-1]) + 1
+        if len(stoplosses) == 0 or len(entries) == 0:
+            return DataFrame(columns=TRADE_COLUMNS)
+
+        # Exit of a trade opening on each entry candle, for each stoploss (stoplosses x entries)
+        stop_prices = open_column[entries] * (stoplosses[:, None] + 1)
+        stop_indexes = _first_below(low_column, np.broadcast_to(entries, stop_prices.shape),
+                                    stop_prices)
+        sell_indexes = _next_signal(sell_column)[entries]
+        stop_hit = (stop_indexes <= sell_indexes) & (stop_indexes < length)
+        # If exit is SELL then we exit at the next candle
+        exit_indexes = np.where(stop_hit, stop_indexes, sell_indexes + 1)
+        # Neither stoploss nor sell (or no candle after the sell signal): the trade remains
+        # open, it is not interesting for Edge and ends the search for this stoploss.
+        closed = stop_hit | (sell_indexes + 1 < length)
+
+        # Following trade: opens after the first buy signal from the exit candle on
+        next_buy = np.append(_next_signal(buy_column), length)
+        entry_position = np.full(length + 2, -1, dtype=np.int64)
+        entry_position[entries] = np.arange(len(entries))
+        following = entry_position[next_buy[np.minimum(exit_indexes, length)] + 1]
+
+        # Follow the trades of all stoplosses together, one trade per stoploss and step
+        rows = np.arange(len(stoplosses))
+        if start_indexes is None:
+            start_indexes = np.zeros(len(stoplosses), dtype=np.int64)
+        current = entry_position[next_buy[start_indexes] + 1]
+        steps: List[np.ndarray] = []
         while True:
-            open_trade_index = utf1st.find_1st(buy_column, 1, utf1st.cmp_equal)
-
-            # Return empty if we don't find trade entry (i.e. buy==1) or
-            # we find a buy but at the end of array
-            if open_trade_index == -1 or open_trade_index == len(buy_column) - 1:
-                break
-            else:
-                # When a buy signal is seen,
-                # trade opens in reality on the next candle
-                open_trade_index += 1
-
-            open_price = ohlc_columns[open_trade_index, 0]
-            stop_price = (open_price * (stoploss + 1))
-
-            # Searching for the index where stoploss is hit
-            stop_index = utf1st.find_1st(
-                ohlc_columns[open_trade_index:, 2], stop_price, utf1st.cmp_smaller)
-
-            # If we don't find it then we assume stop_index will be far in future (infinite number)
-            if stop_index == -1:
-                stop_index = float('inf')
-
-            # Searching for the index where sell is hit
-            sell_index = utf1st.find_1st(sell_column[open_trade_index:], 1, utf1st.cmp_equal)
-
-            # If we don't find it then we assume sell_index will be far in future (infinite number)
-            if sell_index == -1:
-                sell_index = float('inf')
-
-            # Check if we don't find any stop or sell point (in that case trade remains open)
-            # It is not interesting for Edge to consider it so we simply ignore the trade
-            # And stop iterating there is no more entry
-            if stop_index == sell_index == float('inf'):
+            active = current >= 0
+            current[~active] = 0
+            active &= closed[rows, current]
+            if not active.any():
                 break
+            steps.append(np.where(active, current, -1))
+            current = np.where(active, following[rows, current], -1)
+
+        # Trades per stoploss in time order: (stoplosses x steps), flattened row by row
+        trade_entries = np.array(steps, dtype=np.int64).reshape(len(steps), len(stoplosses)).T
+        stoploss_index, step_index = np.nonzero(trade_entries >= 0)
+        trade_entries = trade_entries[stoploss_index, step_index]
+        open_indexes = entries[trade_entries]
+        close_indexes = exit_indexes[stoploss_index, trade_entries]
+        is_stop = stop_hit[stoploss_index, trade_entries]
+        close_rates = np.where(is_stop, stop_prices[stoploss_index, trade_entries],
+                               open_column[close_indexes])
+
+        return DataFrame({
+            'pair': pair,
+            'stoploss': stoplosses[stoploss_index],
+            'open_time': date_column[open_indexes],
+            'close_time': date_column[close_indexes],
+            'open_index': open_indexes,
+            'close_index': close_indexes,
+            'open_rate': np.round(open_column[open_indexes], 15),
+            'close_rate': np.round(close_rates, 15),
+            'exit_type': np.array([SellType.SELL_SIGNAL, SellType.STOP_LOSS])[is_stop.astype(int)],
+        }, columns=TRADE_COLUMNS)
+
+
+def _next_signal(signal: np.ndarray) -> np.ndarray:
+    """
+    Index of the first candle with signal at or after each candle, len(signal) if there is none
+    """
+    indexes = np.where(signal, np.arange(len(signal)), len(signal))
+    return np.minimum.accumulate(indexes[::-1])[::-1]
 
-            if stop_index <= sell_index:
-                exit_index = open_trade_index + stop_index
-                exit_type = SellType.STOP_LOSS
-                exit_price = stop_price
-            elif stop_index > sell_index:
-                # If exit is SELL then we exit at the next candle
-                exit_index = open_trade_index + sell_index + 1
-
-                # Check if we have the next candle
-                if len(ohlc_columns) - 1 < exit_index:
-                    break
-
-                exit_type = SellType.SELL_SIGNAL
-                exit_price = ohlc_columns[exit_index, 0]
-
-            trade = {'pair': pair,
-                     'stoploss': stoploss,
-                     'profit_ratio': '',
-                     'profit_abs': '',
-                     'open_time': date_column[open_trade_index],
-                     'close_time': date_column[exit_index],
-                     'open_index': start_point + open_trade_index,
-                     'close_index': start_point + exit_index,
-                     'trade_duration': '',
-                     'open_rate': round(open_price, 15),
-                     'close_rate': round(exit_price, 15),
-                     'exit_type': exit_type
-                     }
-
-            result.append(trade)
-
-            # Giving a view of exit_index till the end of array
-            buy_column = buy_column[exit_index:]
-            sell_column = sell_column[exit_index:]
-            date_column = date_column[exit_index:]
-            ohlc_columns = ohlc_columns[exit_index:]
-            start_point += exit_index
 
-        return result
+def _first_below(values: np.ndarray, starts: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """
+    Index of the first value smaller than the threshold, at or after the start index,
+    for arrays of starts and thresholds. len(values) where no value is smaller.
+    Uses a table of the minimum of each power-of-two long block of values, so each search
+    takes log2(len(values)) vectorized steps.
+    """
+    length = len(values)
+    blocks = [values]
+    size = 1
+    while 2 * size <= length:
+        # Minimum of the blocks twice as long as the ones of the previous level
+        blocks.append(np.minimum(blocks[-1][:-size], blocks[-1][size:]))
+        size *= 2
+    positions = np.array(starts, dtype=np.int64)
+    for level in range(len(blocks) - 1, -1, -1):
+        size = 2 ** level
+        block_minimum = blocks[level][np.minimum(positions, length - size)]
+        positions += size * ((positions <= length - size) & (block_minimum >= thresholds))
+    return positions
@@ -0,0 +1,145 @@
+"""
+Running win rate, risk reward ratio and expectancy statistics for Edge
+"""
+from collections import deque
+from typing import Deque, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class PairInfo(NamedTuple):
+    stoploss: float
+    winrate: float
+    risk_reward_ratio: float
+    required_risk_reward: float
+    expectancy: float
+    nb_trades: int
+    avg_trade_duration: float
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """
+    Division as in pandas: x / 0 is inf and 0 / 0 is nan
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(np.float64(numerator) / np.float64(denominator))
+
+
+class RunningExpectancy:
+    """
+    Statistics of the trades of one pair with one stoploss, kept as running counts and sums.
+    Trades are added in the order they opened and expire in the same order, so adding or
+    expiring a trade takes constant time, and so does reading the statistics.
+
+    As Edge._process_expectancy() always did, only trades shorter than max_trade_duration
+    are counted, and statistics are only available with more than min_trade_number trades
+    (including the longer ones). remove_pumps excludes trades with a profit more than
+    two standard deviations above the average: statistics are then calculated from all
+    trades, as the threshold changes with every trade.
+    """
+
+    def __init__(self, min_trade_number: int = 10, max_trade_duration: float = 1440,
+                 remove_pumps: bool = False) -> None:
+        self.min_trade_number = min_trade_number
+        self.max_trade_duration = max_trade_duration
+        self.remove_pumps = remove_pumps
+        # (open time, absolute profit, duration in minutes) of all trades, in open order
+        self._trades: Deque[Tuple[np.datetime64, float, int]] = deque()
+        # Counts and sums of the trades shorter than max_trade_duration
+        self.nb_trades = 0
+        self.nb_win_trades = 0
+        self.nb_lost_trades = 0
+        self.profit_sum = 0.0
+        self.loss_sum = 0.0
+        self.duration_sum = 0
+
+    @property
+    def nb_all_trades(self) -> int:
+        return len(self._trades)
+
+    def add(self, open_time: np.datetime64, profit_abs: float, trade_duration: int) -> None:
+        """
+        Add a trade. Trades have to be added in the order they opened.
+        """
+        self._trades.append((open_time, profit_abs, trade_duration))
+        self._count(profit_abs, trade_duration, 1)
+
+    def add_trades(self, open_times: np.ndarray, profits_abs: np.ndarray,
+                   trade_durations: np.ndarray) -> None:
+        """
+        Add trades, ordered by open time, with vectorized sums
+        """
+        self._trades.extend(zip(open_times, profits_abs.tolist(), trade_durations.tolist()))
+        counted = trade_durations < self.max_trade_duration
+        profits_abs = profits_abs[counted]
+        self.nb_trades += int(counted.sum())
+        self.nb_win_trades += int((profits_abs > 0).sum())
+        self.nb_lost_trades += int((profits_abs < 0).sum())
+        self.profit_sum += float(profits_abs[profits_abs > 0].sum())
+        self.loss_sum -= float(profits_abs[profits_abs < 0].sum())
+        self.duration_sum += int(trade_durations[counted].sum())
+
+    def expire(self, before: np.datetime64) -> None:
+        """
+        Remove the trades opened before the given time
+        """
+        while self._trades and self._trades[0][0] < before:
+            _, profit_abs, trade_duration = self._trades.popleft()
+            self._count(profit_abs, trade_duration, -1)
+
+    def _count(self, profit_abs: float, trade_duration: int, sign: int) -> None:
+        if trade_duration >= self.max_trade_duration:
+            return
+        self.nb_trades += sign
+        self.duration_sum += sign * trade_duration
+        if profit_abs > 0:
+            self.nb_win_trades += sign
+            # Reset the sum with the count, so no rounding error of removed trades remains
+            self.profit_sum = self.profit_sum + sign * profit_abs if self.nb_win_trades else 0.0
+        elif profit_abs < 0:
+            self.nb_lost_trades += sign
+            self.loss_sum = self.loss_sum - sign * profit_abs if self.nb_lost_trades else 0.0
+
+    def _pumps_removed(self) -> Tuple[int, int, float, float, int]:
+        """
+        Counts and sums of the trades, without pumps and trades longer than max_trade_duration
+        """
+        _, profits_abs, trade_durations = (np.array(column) for column in zip(*self._trades))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            threshold = 2 * np.std(profits_abs, ddof=1) + np.mean(profits_abs)
+        counted = (profits_abs < threshold) & (trade_durations < self.max_trade_duration)
+        profits_abs = profits_abs[counted]
+        return (int(counted.sum()), int((profits_abs > 0).sum()),
+                float(profits_abs[profits_abs > 0].sum()),
+                float(-profits_abs[profits_abs < 0].sum()),
+                int(trade_durations[counted].sum()))
+
+    def pair_info(self, stoploss: float) -> Optional[PairInfo]:
+        """
+        Current statistics.
+        :return: None without more than min_trade_number trades, or without trade counted
+        """
+        if self.nb_all_trades <= self.min_trade_number:
+            return None
+        if self.remove_pumps:
+            nb_trades, nb_win_trades, profit_sum, loss_sum, duration_sum = self._pumps_removed()
+        else:
+            nb_trades, nb_win_trades, profit_sum, loss_sum, duration_sum = (
+                self.nb_trades, self.nb_win_trades, self.profit_sum, self.loss_sum,
+                self.duration_sum)
+        if nb_trades == 0:
+            return None
+
+        average_win = _divide(profit_sum, nb_win_trades)
+        average_loss = _divide(loss_sum, nb_trades - nb_win_trades)
+        # Win rate = number of profitable trades / number of trades
+        winrate = nb_win_trades / nb_trades
+        # risk_reward_ratio = average win / average loss
+        risk_reward_ratio = _divide(average_win, average_loss)
+        # required_risk_reward = (1 / winrate) - 1
+        required_risk_reward = _divide(1, winrate) - 1
+        # expectancy = (risk_reward_ratio * winrate) - (lossrate)
+        expectancy = (risk_reward_ratio * winrate) - (1 - winrate)
+
+        return PairInfo(stoploss, winrate, risk_reward_ratio, required_risk_reward, expectancy,
+                        nb_trades, duration_sum / nb_trades)
@@ -3,10 +3,11 @@ Various tool function for Freqtrade and scripts
 """
 import gzip
 import logging
+import multiprocessing
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Dict, List, Sequence
 from typing.io import IO
 
 import numpy as np
@@ -175,3 +176,43 @@ def render_template_with_fallback(templatefile: str, templatefallbackfile: str,
         return render_template(templatefile, arguments)
     except TemplateNotFound:
         return render_template(templatefallbackfile, arguments)
+
+
+# State shared with forked worker processes of fork_map(). Set right before the workers
+# are forked, so it is inherited instead of pickled.
+_fork_state: Dict[str, Any] = {}
+
+
+def _fork_map_worker(item: Any) -> Any:
+    return _fork_state['function'](item)
+
+
+def fork_map(function: Callable[[Any], Any], items: Sequence, jobs: int,
+             description: str) -> List[Any]:
+    """
+    Map function over items, in up to `jobs` forked worker processes.
+    Workers inherit the function and everything it references (e.g. loaded data)
+    copy-on-write, so only the items and the results are pickled.
+    Maps in this process with one job, or if the 'fork' start method is not available.
+    :param function: Function to call with each item
+    :param items: Items to map
+    :param jobs: Maximum number of worker processes
+    :param description: What is calculated, for log messages (e.g. "backtesting")
+    :return: List with the results, in the order of items
+    """
+    jobs = min(jobs, len(items))
+    if jobs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        logger.warning(f"Parallel {description} requires the 'fork' start method, "
+                       "which is not available on this platform. "
+                       "Calculating one after another.")
+        jobs = 1
+    if jobs <= 1:
+        return [function(item) for item in items]
+
+    logger.info(f"Running {description} of {len(items)} items using {jobs} worker processes")
+    _fork_state['function'] = function
+    try:
+        with multiprocessing.get_context('fork').Pool(processes=jobs) as pool:
+            return pool.map(_fork_map_worker, items)
+    finally:
+        _fork_state.clear()
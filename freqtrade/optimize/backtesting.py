@@ -4,12 +4,14 @@
 This module contains the backtesting logic
 """
 import logging
+import time
 from copy import deepcopy
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 import arrow
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, Series, Timestamp, to_datetime
 
 from freqtrade.configuration import (TimeRange, remove_credentials,
                                      validate_config_consistency)
@@ -18,10 +20,12 @@ from freqtrade.data.converter import trim_dataframe
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
+from freqtrade.misc import fork_map
 from freqtrade.optimize.optimize_reports import (show_backtest_results,
-                                                 store_backtest_result)
+                                                 store_backtest_result,
+                                                 store_backtest_result_parquet)
 from freqtrade.pairlist.pairlistmanager import PairListManager
-from freqtrade.persistence import Trade
+from freqtrade.persistence import BacktestTrade
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
 from freqtrade.state import RunMode
 from freqtrade.strategy.interface import IStrategy, SellCheckTuple, SellType
@@ -47,6 +51,60 @@ class BacktestResult(NamedTuple):
     sell_reason: SellType
 
 
+class BacktestArrays(NamedTuple):
+    """
+    NamedTuple holding the contiguous candle columns of one pair,
+    as used by the columnar backtest engine.
+    """
+    date: np.ndarray  # int64, nanoseconds since epoch
+    df_index: np.ndarray  # index of the candle in the analyzed dataframe
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    buy: np.ndarray  # bool
+    sell: np.ndarray  # bool
+    enter: np.ndarray  # bool - buy signal without a sell signal on the same candle
+    candle_pos: np.ndarray  # position of the candle date in the open trade counter
+
+
+def _dates_to_ns(dates: Series) -> np.ndarray:
+    """
+    Convert a column of candle dates to int64 nanoseconds since epoch (UTC).
+    """
+    values = dates.values
+    if values.dtype != 'datetime64[ns]':
+        values = to_datetime(dates, utc=True).values
+    return values.astype(np.int64)
+
+
+def _get_candle_positions(dates: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Map the candle dates of all pairs to their position in the sorted union of all dates.
+    Used to index the open trade counter (trade_count_lock) by integer instead of by date.
+    :param dates: Dict of int64 candle dates per pair
+    :return: Dict of candle positions per pair
+    """
+    if not dates:
+        return {}
+    all_dates = np.unique(np.concatenate(list(dates.values())))
+    return {pair: np.searchsorted(all_dates, pair_dates) for pair, pair_dates in dates.items()}
+
+
+def _get_data_key(processed: Dict[str, DataFrame]) -> Tuple:
+    """
+    Identify processed data by its pairs and their candle ranges.
+    """
+    return tuple((pair, len(df), df['date'].iloc[0], df['date'].iloc[-1]) if len(df) else (pair, )
+                 for pair, df in processed.items())
+
+
+def _ns_to_datetime(timestamp: int) -> datetime:
+    """
+    Convert a candle timestamp (nanoseconds since epoch) to a timezone aware datetime.
+    """
+    return datetime.fromtimestamp(timestamp // 1_000_000_000, tz=timezone.utc)
+
+
 class Backtesting:
     """
     Backtesting class, this class contains all the logic to run a backtest
@@ -79,7 +137,7 @@ class Backtesting:
             self.fee = self.exchange.get_fee(symbol=self.pairlists.whitelist[0])
 
         if self.config.get('runmode') != RunMode.HYPEROPT:
-            self.dataprovider = DataProvider(self.config, self.exchange)
+            self.dataprovider = DataProvider(self.config, self.exchange, self.pairlists)
             IStrategy.dp = self.dataprovider
 
         if self.config.get('strategy_list', None):
@@ -99,6 +157,17 @@ class Backtesting:
                                        "configuration or as cli argument `--ticker-interval 5m`")
         self.timeframe = str(self.config.get('ticker_interval'))
         self.timeframe_min = timeframe_to_minutes(self.timeframe)
+        self.backtest_engine = self.config.get('backtest_engine', 'classic')
+        # Analyzed signals, reused by all backtests of the same data while buy / sell
+        # signals don't change (e.g. hyperopt without buy and sell spaces). None disables it.
+        self.signal_cache: Optional[Dict[Tuple, Dict]] = None
+        # Function returning the buy and sell signals of one pair as arrays, one value per
+        # candle (e.g. hyperopt conditions evaluated on NumPy arrays). None uses advise_buy /
+        # advise_sell on the dataframe.
+        self.signal_generator: Optional[
+            Callable[[str, DataFrame], Tuple[np.ndarray, np.ndarray]]] = None
+        # Seconds spent analyzing signals by all backtests of this instance
+        self.signals_time = 0.0
 
         # Get maximum required startup period
         self.required_startup = max([strat.startup_candle_count for strat in self.strategylist])
@@ -139,38 +208,126 @@ class Backtesting:
         timerange.adjust_start_if_necessary(timeframe_to_seconds(self.timeframe),
                                             self.required_startup, min_date)
 
+        if self.config.get('runmode') != RunMode.HYPEROPT:
+            # Load informative pairs of all strategies once, instead of on every access
+            informative_pairs = {pair_tf for strat in self.strategylist
+                                 for pair_tf in strat.informative_pairs()}
+            if informative_pairs:
+                logger.info('Loading %s informative pairs ..', len(informative_pairs))
+                self.dataprovider.preload_historic_ohlcv(sorted(informative_pairs))
+
         return data, timerange
 
-    def _get_ohlcv_as_lists(self, processed: Dict) -> Dict[str, DataFrame]:
+    def _get_generated_signals(self, pair: str,
+                               pair_data: DataFrame) -> Tuple[DataFrame, np.ndarray, np.ndarray]:
         """
-        Helper function to convert a processed dataframes into lists for performance reasons.
+        Get buy / sell signals for one pair from signal_generator, shifted to the candle
+        they act on like in _get_analyzed_signals() - without copying the dataframe.
+        :return: candles from the second one on (a view of pair_data), buy and sell signals
+        """
+        buy, sell = self.signal_generator(pair, pair_data)  # type: ignore
+        return pair_data.iloc[1:], buy[:-1], sell[:-1]
 
-        Used by backtest() - so keep this optimized for performance.
+    def _get_analyzed_signals(self, pair: str, pair_data: DataFrame) -> DataFrame:
+        """
+        Populate buy / sell signals for one pair and shift them to the candle they act on.
         """
         headers = ['date', 'buy', 'open', 'close', 'sell', 'low', 'high']
-        data: Dict = {}
-        # Create dict with data
-        for pair, pair_data in processed.items():
-            pair_data.loc[:, 'buy'] = 0  # cleanup from previous run
-            pair_data.loc[:, 'sell'] = 0  # cleanup from previous run
 
-            df_analyzed = self.strategy.advise_sell(
-                self.strategy.advise_buy(pair_data, {'pair': pair}), {'pair': pair})[headers].copy()
+        if self.signal_generator is not None:
+            candles, buy, sell = self._get_generated_signals(pair, pair_data)
+            df_analyzed = candles[['date', 'open', 'close', 'low', 'high']]
+            df_analyzed.insert(headers.index('buy'), 'buy', buy)
+            df_analyzed.insert(headers.index('sell'), 'sell', sell)
+            return df_analyzed
+
+        pair_data.loc[:, 'buy'] = 0  # cleanup from previous run
+        pair_data.loc[:, 'sell'] = 0  # cleanup from previous run
+
+        df_analyzed = self.strategy.advise_sell(
+            self.strategy.advise_buy(pair_data, {'pair': pair}), {'pair': pair})[headers].copy()
+
+        # To avoid using data from future, we use buy/sell signals shifted
+        # from the previous candle
+        df_analyzed.loc[:, 'buy'] = df_analyzed.loc[:, 'buy'].shift(1)
+        df_analyzed.loc[:, 'sell'] = df_analyzed.loc[:, 'sell'].shift(1)
 
-            # To avoid using data from future, we use buy/sell signals shifted
-            # from the previous candle
-            df_analyzed.loc[:, 'buy'] = df_analyzed.loc[:, 'buy'].shift(1)
-            df_analyzed.loc[:, 'sell'] = df_analyzed.loc[:, 'sell'].shift(1)
+        df_analyzed.drop(df_analyzed.head(1).index, inplace=True)
+        return df_analyzed
+
+    def _get_signals(self, processed: Dict, convert: Callable[[Dict], Dict]) -> Dict:
+        """
+        Analyze processed data with convert (_get_ohlcv_as_lists or _get_ohlcv_as_arrays),
+        or reuse the result from the signal cache if enabled.
+        """
+        start = time.perf_counter()
+        if self.signal_cache is None:
+            data = convert(processed)
+        else:
+            key = (convert.__name__, _get_data_key(processed))
+            if key not in self.signal_cache:
+                self.signal_cache[key] = convert(processed)
+            data = self.signal_cache[key]
+        self.signals_time += time.perf_counter() - start
+        return data
+
+    def _get_ohlcv_as_lists(self, processed: Dict) -> Dict[str, DataFrame]:
+        """
+        Helper function to convert a processed dataframes into lists for performance reasons.
+        Each row gets a `candle_pos` column, its index in the open trade counter.
 
-            df_analyzed.drop(df_analyzed.head(1).index, inplace=True)
+        Used by backtest() - so keep this optimized for performance.
+        """
+        analyzed = {pair: self._get_analyzed_signals(pair, pair_data)
+                    for pair, pair_data in processed.items()}
+        candle_pos = _get_candle_positions(
+            {pair: _dates_to_ns(df['date']) for pair, df in analyzed.items()})
 
+        data: Dict = {}
+        # Create dict with data
+        for pair, df_analyzed in analyzed.items():
+            df_analyzed['candle_pos'] = candle_pos[pair]
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
             data[pair] = [x for x in df_analyzed.itertuples()]
         return data
 
-    def _get_close_rate(self, sell_row, trade: Trade, sell: SellCheckTuple,
-                        trade_dur: int) -> float:
+    def _get_ohlcv_as_arrays(self, processed: Dict) -> Dict[str, BacktestArrays]:
+        """
+        Helper function to convert processed dataframes into contiguous column arrays.
+
+        Used by the columnar backtest engine - so keep this optimized for performance.
+        """
+        analyzed = {}
+        for pair, pair_data in processed.items():
+            if self.signal_generator is not None:
+                analyzed[pair] = self._get_generated_signals(pair, pair_data)
+            else:
+                df_analyzed = self._get_analyzed_signals(pair, pair_data)
+                analyzed[pair] = (df_analyzed, df_analyzed['buy'].values,
+                                  df_analyzed['sell'].values)
+        dates = {pair: _dates_to_ns(df['date']) for pair, (df, _, _) in analyzed.items()}
+        candle_pos = _get_candle_positions(dates)
+
+        data: Dict[str, BacktestArrays] = {}
+        for pair, (df_analyzed, buy, sell) in analyzed.items():
+            data[pair] = BacktestArrays(
+                date=dates[pair],
+                df_index=df_analyzed.index.values,
+                open=np.ascontiguousarray(df_analyzed['open'].values, dtype=np.float64),
+                high=np.ascontiguousarray(df_analyzed['high'].values, dtype=np.float64),
+                low=np.ascontiguousarray(df_analyzed['low'].values, dtype=np.float64),
+                # Signals are evaluated by truthiness in should_sell()
+                buy=buy != 0,
+                sell=sell != 0,
+                # Same entry condition as the classic engine (buy != 0 and sell != 1)
+                enter=(buy != 0) & (sell != 1),
+                candle_pos=candle_pos[pair],
+            )
+        return data
+
+    def _get_close_rate(self, row_open: float, row_low: float, trade: BacktestTrade,
+                        sell: SellCheckTuple, trade_dur: int) -> float:
         """
         Get close rate for backtesting result
         """
@@ -185,7 +342,7 @@ class Backtesting:
                     # When forceselling with ROI=-1, the roi time will always be equal to trade_dur.
                     # If that entry is a multiple of the timeframe (so on candle open)
                     # - we'll use open instead of close
-                    return sell_row.open
+                    return row_open
 
                 # - (Expected abs profit + open_rate + open_fee) / (fee_close -1)
                 close_rate = - (trade.open_rate * roi + trade.open_rate *
@@ -193,28 +350,28 @@ class Backtesting:
 
                 if (trade_dur > 0 and trade_dur == roi_entry
                         and roi_entry % self.timeframe_min == 0
-                        and sell_row.open > close_rate):
+                        and row_open > close_rate):
                     # new ROI entry came into effect.
                     # use Open rate if open_rate > calculated sell rate
-                    return sell_row.open
+                    return row_open
 
                 # Use the maximum between close_rate and low as we
                 # cannot sell outside of a candle.
                 # Applies when a new ROI setting comes in place and the whole candle is above that.
-                return max(close_rate, sell_row.low)
+                return max(close_rate, row_low)
 
             else:
                 # This should not be reached...
-                return sell_row.open
+                return row_open
         else:
-            return sell_row.open
+            return row_open
 
     def _get_sell_trade_entry(
             self, pair: str, buy_row: DataFrame,
-            partial_ohlcv: List, trade_count_lock: Dict,
+            partial_ohlcv: List, trade_count_lock: List[int],
             stake_amount: float, max_open_trades: int) -> Optional[BacktestResult]:
 
-        trade = Trade(
+        trade = BacktestTrade(
             pair=pair,
             open_rate=buy_row.open,
             open_date=buy_row.date,
@@ -229,13 +386,14 @@ class Backtesting:
         for sell_row in partial_ohlcv:
             if max_open_trades > 0:
                 # Increase trade_count_lock for every iteration
-                trade_count_lock[sell_row.date] = trade_count_lock.get(sell_row.date, 0) + 1
+                trade_count_lock[sell_row.candle_pos] += 1
 
             sell = self.strategy.should_sell(trade, sell_row.open, sell_row.date, sell_row.buy,
                                              sell_row.sell, low=sell_row.low, high=sell_row.high)
             if sell.sell_flag:
                 trade_dur = int((sell_row.date - buy_row.date).total_seconds() // 60)
-                closerate = self._get_close_rate(sell_row, trade, sell, trade_dur)
+                closerate = self._get_close_rate(sell_row.open, sell_row.low, trade, sell,
+                                                 trade_dur)
 
                 return BacktestResult(pair=pair,
                                       profit_percent=trade.calc_profit_ratio(rate=closerate),
@@ -274,6 +432,143 @@ class Backtesting:
             return bt_res
         return None
 
+    def _get_exit_roi_table(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the ROI table used by the vectorized exit search as sorted
+        (minutes, roi) arrays.
+        Returns None if exits can't be searched vectorized, which is the case with
+        trailing stoploss (the stoploss depends on the trade's path) or if the strategy
+        overrides the sell logic or the ROI entries.
+        """
+        strategy_cls = type(self.strategy)
+        if (self.strategy.trailing_stop
+                or strategy_cls.should_sell is not IStrategy.should_sell
+                or strategy_cls.stop_loss_reached is not IStrategy.stop_loss_reached
+                or strategy_cls.min_roi_reached is not IStrategy.min_roi_reached
+                or strategy_cls.min_roi_reached_entry is not IStrategy.min_roi_reached_entry):
+            return None
+        roi_minutes = sorted(self.strategy.minimal_roi.keys())
+        return (np.array(roi_minutes, dtype=np.int64),
+                np.array([self.strategy.minimal_roi[m] for m in roi_minutes], dtype=np.float64))
+
+    def _find_exit_candidates(self, pair_data: BacktestArrays, buy_idx: int,
+                              trade: BacktestTrade,
+                              roi_table: Tuple[np.ndarray, np.ndarray]) -> Iterator[int]:
+        """
+        Yields the indexes of candles (from buy_idx onwards) on which the trade may sell,
+        based on stoploss, ROI and sell signal - similar to how Edge detects stops and sells.
+        This is a superset of the real sell candles (ROI is checked with a small tolerance),
+        so every candidate must still be confirmed by strategy.should_sell().
+        All other candles are guaranteed not to sell without trailing stoploss.
+        Searches in growing windows, so short trades don't scan the whole remaining data.
+        """
+        roi_minutes, roi_values = roi_table
+        ask_strategy = self.config.get('ask_strategy', {})
+        use_sell_signal = ask_strategy.get('use_sell_signal', True)
+        stop_loss = None
+        if self.strategy.stoploss is not None:
+            # Same as the initial stoploss set by trade.adjust_stop_loss()
+            stop_loss = float(trade.open_rate * (1 - abs(self.strategy.stoploss)))
+        open_ts = pair_data.date[buy_idx]
+        close_factor = trade.amount * (1 - trade.fee_close) / trade.open_trade_price
+
+        length = len(pair_data.date)
+        start = buy_idx
+        window = 32
+        while start < length:
+            end = min(start + window, length)
+            low = pair_data.low[start:end]
+            high = pair_data.high[start:end]
+            # should_sell() falls back to the open rate for missing low / high
+            candidates = (low == 0) | (high == 0)
+            if stop_loss is not None:
+                candidates |= low <= stop_loss
+            if len(roi_minutes):
+                trade_dur = (pair_data.date[start:end] - open_ts) // 60_000_000_000
+                roi_idx = np.searchsorted(roi_minutes, trade_dur, side='right') - 1
+                roi = np.where(roi_idx >= 0, roi_values[roi_idx], np.inf)
+                candidates |= high * close_factor - 1 > roi - 1e-7
+            if use_sell_signal:
+                candidates |= pair_data.sell[start:end] & ~pair_data.buy[start:end]
+
+            for idx in np.flatnonzero(candidates).tolist():
+                yield start + idx
+            start = end
+            window *= 4
+
+    def _get_sell_trade_entry_columnar(
+            self, pair: str, pair_data: BacktestArrays, buy_idx: int,
+            trade_count_lock: np.ndarray, stake_amount: float, max_open_trades: int,
+            roi_table: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> BacktestResult:
+        """
+        Columnar counterpart of _get_sell_trade_entry().
+        Simulates the trade opened on candle `buy_idx` of `pair_data` until it is sold,
+        or force-sells it on the last candle.
+        :param roi_table: ROI table from _get_exit_roi_table(). If given, only candles
+            found by _find_exit_candidates() are evaluated, otherwise every candle is.
+        """
+        open_rate = float(pair_data.open[buy_idx])
+        open_ts = int(pair_data.date[buy_idx])
+        open_time = _ns_to_datetime(open_ts)
+        trade = BacktestTrade(
+            pair=pair,
+            open_rate=open_rate,
+            open_date=open_time,
+            stake_amount=stake_amount,
+            amount=stake_amount / open_rate,
+            fee_open=self.fee,
+            fee_close=self.fee,
+            is_open=True,
+        )
+        if roi_table is not None:
+            candidates: Iterator[int] = self._find_exit_candidates(pair_data, buy_idx, trade,
+                                                                   roi_table)
+        else:
+            candidates = iter(range(buy_idx, len(pair_data.date)))
+
+        sell = SellCheckTuple(sell_flag=False, sell_type=SellType.FORCE_SELL)
+        # calculate win/lose forwards from buy point
+        for idx in candidates:
+            sell = self.strategy.should_sell(trade, float(pair_data.open[idx]),
+                                             _ns_to_datetime(int(pair_data.date[idx])),
+                                             bool(pair_data.buy[idx]), bool(pair_data.sell[idx]),
+                                             low=float(pair_data.low[idx]),
+                                             high=float(pair_data.high[idx]))
+            if sell.sell_flag:
+                break
+
+        if not sell.sell_flag:
+            idx = len(pair_data.date) - 1
+        sell_ts = int(pair_data.date[idx])
+
+        if max_open_trades > 0:
+            # Increase trade_count_lock for every candle the trade is open
+            trade_count_lock[pair_data.candle_pos[buy_idx:idx + 1]] += 1
+
+        trade_dur = (sell_ts - open_ts) // 60_000_000_000
+        if sell.sell_flag:
+            closerate = self._get_close_rate(float(pair_data.open[idx]),
+                                             float(pair_data.low[idx]),
+                                             trade, sell, trade_dur)
+        else:
+            # no sell condition found - trade stil open at end of backtest period
+            closerate = float(pair_data.open[idx])
+            sell = SellCheckTuple(sell_flag=False, sell_type=SellType.FORCE_SELL)
+
+        return BacktestResult(pair=pair,
+                              profit_percent=trade.calc_profit_ratio(rate=closerate),
+                              profit_abs=trade.calc_profit(rate=closerate),
+                              open_time=open_time,
+                              close_time=_ns_to_datetime(sell_ts),
+                              trade_duration=trade_dur,
+                              open_index=pair_data.df_index[buy_idx],
+                              close_index=pair_data.df_index[idx],
+                              open_at_end=not sell.sell_flag,
+                              open_rate=open_rate,
+                              close_rate=closerate,
+                              sell_reason=sell.sell_type
+                              )
+
     def backtest(self, processed: Dict, stake_amount: float,
                  start_date: arrow.Arrow, end_date: arrow.Arrow,
                  max_open_trades: int = 0, position_stacking: bool = False) -> DataFrame:
@@ -296,12 +591,28 @@ class Backtesting:
                      f"start_date: {start_date}, end_date: {end_date}, "
                      f"max_open_trades: {max_open_trades}, position_stacking: {position_stacking}"
                      )
+        if self.backtest_engine == 'columnar':
+            return self._backtest_columnar(processed, stake_amount, start_date, end_date,
+                                           max_open_trades, position_stacking)
+        return self._backtest_classic(processed, stake_amount, start_date, end_date,
+                                      max_open_trades, position_stacking)
+
+    def _backtest_classic(self, processed: Dict, stake_amount: float,
+                          start_date: arrow.Arrow, end_date: arrow.Arrow,
+                          max_open_trades: int = 0,
+                          position_stacking: bool = False) -> DataFrame:
+        """
+        Classic backtest engine - loops the timerange candle by candle over lists.
+        See `backtest()` for parameter documentation.
+        """
         trades = []
-        trade_count_lock: Dict = {}
 
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
-        data: Dict = self._get_ohlcv_as_lists(processed)
+        data: Dict = self._get_signals(processed, self._get_ohlcv_as_lists)
+        # Number of open trades per candle date, indexed by row.candle_pos
+        trade_count_lock = [0] * (max((rows[-1].candle_pos for rows in data.values() if rows),
+                                      default=-1) + 1)
 
         lock_pair_until: Dict = {}
         # Indexes per pair, so some pairs are allowed to have a missing start.
@@ -338,9 +649,9 @@ class Backtesting:
 
                 if max_open_trades > 0:
                     # Check if max_open_trades has already been reached for the given date
-                    if not trade_count_lock.get(row.date, 0) < max_open_trades:
+                    if not trade_count_lock[row.candle_pos] < max_open_trades:
                         continue
-                    trade_count_lock[row.date] = trade_count_lock.get(row.date, 0) + 1
+                    trade_count_lock[row.candle_pos] += 1
 
                 # since indexes has been incremented before, we need to go one step back to
                 # also check the buying candle for sell conditions.
@@ -361,6 +672,126 @@ class Backtesting:
             tmp += timedelta(minutes=self.timeframe_min)
         return DataFrame.from_records(trades, columns=BacktestResult._fields)
 
+    def _backtest_columnar(self, processed: Dict, stake_amount: float,
+                           start_date: arrow.Arrow, end_date: arrow.Arrow,
+                           max_open_trades: int = 0,
+                           position_stacking: bool = False) -> DataFrame:
+        """
+        Columnar backtest engine, selected with `--backtest-engine columnar`.
+        Works on contiguous per-pair column arrays instead of pandas rows and datetimes,
+        and only visits candles with a buy signal instead of every candle of every pair.
+        Produces the same results as backtest().
+        For parameters see backtest().
+        """
+        trades = []
+
+        data: Dict[str, BacktestArrays] = self._get_signals(processed, self._get_ohlcv_as_arrays)
+        # Number of open trades per candle date, indexed by BacktestArrays.candle_pos
+        trade_count_lock = np.zeros(max((int(pair_data.candle_pos[-1]) + 1
+                                         for pair_data in data.values()
+                                         if len(pair_data.candle_pos)), default=0),
+                                    dtype=np.int64)
+        # Without trailing stoploss, exits are searched vectorized
+        roi_table = self._get_exit_roi_table()
+
+        timeframe_ns = self.timeframe_min * 60_000_000_000
+        start_ns = Timestamp(start_date.datetime).value
+        end_ns = Timestamp(end_date.datetime).value
+        # The clock runs from start_date + 1 candle as long as it's before end_date
+        last_tick = -((start_ns - end_ns) // timeframe_ns) - 1
+
+        # Event-driven clock: instead of looping every candle of every pair,
+        # only candles with a buy signal (candidate entries) are visited,
+        # in the order the candle-by-candle loop would reach them.
+        pairs = list(data.keys())
+        entry_ticks = []
+        entry_pairs = []
+        entry_indexes = []
+        for pair_pos, pair_data in enumerate(data.values()):
+            # Candle offset ("tick") at which the clock reaches each candle of a pair.
+            # A pair advances by at most one candle per tick, and waits until the clock
+            # reaches the candle date - so some pairs are allowed to have a missing start.
+            offsets = -((start_ns - pair_data.date) // timeframe_ns)
+            seq = np.arange(len(offsets))
+            ticks = np.maximum.accumulate(np.maximum(offsets - seq, 1)) + seq
+            # skip rows where no buy signal or that would immediately sell off,
+            # and candles the clock doesn't reach before end_date
+            candidates = np.flatnonzero(pair_data.enter & (ticks <= last_tick))
+            entry_ticks.append(ticks[candidates])
+            entry_pairs.append(np.full(len(candidates), pair_pos))
+            entry_indexes.append(candidates)
+
+        lock_pair_until: Dict[str, int] = {}
+        if entry_ticks:
+            # Sort by tick, and by pair order within the same tick
+            ticks_all = np.concatenate(entry_ticks)
+            pairs_all = np.concatenate(entry_pairs)
+            order = np.lexsort((pairs_all, ticks_all))
+            events = zip(pairs_all[order].tolist(), np.concatenate(entry_indexes)[order].tolist())
+        else:
+            events = zip([], [])
+
+        for pair_pos, idx in events:
+            pair = pairs[pair_pos]
+            pair_data = data[pair]
+            row_ts = int(pair_data.date[idx])
+            candle_pos = int(pair_data.candle_pos[idx])
+            if (not position_stacking and pair in lock_pair_until
+                    and row_ts <= lock_pair_until[pair]):
+                # without positionstacking, we can only have one open trade per pair.
+                continue
+
+            if max_open_trades > 0:
+                # Check if max_open_trades has already been reached for the given date
+                if not trade_count_lock[candle_pos] < max_open_trades:
+                    continue
+                trade_count_lock[candle_pos] += 1
+
+            trade_entry = self._get_sell_trade_entry_columnar(
+                pair, pair_data, idx, trade_count_lock, stake_amount, max_open_trades,
+                roi_table)
+
+            logger.debug(f"{pair} - Locking pair till close_time={trade_entry.close_time}")
+            lock_pair_until[pair] = Timestamp(trade_entry.close_time).value
+            trades.append(trade_entry)
+
+        return DataFrame.from_records(trades, columns=BacktestResult._fields)
+
+    def backtest_strategy(self, strategy: IStrategy, data: Dict[str, DataFrame],
+                          timerange: TimeRange, max_open_trades: int,
+                          position_stacking: bool) -> DataFrame:
+        """
+        Analyze the OHLCV data with the given strategy and backtest it.
+        :param strategy: Strategy to backtest - becomes the active strategy
+        :param data: Dict of OHLCV data, as loaded by load_bt_data(). Not modified.
+        :param timerange: Timerange as returned by load_bt_data()
+        :return: DataFrame with trades (results of backtesting)
+        """
+        logger.info("Running backtesting for Strategy %s", strategy.get_strategy_name())
+        self._set_strategy(strategy)
+
+        # need to reprocess data every time to populate signals
+        preprocessed = self.strategy.ohlcvdata_to_dataframe(data)
+
+        # Trim startup period from analyzed dataframe
+        for pair, df in preprocessed.items():
+            preprocessed[pair] = trim_dataframe(df, timerange)
+        min_date, max_date = history.get_timerange(preprocessed)
+
+        logger.info(
+            'Backtesting with data from %s up to %s (%s days)..',
+            min_date.isoformat(), max_date.isoformat(), (max_date - min_date).days
+        )
+        # Execute backtest
+        return self.backtest(
+            processed=preprocessed,
+            stake_amount=self.config['stake_amount'],
+            start_date=min_date,
+            end_date=max_date,
+            max_open_trades=max_open_trades,
+            position_stacking=position_stacking,
+        )
+
     def start(self) -> None:
         """
         Run backtesting end-to-end
@@ -381,34 +812,18 @@ class Backtesting:
 
         data, timerange = self.load_bt_data()
 
-        all_results = {}
-        for strat in self.strategylist:
-            logger.info("Running backtesting for Strategy %s", strat.get_strategy_name())
-            self._set_strategy(strat)
-
-            # need to reprocess data every time to populate signals
-            preprocessed = self.strategy.ohlcvdata_to_dataframe(data)
-
-            # Trim startup period from analyzed dataframe
-            for pair, df in preprocessed.items():
-                preprocessed[pair] = trim_dataframe(df, timerange)
-            min_date, max_date = history.get_timerange(preprocessed)
-
-            logger.info(
-                'Backtesting with data from %s up to %s (%s days)..',
-                min_date.isoformat(), max_date.isoformat(), (max_date - min_date).days
-            )
-            # Execute backtest and print results
-            all_results[self.strategy.get_strategy_name()] = self.backtest(
-                processed=preprocessed,
-                stake_amount=self.config['stake_amount'],
-                start_date=min_date,
-                end_date=max_date,
-                max_open_trades=max_open_trades,
-                position_stacking=position_stacking,
-            )
-
-        if self.config.get('export', False):
+        # Workers are forked after data is loaded, so they inherit the OHLCV data
+        # (copy-on-write) instead of receiving a pickled copy per strategy.
+        results = fork_map(
+            lambda idx: self.backtest_strategy(self.strategylist[idx], data, timerange,
+                                               max_open_trades, position_stacking),
+            range(len(self.strategylist)), self.config.get('backtest_jobs', 1), 'backtesting')
+        all_results = {strat.get_strategy_name(): result
+                       for strat, result in zip(self.strategylist, results)}
+
+        if self.config.get('export', False) == 'parquet':
+            store_backtest_result_parquet(self.config['exportfilename'], all_results)
+        elif self.config.get('export', False):
             store_backtest_result(self.config['exportfilename'], all_results)
         # Show backtest results
         show_backtest_results(self.config, data, all_results)
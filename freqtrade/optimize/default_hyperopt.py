@@ -1,6 +1,5 @@
 # pragma pylint: disable=missing-docstring, invalid-name, pointless-string-statement
 
-from functools import reduce
 from typing import Any, Callable, Dict, List
 
 import talib.abstract as ta
@@ -8,6 +7,7 @@ from pandas import DataFrame
 from skopt.space import Categorical, Dimension, Integer
 
 import freqtrade.vendor.qtpylib.indicators as qtpylib
+from freqtrade.optimize.hyperopt_conditions import Condition, populate_conditions
 from freqtrade.optimize.hyperopt_interface import IHyperOpt
 
 
@@ -45,6 +45,34 @@ class DefaultHyperOpt(IHyperOpt):
 
         return dataframe
 
+    @staticmethod
+    def buy_conditions(params: Dict[str, Any]) -> List[Condition]:
+        """
+        Define the buy conditions Hyperopt will evaluate, from the buy strategy parameters.
+        """
+        conditions = []
+
+        # GUARDS AND TRENDS
+        if 'mfi-enabled' in params and params['mfi-enabled']:
+            conditions.append(Condition('mfi', '<', params['mfi-value']))
+        if 'fastd-enabled' in params and params['fastd-enabled']:
+            conditions.append(Condition('fastd', '<', params['fastd-value']))
+        if 'adx-enabled' in params and params['adx-enabled']:
+            conditions.append(Condition('adx', '>', params['adx-value']))
+        if 'rsi-enabled' in params and params['rsi-enabled']:
+            conditions.append(Condition('rsi', '<', params['rsi-value']))
+
+        # TRIGGERS
+        if 'trigger' in params:
+            if params['trigger'] == 'bb_lower':
+                conditions.append(Condition('close', '<', 'bb_lowerband'))
+            if params['trigger'] == 'macd_cross_signal':
+                conditions.append(Condition('macd', 'crossed_above', 'macdsignal'))
+            if params['trigger'] == 'sar_reversal':
+                conditions.append(Condition('close', 'crossed_above', 'sar'))
+
+        return conditions
+
     @staticmethod
     def buy_strategy_generator(params: Dict[str, Any]) -> Callable:
         """
@@ -54,37 +82,7 @@ class DefaultHyperOpt(IHyperOpt):
             """
             Buy strategy Hyperopt will build and use.
             """
-            conditions = []
-
-            # GUARDS AND TRENDS
-            if 'mfi-enabled' in params and params['mfi-enabled']:
-                conditions.append(dataframe['mfi'] < params['mfi-value'])
-            if 'fastd-enabled' in params and params['fastd-enabled']:
-                conditions.append(dataframe['fastd'] < params['fastd-value'])
-            if 'adx-enabled' in params and params['adx-enabled']:
-                conditions.append(dataframe['adx'] > params['adx-value'])
-            if 'rsi-enabled' in params and params['rsi-enabled']:
-                conditions.append(dataframe['rsi'] < params['rsi-value'])
-
-            # TRIGGERS
-            if 'trigger' in params:
-                if params['trigger'] == 'bb_lower':
-                    conditions.append(dataframe['close'] < dataframe['bb_lowerband'])
-                if params['trigger'] == 'macd_cross_signal':
-                    conditions.append(qtpylib.crossed_above(
-                        dataframe['macd'], dataframe['macdsignal']
-                    ))
-                if params['trigger'] == 'sar_reversal':
-                    conditions.append(qtpylib.crossed_above(
-                        dataframe['close'], dataframe['sar']
-                    ))
-
-            if conditions:
-                dataframe.loc[
-                    reduce(lambda x, y: x & y, conditions),
-                    'buy'] = 1
-
-            return dataframe
+            return populate_conditions(dataframe, DefaultHyperOpt.buy_conditions(params), 'buy')
 
         return populate_buy_trend
 
@@ -105,6 +103,34 @@ class DefaultHyperOpt(IHyperOpt):
             Categorical(['bb_lower', 'macd_cross_signal', 'sar_reversal'], name='trigger')
         ]
 
+    @staticmethod
+    def sell_conditions(params: Dict[str, Any]) -> List[Condition]:
+        """
+        Define the sell conditions Hyperopt will evaluate, from the sell strategy parameters.
+        """
+        conditions = []
+
+        # GUARDS AND TRENDS
+        if 'sell-mfi-enabled' in params and params['sell-mfi-enabled']:
+            conditions.append(Condition('mfi', '>', params['sell-mfi-value']))
+        if 'sell-fastd-enabled' in params and params['sell-fastd-enabled']:
+            conditions.append(Condition('fastd', '>', params['sell-fastd-value']))
+        if 'sell-adx-enabled' in params and params['sell-adx-enabled']:
+            conditions.append(Condition('adx', '<', params['sell-adx-value']))
+        if 'sell-rsi-enabled' in params and params['sell-rsi-enabled']:
+            conditions.append(Condition('rsi', '>', params['sell-rsi-value']))
+
+        # TRIGGERS
+        if 'sell-trigger' in params:
+            if params['sell-trigger'] == 'sell-bb_upper':
+                conditions.append(Condition('close', '>', 'bb_upperband'))
+            if params['sell-trigger'] == 'sell-macd_cross_signal':
+                conditions.append(Condition('macdsignal', 'crossed_above', 'macd'))
+            if params['sell-trigger'] == 'sell-sar_reversal':
+                conditions.append(Condition('sar', 'crossed_above', 'close'))
+
+        return conditions
+
     @staticmethod
     def sell_strategy_generator(params: Dict[str, Any]) -> Callable:
         """
@@ -114,37 +140,8 @@ class DefaultHyperOpt(IHyperOpt):
             """
             Sell strategy Hyperopt will build and use.
             """
-            conditions = []
-
-            # GUARDS AND TRENDS
-            if 'sell-mfi-enabled' in params and params['sell-mfi-enabled']:
-                conditions.append(dataframe['mfi'] > params['sell-mfi-value'])
-            if 'sell-fastd-enabled' in params and params['sell-fastd-enabled']:
-                conditions.append(dataframe['fastd'] > params['sell-fastd-value'])
-            if 'sell-adx-enabled' in params and params['sell-adx-enabled']:
-                conditions.append(dataframe['adx'] < params['sell-adx-value'])
-            if 'sell-rsi-enabled' in params and params['sell-rsi-enabled']:
-                conditions.append(dataframe['rsi'] > params['sell-rsi-value'])
-
-            # TRIGGERS
-            if 'sell-trigger' in params:
-                if params['sell-trigger'] == 'sell-bb_upper':
-                    conditions.append(dataframe['close'] > dataframe['bb_upperband'])
-                if params['sell-trigger'] == 'sell-macd_cross_signal':
-                    conditions.append(qtpylib.crossed_above(
-                        dataframe['macdsignal'], dataframe['macd']
-                    ))
-                if params['sell-trigger'] == 'sell-sar_reversal':
-                    conditions.append(qtpylib.crossed_above(
-                        dataframe['sar'], dataframe['close']
-                    ))
-
-            if conditions:
-                dataframe.loc[
-                    reduce(lambda x, y: x & y, conditions),
-                    'sell'] = 1
-
-            return dataframe
+            return populate_conditions(dataframe, DefaultHyperOpt.sell_conditions(params),
+                                       'sell')
 
         return populate_sell_trend
 
@@ -4,35 +4,55 @@
 This module contains the hyperopt logic
 """
 
+import cProfile
+import hashlib
+import inspect
 import locale
 import logging
+import os
 import random
+import time
 import warnings
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from contextlib import contextmanager
 from math import ceil
-from collections import OrderedDict
 from operator import itemgetter
 from pathlib import Path
 from pprint import pprint
-from typing import Any, Dict, List, Optional
+from typing import (Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple,
+                    Union)
 
+import arrow
+import numpy as np
 import rapidjson
 from colorama import Fore, Style
-from joblib import (Parallel, cpu_count, delayed, dump, load,
+from joblib import (cpu_count, dump, effective_n_jobs, load,
                     wrap_non_picklable_objects)
+from joblib.externals.loky import get_reusable_executor
 from pandas import DataFrame, json_normalize, isna
+from pandas.util import hash_pandas_object
 import progressbar
 import tabulate
 from os import path
 import io
 
+from freqtrade.configuration import TimeRange
 from freqtrade.data.converter import trim_dataframe
 from freqtrade.data.history import get_timerange
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import plural, round_dict
-from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.backtesting import Backtesting, _get_data_key
+from freqtrade.optimize.hyperopt_conditions import Condition, ConditionEvaluator
 # Import IHyperOpt and IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt_interface import IHyperOpt  # noqa: F401
 from freqtrade.optimize.hyperopt_loss_interface import IHyperOptLoss  # noqa: F401
+from freqtrade.optimize.hyperopt_remote import (HyperoptCoordinator,
+                                                parse_address, run_worker)
+from freqtrade.optimize.hyperopt_samplers import (HaltonSampler, RandomSampler,
+                                                  Sampler, TPESampler,
+                                                  WindowedOptimizer)
+from freqtrade.optimize.hyperopt_store import HyperoptResultStore
 from freqtrade.resolvers.hyperopt_resolver import (HyperOptLossResolver,
                                                    HyperOptResolver)
 
@@ -55,6 +75,83 @@ SKOPT_MODEL_QUEUE_SIZE = 10
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# With --profile, every PROFILE_INTERVAL-th epoch is profiled (starting with the first one)
+PROFILE_INTERVAL = 10
+
+# Stages of the evaluation of an epoch, as measured in the 'timings' of its results
+TIMING_STAGES = ['data', 'signals', 'backtest', 'loss', 'optimizer']
+
+# Number of recent batches the optimizer overhead shown in the progress bar is averaged over
+OPTIMIZER_TIME_WINDOW = 100
+
+# results_metrics of pruned epochs, which weren't backtested on the complete timerange
+PRUNED_RESULTS_METRICS = {'trade_count': 0, 'avg_profit': np.nan, 'total_profit': 0.0,
+                          'profit': 0.0, 'duration': np.nan}
+
+# Seconds between checks for newly connected workers, when running as coordinator
+REMOTE_POLL_INTERVAL = 1
+
+# Processed data of the current hyperopt run, resident in each (worker) process.
+# Holds the data file's identity (path, mtime, size), the loaded data,
+# the signal cache of Backtesting and the condition evaluators for this data.
+_processed_data_cache: Dict[str, Any] = {}
+
+
+def _load_processed_data(data_file: Path) -> Dict[str, DataFrame]:
+    """
+    Load the processed data dumped by Hyperopt.start() once per process, and keep it in memory
+    for all further epochs evaluated by this process.
+    A new hyperopt run dumps a new data file, which invalidates the loaded data.
+    :param data_file: File with the processed data of this hyperopt run
+    :return: Dict of copies of the processed dataframes, so columns added or values changed
+             while backtesting an epoch (e.g. `dataframe.loc[mask, 'rsi'] = 0` in a hyperopt)
+             don't leak into the resident data used by the next epochs.
+    """
+    stat = data_file.stat()
+    file_id = (str(data_file), stat.st_mtime_ns, stat.st_size)
+    if _processed_data_cache.get('file_id') != file_id:
+        _processed_data_cache['data'] = load(data_file)
+        _processed_data_cache['signals'] = {}
+        _processed_data_cache['evaluators'] = {}
+        _processed_data_cache['file_id'] = file_id
+    return {pair: df.copy() for pair, df in _processed_data_cache['data'].items()}
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], stage: str) -> Iterator[None]:
+    """
+    Add the seconds spent in the with-block to timings[stage]
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+
+def _get_source(obj: Any) -> str:
+    """
+    Source code of the class of obj, or its name if the source is not available
+    """
+    try:
+        return inspect.getsource(type(obj))
+    except (OSError, TypeError):
+        return type(obj).__name__
+
+
+class _SequentialExecutor(Executor):
+    """
+    Executor evaluating submitted epochs right away in this process. Used with hyperopt_jobs = 1.
+    """
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:  # type: ignore
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
 
 class Hyperopt:
     """
@@ -76,14 +173,25 @@ class Hyperopt:
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
 
         self.results_file = (self.config['user_data_dir'] /
-                             'hyperopt_results' / 'hyperopt_results.pickle')
+                             'hyperopt_results' / 'hyperopt_results.sqlite')
+        self.results_store = HyperoptResultStore(self.results_file)
         self.data_pickle_file = (self.config['user_data_dir'] /
                                  'hyperopt_results' / 'hyperopt_tickerdata.pkl')
         self.total_epochs = config.get('epochs', 0)
 
         self.current_best_loss = 100
 
-        if not self.config.get('hyperopt_continue'):
+        if self.config.get('hyperopt_coordinator') and self.config.get('hyperopt_worker'):
+            raise OperationalException(
+                "Hyperopt can either run as coordinator (`--coordinator`) "
+                "or as worker (`--worker`), not both.")
+
+        if self.config.get('hyperopt_worker'):
+            # Workers don't store results. They may share the user directory
+            # with the coordinator and other workers, so each keeps its own data file.
+            self.data_pickle_file = self.data_pickle_file.with_name(
+                f'hyperopt_tickerdata_worker_{os.getpid()}.pkl')
+        elif not self.config.get('hyperopt_continue'):
             self.clean_hyperopt()
         else:
             logger.info("Continuing on previous hyperopt results.")
@@ -112,6 +220,37 @@ class Hyperopt:
             self.max_open_trades = 0
         self.position_stacking = self.config.get('position_stacking', False)
 
+        # Without buy and sell spaces, buy / sell signals are the same for all epochs.
+        # Analyze them once, and only simulate exits with the parameters of each epoch.
+        self.cache_signals = not self.has_space('buy') and not self.has_space('sell')
+        if self.cache_signals:
+            logger.info("Buy and sell signals are not optimized, "
+                        "analyzing them once for all epochs.")
+
+        # Buy / sell conditions of the current epoch, when the hyperopt provides them
+        self.buy_conditions: Optional[List[Condition]] = None
+        self.sell_conditions: Optional[List[Condition]] = None
+
+        # Successive halving: number of shorter timeranges epochs are backtested on first
+        self.pruning_rungs = self.config.get('hyperopt_pruning_rungs', 0)
+        self.pruning_factor = self.config.get('hyperopt_pruning_factor', 3)
+        # Losses of all epochs evaluated on each of these timeranges
+        self.rung_losses: List[List[float]] = [[] for _ in range(self.pruning_rungs)]
+
+        # Results of fully evaluated epochs by their parameters, returned again without
+        # backtesting when the optimizer repeats a point. Only valid for the same
+        # data, strategy, hyperopt and loss function (results_fingerprint).
+        self.result_cache: Dict[Tuple, Dict] = {}
+        self.results_fingerprint = ''
+        self.cache_hits = 0
+
+        # Time spent asking and telling the optimizer: in total, and as (seconds, epochs)
+        # for each of the recent batches
+        self.optimizer_time = 0.0
+        self.optimizer_epochs = 0
+        self.recent_optimizer_times: Deque[Tuple[float, int]] = deque(
+            maxlen=OPTIMIZER_TIME_WINDOW)
+
         if self.has_space('sell'):
             # Make sure use_sell_signal is enabled
             if 'ask_strategy' not in self.config:
@@ -130,9 +269,10 @@ class Hyperopt:
 
     def clean_hyperopt(self) -> None:
         """
-        Remove hyperopt pickle files to restart hyperopt.
+        Remove hyperopt pickle files and results to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in [self.data_pickle_file, self.results_file, self.results_store.legacy_file,
+                  *self.results_file.parent.glob('hyperopt_profile_*.prof')]:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -153,25 +293,17 @@ class Hyperopt:
 
     def _save_results(self) -> None:
         """
-        Save hyperopt results to file
+        Append epochs not saved yet to the hyperopt results store
         """
         num_epochs = len(self.epochs)
         if num_epochs > self.num_epochs_saved:
-            logger.debug(f"Saving {num_epochs} {plural(num_epochs, 'epoch')}.")
-            dump(self.epochs, self.results_file)
+            logger.debug(f"Saving {num_epochs - self.num_epochs_saved} "
+                         f"{plural(num_epochs - self.num_epochs_saved, 'epoch')}.")
+            self.results_store.append(self.epochs[self.num_epochs_saved:])
             self.num_epochs_saved = num_epochs
             logger.debug(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
                          f"saved to '{self.results_file}'.")
 
-    @staticmethod
-    def _read_results(results_file: Path) -> List:
-        """
-        Read hyperopt results from file
-        """
-        logger.info("Reading epochs from '%s'", results_file)
-        data = load(results_file)
-        return data
-
     def _get_params_details(self, params: Dict) -> Dict:
         """
         Return the params for each space
@@ -296,6 +428,8 @@ class Hyperopt:
 
         trials = json_normalize(results, max_level=1)
         trials['Best'] = ''
+        is_pruned = (trials['is_pruned'].fillna(False).astype(bool) if 'is_pruned' in trials
+                     else False)
         trials = trials[['Best', 'current_epoch', 'results_metrics.trade_count',
                          'results_metrics.avg_profit', 'results_metrics.total_profit',
                          'results_metrics.profit', 'results_metrics.duration',
@@ -303,6 +437,7 @@ class Hyperopt:
         trials.columns = ['Best', 'Epoch', 'Trades', 'Avg profit', 'Total profit',
                           'Profit', 'Avg duration', 'Objective', 'is_initial_point', 'is_best']
         trials['is_profit'] = False
+        trials['is_pruned'] = is_pruned
         trials.loc[trials['is_initial_point'], 'Best'] = '*     '
         trials.loc[trials['is_best'], 'Best'] = 'Best'
         trials.loc[trials['is_initial_point'] & trials['is_best'], 'Best'] = '* Best'
@@ -321,6 +456,7 @@ class Hyperopt:
         trials['Objective'] = trials['Objective'].apply(
             lambda x: '{:,.5f}'.format(x).rjust(8, ' ') if x != 100000 else "N/A".rjust(8, ' ')
         )
+        trials.loc[trials['is_pruned'], 'Objective'] = "Pruned".rjust(8, ' ')
 
         trials['Profit'] = trials.apply(
             lambda x: '{:,.8f} {} {}'.format(
@@ -335,15 +471,15 @@ class Hyperopt:
         if print_colorized:
             for i in range(len(trials)):
                 if trials.loc[i]['is_profit']:
-                    for j in range(len(trials.loc[i])-3):
+                    for j in range(len(trials.loc[i])-4):
                         trials.iat[i, j] = "{}{}{}".format(Fore.GREEN,
                                                            str(trials.loc[i][j]), Fore.RESET)
                 if trials.loc[i]['is_best'] and highlight_best:
-                    for j in range(len(trials.loc[i])-3):
+                    for j in range(len(trials.loc[i])-4):
                         trials.iat[i, j] = "{}{}{}".format(Style.BRIGHT,
                                                            str(trials.loc[i][j]), Style.RESET_ALL)
 
-        trials = trials.drop(columns=['is_initial_point', 'is_best', 'is_profit'])
+        trials = trials.drop(columns=['is_initial_point', 'is_best', 'is_profit', 'is_pruned'])
         if remove_header > 0:
             table = tabulate.tabulate(
                 trials.to_dict(orient='list'), tablefmt='orgtbl',
@@ -428,6 +564,23 @@ class Hyperopt:
         trials.to_csv(csv_file, index=False, header=True, mode='w', encoding='UTF-8')
         logger.info(f"CSV file created: {csv_file}")
 
+    @staticmethod
+    def get_timings_table(epochs: List[Dict]) -> str:
+        """
+        Mean and 95th percentile of the milliseconds spent on each stage of the epochs,
+        from the 'timings' of their results. Epochs taken from the cache only spent time in
+        the optimizer.
+        """
+        timings = np.array([[epoch['timings'].get(stage, 0.0) for stage in TIMING_STAGES]
+                            for epoch in epochs]) * 1000
+        timings = np.column_stack((timings, timings.sum(axis=1)))
+        total = timings[:, -1].mean()
+        rows = [[stage, f"{values.mean():.1f}", f"{np.percentile(values, 95):.1f}",
+                 f"{values.mean() / total:.1%}" if total else '-']
+                for stage, values in zip(TIMING_STAGES + ['total'], timings.T)]
+        return tabulate.tabulate(rows, headers=['Stage', 'Mean (ms)', 'P95 (ms)', 'Share'],
+                                 tablefmt="orgtbl", stralign="right", disable_numparse=True)
+
     def has_space(self, space: str) -> bool:
         """
         Tell if the space value is contained in the configuration
@@ -469,11 +622,33 @@ class Hyperopt:
 
         return spaces
 
-    def generate_optimizer(self, raw_params: List[Any], iteration=None) -> Dict:
+    def generate_optimizer(self, raw_params: List[Any], iteration=None,
+                           pruning_thresholds: List[float] = None) -> Dict:
         """
         Used Optimize function. Called once per epoch to optimize whatever is configured.
         Keep this function as optimized as possible!
+        With `--profile`, every PROFILE_INTERVAL-th epoch is evaluated under cProfile.
+        :param iteration: Number of the epoch (starting from 1)
+        :param pruning_thresholds: Maximum loss on each of the shorter timeranges
+            (successive halving), as returned by get_pruning_thresholds()
         """
+        if (self.config.get('hyperopt_profile') and iteration is not None
+                and (iteration - 1) % PROFILE_INTERVAL == 0):
+            profiler = cProfile.Profile()
+            results = profiler.runcall(self._evaluate_epoch, raw_params, pruning_thresholds)
+            profile_file = self.results_file.parent / f'hyperopt_profile_{iteration}.prof'
+            profiler.dump_stats(str(profile_file))
+            logger.debug(f"Profile of epoch {iteration} written to '{profile_file}'.")
+            return results
+        return self._evaluate_epoch(raw_params, pruning_thresholds)
+
+    def _evaluate_epoch(self, raw_params: List[Any],
+                        pruning_thresholds: Optional[List[float]]) -> Dict:
+        """
+        Backtest the parameters of an epoch, and calculate its loss.
+        The results carry the seconds spent on each stage of the evaluation ('timings').
+        """
+        timings: Dict[str, float] = {}
         params_dict = self._get_params_dict(raw_params)
         params_details = self._get_params_details(params_dict)
 
@@ -481,13 +656,8 @@ class Hyperopt:
             self.backtesting.strategy.minimal_roi = \
                 self.custom_hyperopt.generate_roi_table(params_dict)
 
-        if self.has_space('buy'):
-            self.backtesting.strategy.advise_buy = \
-                self.custom_hyperopt.buy_strategy_generator(params_dict)
-
-        if self.has_space('sell'):
-            self.backtesting.strategy.advise_sell = \
-                self.custom_hyperopt.sell_strategy_generator(params_dict)
+        with _timed(timings, 'signals'):
+            self._set_signal_params(params_dict)
 
         if self.has_space('stoploss'):
             self.backtesting.strategy.stoploss = params_dict['stoploss']
@@ -501,23 +671,135 @@ class Hyperopt:
             self.backtesting.strategy.trailing_only_offset_is_reached = \
                 d['trailing_only_offset_is_reached']
 
-        processed = load(self.data_pickle_file)
+        with _timed(timings, 'data'):
+            processed = _load_processed_data(self.data_pickle_file)
+            if self.cache_signals:
+                self.backtesting.signal_cache = _processed_data_cache['signals']
+            min_date, max_date = get_timerange(processed)
+
+        pruning_thresholds = pruning_thresholds or []
+        rung_losses: List[float] = []
+        for rung, threshold in enumerate(pruning_thresholds):
+            # Timerange of this rung: 1/factor of the next rung's timerange
+            fraction = self.pruning_factor ** (rung - len(pruning_thresholds))
+            rung_max_date = min_date + (max_date - min_date) * fraction
+            rung_timerange = TimeRange(None, 'date', 0, rung_max_date.timestamp)
+            with _timed(timings, 'data'):
+                rung_processed = {pair: trim_dataframe(df, rung_timerange)
+                                  for pair, df in processed.items()}
+
+            backtesting_results = self._backtest(rung_processed, min_date, rung_max_date, timings)
+            with _timed(timings, 'loss'):
+                results = self._get_results_dict(
+                    backtesting_results, min_date, rung_max_date, params_dict, params_details,
+                    min_trades=ceil(self.config['hyperopt_min_trades'] * fraction))
+            results['timings'] = timings
+            rung_losses.append(results['loss'])
+            if results['loss'] > threshold:
+                # Pruned epochs are cast away like epochs with too few trades.
+                # Metrics of the shortened timerange are kept apart from results_metrics,
+                # so hyperopt-list doesn't list them as results of the complete timerange.
+                results['results_explanation'] += f" Pruned after {fraction:.0%} of the timerange."
+                results.update({'loss': MAX_LOSS, 'is_pruned': True, 'rung_losses': rung_losses,
+                                'rung_metrics': results['results_metrics'],
+                                'results_metrics': PRUNED_RESULTS_METRICS.copy(),
+                                'total_profit': 0.0})
+                return results
+
+        backtesting_results = self._backtest(processed, min_date, max_date, timings)
+        with _timed(timings, 'loss'):
+            results = self._get_results_dict(
+                backtesting_results, min_date, max_date, params_dict, params_details,
+                min_trades=self.config['hyperopt_min_trades'])
+        results['timings'] = timings
+        if pruning_thresholds:
+            results.update({'is_pruned': False, 'rung_losses': rung_losses})
+        return results
+
+    def _set_signal_params(self, params_dict: Dict[str, Any]) -> None:
+        """
+        Set the buy / sell signals of an epoch: conditions if the hyperopt provides them,
+        buy_strategy_generator() / sell_strategy_generator() otherwise.
+        """
+        if self.has_space('buy'):
+            self.buy_conditions = self.custom_hyperopt.buy_conditions(params_dict)
+            if self.buy_conditions is None:
+                self.backtesting.strategy.advise_buy = \
+                    self.custom_hyperopt.buy_strategy_generator(params_dict)
 
-        min_date, max_date = get_timerange(processed)
+        if self.has_space('sell'):
+            self.sell_conditions = self.custom_hyperopt.sell_conditions(params_dict)
+            if self.sell_conditions is None:
+                self.backtesting.strategy.advise_sell = \
+                    self.custom_hyperopt.sell_strategy_generator(params_dict)
 
-        backtesting_results = self.backtesting.backtest(
-            processed=processed,
-            stake_amount=self.config['stake_amount'],
-            start_date=min_date,
-            end_date=max_date,
-            max_open_trades=self.max_open_trades,
-            position_stacking=self.position_stacking,
-        )
-        return self._get_results_dict(backtesting_results, min_date, max_date,
-                                      params_dict, params_details)
+        if self.buy_conditions is not None or self.sell_conditions is not None:
+            self.backtesting.signal_generator = self._get_signal_arrays
+
+    def _get_signal_arrays(self, pair: str,
+                           pair_data: DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Buy and sell signals of one pair for the current epoch (Backtesting.signal_generator).
+        Conditions are evaluated on the arrays of the process-resident data. Signals of
+        spaces without conditions are populated on the dataframe - only once for spaces
+        which are not optimized.
+        """
+        evaluators = _processed_data_cache.setdefault('evaluators', {})
+        key = _get_data_key({pair: pair_data})
+        if key not in evaluators:
+            evaluators[key] = ConditionEvaluator(pair_data)
+        evaluator = evaluators[key]
+
+        signals = []
+        for signal, conditions, advise in (
+                ('buy', self.buy_conditions, self.backtesting.strategy.advise_buy),
+                ('sell', self.sell_conditions, self.backtesting.strategy.advise_sell)):
+            if conditions is not None:
+                signals.append(evaluator.evaluate(conditions))
+                continue
+            if self.has_space(signal) or signal not in evaluator.signals:
+                pair_data.loc[:, signal] = 0
+                evaluator.signals[signal] = advise(pair_data, {'pair': pair})[signal].values
+            signals.append(evaluator.signals[signal])
+        return signals[0], signals[1]
+
+    def _backtest(self, processed: Dict[str, DataFrame], min_date: arrow.Arrow,
+                  max_date: arrow.Arrow, timings: Dict[str, float]) -> DataFrame:
+        """
+        Backtest the current epoch, adding the time spent on signals and on the backtest
+        itself to timings
+        """
+        signals_time = self.backtesting.signals_time
+        with _timed(timings, 'backtest'):
+            results = self.backtesting.backtest(
+                processed=processed,
+                stake_amount=self.config['stake_amount'],
+                start_date=min_date,
+                end_date=max_date,
+                max_open_trades=self.max_open_trades,
+                position_stacking=self.position_stacking,
+            )
+        signals_time = self.backtesting.signals_time - signals_time
+        timings['backtest'] -= signals_time
+        timings['signals'] = timings.get('signals', 0.0) + signals_time
+        return results
+
+    def get_pruning_thresholds(self) -> List[float]:
+        """
+        Maximum loss of an epoch on each of the shorter timeranges to be promoted to the next
+        timerange: the best 1/pruning_factor quantile of the losses of previous epochs on the
+        same timerange. Epochs are promoted unconditionally while there are too few of these.
+        """
+        return [float(np.quantile(losses, 1 / self.pruning_factor))
+                if len(losses) >= self.pruning_factor else float('inf')
+                for losses in self.rung_losses]
+
+    def _record_rung_losses(self, epoch: Dict) -> None:
+        for losses, loss in zip(self.rung_losses, epoch.get('rung_losses', [])):
+            losses.append(loss)
 
     def _get_results_dict(self, backtesting_results, min_date, max_date,
-                          params_dict, params_details):
+                          params_dict, params_details, min_trades: int):
         results_metrics = self._calculate_results_metrics(backtesting_results)
         results_explanation = self._format_results_explanation_string(results_metrics)
 
@@ -529,7 +811,7 @@ class Hyperopt:
         # in order to cast this hyperspace point away from optimization
         # path. We do not want to optimize 'hodl' strategies.
         loss: float = MAX_LOSS
-        if trade_count >= self.config['hyperopt_min_trades']:
+        if trade_count >= min_trades:
             loss = self.calculate_loss(results=backtesting_results, trade_count=trade_count,
                                        min_date=min_date.datetime, max_date=max_date.datetime)
         return {
@@ -562,8 +844,22 @@ class Hyperopt:
                 f"Avg duration {results_metrics['duration']:5.1f} min."
                 ).encode(locale.getpreferredencoding(), 'replace').decode('utf-8')
 
-    def get_optimizer(self, dimensions: List[Dimension], cpu_count) -> Optimizer:
-        return Optimizer(
+    def get_optimizer(self, dimensions: List[Dimension],
+                      cpu_count) -> Union[Optimizer, Sampler]:
+        """
+        Optimizer suggesting the points to evaluate, as configured by `hyperopt_sampler`.
+        `hyperopt_surrogate_window` bounds the number of evaluations models are fitted on.
+        """
+        sampler = self.config.get('hyperopt_sampler', 'et')
+        window = self.config.get('hyperopt_surrogate_window', 0)
+        if sampler == 'random':
+            return RandomSampler(dimensions, random_state=self.random_state)
+        if sampler == 'halton':
+            return HaltonSampler(dimensions, random_state=self.random_state)
+        if sampler == 'tpe':
+            return TPESampler(dimensions, n_initial_points=INITIAL_POINTS, window=window,
+                              random_state=self.random_state)
+        return WindowedOptimizer(
             dimensions,
             base_estimator="ET",
             acq_optimizer="auto",
@@ -571,35 +867,184 @@ class Hyperopt:
             acq_optimizer_kwargs={'n_jobs': cpu_count},
             random_state=self.random_state,
             model_queue_size=SKOPT_MODEL_QUEUE_SIZE,
+            window=window,
         )
 
-    def run_optimizer_parallel(self, parallel, asked, i) -> List:
-        return parallel(delayed(
-                        wrap_non_picklable_objects(self.generate_optimizer))(v, i) for v in asked)
+    def _ask_point(self, pending: List[List[Any]]) -> List[Any]:
+        """
+        Ask the optimizer for the next point to evaluate.
+        Points still being evaluated are told to a copy of the optimizer with the best loss
+        so far (constant liar, as skopt's ask(n_points) does), so they are not suggested again.
+        :param pending: Points submitted, but not evaluated yet
+        """
+        if not pending:
+            return self.opt.ask()
+        opt = self.opt.copy(random_state=self.opt.rng.randint(0, np.iinfo(np.int32).max))
+        opt.tell(pending, [min(self.opt.yi) if self.opt.yi else 0.0] * len(pending))
+        return opt.ask()
+
+    def _report_epoch(self, val: Dict, current: int, pbar) -> None:
+        """
+        Number, print and store an evaluated epoch. Called in epoch order.
+        :param val: Results of the epoch, as returned by generate_optimizer()
+        :param current: Human-friendly epoch number (starting from 1)
+        """
+        val['current_epoch'] = current
+        val['is_initial_point'] = current <= INITIAL_POINTS
+
+        logger.debug(f"Optimizer epoch evaluated: {val}")
+
+        is_best = self.is_best_loss(val, self.current_best_loss)
+        # This value is assigned here and not in the optimization method
+        # to keep proper order in the list of results. That's because
+        # evaluations can take different time. Here they are aligned in the
+        # order they will be shown to the user.
+        val['is_best'] = is_best
+        self.print_results(val)
+
+        if is_best:
+            self.current_best_loss = val['loss']
+        if val.get('is_cached'):
+            self.cache_hits += 1
+        val['results_fingerprint'] = self.results_fingerprint
+        self.epochs.append(val)
+        self._save_results()
+
+        pbar.update(current, cache_hits=f"{self.cache_hits} ({self.cache_hits / current:.0%})",
+                    optimizer_time=self._format_optimizer_time())
+
+    def _record_optimizer_time(self, seconds: float, epochs: int) -> None:
+        """
+        Record the time spent asking and telling the optimizer for a batch of epochs
+        """
+        self.optimizer_time += seconds
+        self.optimizer_epochs += epochs
+        self.recent_optimizer_times.append((seconds, epochs))
+        logger.debug(f"Optimizer ask/tell overhead: {seconds * 1000:.1f} ms "
+                     f"for {epochs} {plural(epochs, 'epoch')}.")
+
+    def _format_optimizer_time(self) -> str:
+        """
+        Mean optimizer overhead per epoch of the recent batches
+        """
+        epochs = sum(epochs for _, epochs in self.recent_optimizer_times)
+        if not epochs:
+            return '-'
+        seconds = sum(seconds for seconds, _ in self.recent_optimizer_times)
+        return f"{seconds / epochs * 1000:.0f} ms/epoch"
+
+    def run_optimizer_parallel(self, executor: Executor, jobs: int, pbar) -> None:
+        """
+        Evaluate self.total_epochs epochs, keeping all workers busy.
+        A new point is asked and submitted as soon as any epoch finishes, instead of waiting for
+        the slowest epoch of a batch. Evaluated points are told to the optimizer in completion
+        order, while epochs are numbered and reported in the order they were asked.
+        :param executor: Executor to evaluate epochs with
+        :param jobs: Number of epochs to evaluate at the same time. A coordinator keeps one epoch
+            queued per connected worker instead.
+        """
+        remote = isinstance(executor, HyperoptCoordinator)
+        # Remote workers evaluate epochs with their own Hyperopt instance
+        evaluate = (self.generate_optimizer if remote
+                    else wrap_non_picklable_objects(self.generate_optimizer))
+        pending: Dict[Future, Tuple[int, List[Any]]] = {}
+        evaluated: Dict[int, Dict] = {}
+        # Seconds spent asking and telling the optimizer, by epoch
+        optimizer_times: Dict[int, float] = {}
+        asked = reported = 0
+        # Optimizer overhead since the last recorded batch
+        overhead, told = 0.0, 0
+
+        while reported < self.total_epochs:
+            max_pending = max(executor.num_workers, 1) if remote else jobs  # type: ignore
+            while len(pending) < max_pending and asked < self.total_epochs:
+                start = time.perf_counter()
+                point = self._ask_point([p for _, p in pending.values()])
+                asked += 1
+                cached = self._get_cached_result(point)
+                if cached is not None:
+                    # Repeated point, no need to backtest it again
+                    evaluated[asked] = cached
+                    self.opt.tell(point, cached['loss'], fit=not pending)
+                    told += 1
+                elapsed = time.perf_counter() - start
+                optimizer_times[asked] = elapsed
+                overhead += elapsed
+                if cached is None:
+                    pending[executor.submit(evaluate, point, asked,
+                                            self.get_pruning_thresholds())] = (asked, point)
+
+            # Coordinators check for newly connected workers regularly
+            done, _ = wait(pending, timeout=REMOTE_POLL_INTERVAL if remote else None,
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                current, point = pending.pop(future)
+                evaluated[current] = future.result()
+                self._record_rung_losses(evaluated[current])
+                self._cache_result(evaluated[current])
+                start = time.perf_counter()
+                # Refitting the model is only needed if the next point is asked without lies
+                self.opt.tell(point, evaluated[current]['loss'], fit=not pending)
+                elapsed = time.perf_counter() - start
+                optimizer_times[current] += elapsed
+                overhead += elapsed
+                told += 1
+            if told:
+                self._record_optimizer_time(overhead, told)
+                overhead, told = 0.0, 0
+
+            while reported + 1 in evaluated:
+                reported += 1
+                val = evaluated.pop(reported)
+                # Cached epochs only cost the optimizer time, not the timings of their results
+                val['timings'] = {**({} if val.get('is_cached') else val.get('timings', {})),
+                                  'optimizer': optimizer_times.pop(reported)}
+                self._report_epoch(val, reported, pbar)
+
+    @staticmethod
+    def _get_params_key(params_dict: Dict[str, Any]) -> Tuple:
+        """
+        Canonical, hashable form of the parameters of an epoch.
+        The optimizer may return numpy scalars, previous results hold python values.
+        """
+        return tuple(sorted((name, value.item() if isinstance(value, np.generic) else value)
+                            for name, value in params_dict.items()))
+
+    def _cache_result(self, result: Dict) -> None:
+        """
+        Remember the results of an epoch for points repeating its parameters.
+        Pruned epochs depend on the losses of other epochs, and are not cached.
+        """
+        if 'params_dict' in result and not result.get('is_pruned'):
+            self.result_cache[self._get_params_key(result['params_dict'])] = result
+
+    def _get_cached_result(self, point: List[Any]) -> Optional[Dict]:
+        """
+        Results of a former epoch with the same parameters, or None
+        """
+        cached = self.result_cache.get(self._get_params_key(self._get_params_dict(point)))
+        if cached is None:
+            return None
+        return {**cached, 'is_cached': True}
 
     @staticmethod
     def load_previous_results(results_file: Path) -> List:
         """
-        Load data for epochs from the file if we have one
+        Load data for epochs from the results store if we have one
         """
-        epochs: List = []
-        if results_file.is_file() and results_file.stat().st_size > 0:
-            epochs = Hyperopt._read_results(results_file)
-            # Detection of some old format, without 'is_best' field saved
-            if epochs[0].get('is_best') is None:
-                raise OperationalException(
-                    "The file with Hyperopt results is incompatible with this version "
-                    "of Freqtrade and cannot be loaded.")
+        epochs = HyperoptResultStore(results_file).load()
+        if epochs:
             logger.info(f"Loaded {len(epochs)} previous evaluations from disk.")
         return epochs
 
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)
 
-    def start(self) -> None:
-        self.random_state = self._set_random_state(self.config.get('hyperopt_random_state', None))
-        logger.info(f"Using optimizer random state: {self.random_state}")
-        self.hyperopt_table_header = -1
+    def _prepare_data(self) -> Dict[str, DataFrame]:
+        """
+        Load and analyze the data, and dump it for the processes evaluating epochs
+        :return: Dict of analyzed dataframes, trimmed to the timerange
+        """
         data, timerange = self.backtesting.load_bt_data()
 
         preprocessed = self.backtesting.strategy.ohlcvdata_to_dataframe(data)
@@ -618,8 +1063,76 @@ class Hyperopt:
         # We don't need exchange instance anymore while running hyperopt
         self.backtesting.exchange = None  # type: ignore
         self.backtesting.pairlists = None  # type: ignore
+        return preprocessed
+
+    def get_remote_setup(self, preprocessed: Dict[str, DataFrame]) -> Dict[str, Any]:
+        """
+        Settings the coordinator and its workers must agree on to evaluate epochs the same way
+        :param preprocessed: Analyzed data, as returned by _prepare_data()
+        """
+        min_date, max_date = get_timerange(preprocessed)
+        return {
+            'strategy': self.config.get('strategy'),
+            'hyperopt': self.config.get('hyperopt'),
+            'hyperopt_loss': self.config.get('hyperopt_loss'),
+            'ticker_interval': self.config.get('ticker_interval'),
+            'dimensions': [repr(dimension) for dimension in self.dimensions],
+            'data': {pair: len(df) for pair, df in sorted(preprocessed.items())},
+            'timerange': (min_date.isoformat(), max_date.isoformat()),
+            'stake_amount': self.config['stake_amount'],
+            'fee': self.backtesting.fee,
+            'max_open_trades': self.max_open_trades,
+            'position_stacking': self.position_stacking,
+            'min_trades': self.config.get('hyperopt_min_trades'),
+            'pruning_factor': self.pruning_factor,
+        }
+
+    def get_results_fingerprint(self, preprocessed: Dict[str, DataFrame]) -> str:
+        """
+        Fingerprint of everything the results of an epoch depend on besides its parameters:
+        the analyzed data, the strategy, hyperopt and loss function (including their source
+        code) and the backtest settings.
+        :param preprocessed: Analyzed data, as returned by _prepare_data()
+        """
+        strategy = self.backtesting.strategy
+        settings = self.get_remote_setup(preprocessed)
+        # The results of an epoch don't depend on the other dimensions, or on pruning
+        del settings['dimensions'], settings['pruning_factor']
+        settings.update({
+            'minimal_roi': strategy.minimal_roi,
+            'stoploss': strategy.stoploss,
+            'trailing': (strategy.trailing_stop, strategy.trailing_stop_positive,
+                         strategy.trailing_stop_positive_offset,
+                         strategy.trailing_only_offset_is_reached),
+            'ask_strategy': self.config.get('ask_strategy'),
+            'sources': [_get_source(obj) for obj in (strategy, self.custom_hyperopt,
+                                                     self.custom_hyperoptloss)],
+        })
+        fingerprint = hashlib.sha1(repr(sorted(settings.items())).encode())
+        for pair, df in sorted(preprocessed.items()):
+            fingerprint.update(pair.encode())
+            fingerprint.update(hash_pandas_object(df, index=False).values.tobytes())
+        return fingerprint.hexdigest()
+
+    def _get_remote_secret(self) -> bytes:
+        secret = self.config.get('hyperopt_remote_secret')
+        if not secret:
+            raise OperationalException(
+                "Running hyperopt as coordinator or worker requires a secret shared by all "
+                "machines. Please set `hyperopt_remote_secret` in the configuration.")
+        return secret.encode()
+
+    def start(self) -> None:
+        self.random_state = self._set_random_state(self.config.get('hyperopt_random_state', None))
+        logger.info(f"Using optimizer random state: {self.random_state}")
+        self.hyperopt_table_header = -1
+        remote = bool(self.config.get('hyperopt_coordinator'))
+        secret = self._get_remote_secret() if remote else b''
+        preprocessed = self._prepare_data()
 
         self.epochs = self.load_previous_results(self.results_file)
+        self.num_epochs_saved = len(self.epochs)
+        num_previous_epochs = len(self.epochs)
 
         cpus = cpu_count()
         logger.info(f"Found {cpus} CPU cores. Let's make them scream!")
@@ -628,80 +1141,73 @@ class Hyperopt:
 
         self.dimensions: List[Dimension] = self.hyperopt_space()
         self.opt = self.get_optimizer(self.dimensions, config_jobs)
+        self.results_fingerprint = self.get_results_fingerprint(preprocessed)
+        for epoch in self.epochs:
+            self._record_rung_losses(epoch)
+            # Previous results only apply to the same data, strategy, hyperopt and loss
+            if epoch.get('results_fingerprint') == self.results_fingerprint:
+                self._cache_result(epoch)
+        jobs = effective_n_jobs(config_jobs)
+        executor: Executor
+        if remote:
+            executor = HyperoptCoordinator(parse_address(self.config['hyperopt_coordinator']),
+                                           secret, self.get_remote_setup(preprocessed))
+            logger.info(f"Waiting for hyperopt workers on {self.config['hyperopt_coordinator']} "
+                        f"...")
+        else:
+            logger.info(f'Effective number of parallel workers used: {jobs}')
+            executor = (_SequentialExecutor() if jobs == 1
+                        else get_reusable_executor(max_workers=jobs))
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f'Effective number of parallel workers used: {jobs}')
-
-                # Define progressbar
-                if self.print_colorized:
-                    widgets = [
-                        ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
-                        ' (', progressbar.Percentage(), ')] ',
-                        progressbar.Bar(marker=progressbar.AnimatedMarker(
-                            fill='\N{FULL BLOCK}',
-                            fill_wrap=Fore.GREEN + '{}' + Fore.RESET,
-                            marker_wrap=Style.BRIGHT + '{}' + Style.RESET_ALL,
-                        )),
-                        ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
-                    ]
-                else:
-                    widgets = [
-                        ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
-                        ' (', progressbar.Percentage(), ')] ',
-                        progressbar.Bar(marker=progressbar.AnimatedMarker(
-                            fill='\N{FULL BLOCK}',
-                        )),
-                        ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
-                    ]
-                with progressbar.ProgressBar(
-                         max_value=self.total_epochs, redirect_stdout=False, redirect_stderr=False,
-                         widgets=widgets
-                     ) as pbar:
-                    EVALS = ceil(self.total_epochs / jobs)
-                    for i in range(EVALS):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - self.total_epochs
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked = self.opt.ask(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked, i)
-                        self.opt.tell(asked, [v['loss'] for v in f_val])
-
-                        # Calculate progressbar outputs
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1
-                            val['current_epoch'] = current
-                            val['is_initial_point'] = current <= INITIAL_POINTS
-
-                            logger.debug(f"Optimizer epoch evaluated: {val}")
-
-                            is_best = self.is_best_loss(val, self.current_best_loss)
-                            # This value is assigned here and not in the optimization method
-                            # to keep proper order in the list of results. That's because
-                            # evaluations can take different time. Here they are aligned in the
-                            # order they will be shown to the user.
-                            val['is_best'] = is_best
-                            self.print_results(val)
-
-                            if is_best:
-                                self.current_best_loss = val['loss']
-                            self.epochs.append(val)
-
-                            # Save results after each best epoch and every 100 epochs
-                            if is_best or current % 100 == 0:
-                                self._save_results()
-
-                            pbar.update(current)
+            # Define progressbar
+            if self.print_colorized:
+                widgets = [
+                    ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
+                    ' (', progressbar.Percentage(), ')] ',
+                    progressbar.Bar(marker=progressbar.AnimatedMarker(
+                        fill='\N{FULL BLOCK}',
+                        fill_wrap=Fore.GREEN + '{}' + Fore.RESET,
+                        marker_wrap=Style.BRIGHT + '{}' + Style.RESET_ALL,
+                    )),
+                    ' [', progressbar.ETA(), ', ', progressbar.Timer(), ', ',
+                    progressbar.Variable('cache_hits', format='Cache hits: {formatted_value}',
+                                         width=1), ', ',
+                    progressbar.Variable('optimizer_time', format='Optimizer: {formatted_value}',
+                                         width=1), ']',
+                ]
+            else:
+                widgets = [
+                    ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
+                    ' (', progressbar.Percentage(), ')] ',
+                    progressbar.Bar(marker=progressbar.AnimatedMarker(
+                        fill='\N{FULL BLOCK}',
+                    )),
+                    ' [', progressbar.ETA(), ', ', progressbar.Timer(), ', ',
+                    progressbar.Variable('cache_hits', format='Cache hits: {formatted_value}',
+                                         width=1), ', ',
+                    progressbar.Variable('optimizer_time', format='Optimizer: {formatted_value}',
+                                         width=1), ']',
+                ]
+            with progressbar.ProgressBar(
+                     max_value=self.total_epochs, redirect_stdout=False, redirect_stderr=False,
+                     widgets=widgets
+                 ) as pbar:
+                self.run_optimizer_parallel(executor, jobs, pbar)
 
         except KeyboardInterrupt:
             print('User interrupted..')
+            if jobs > 1 and not remote:
+                # Don't wait for epochs still being evaluated
+                executor.shutdown(wait=False, kill_workers=True)  # type: ignore
+        finally:
+            if remote:
+                # Workers stop after their current epoch
+                executor.shutdown(wait=False)
 
         self._save_results()
         logger.info(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
                     f"saved to '{self.results_file}'.")
+        self._print_run_statistics(self.epochs[num_previous_epochs:])
 
         if self.epochs:
             sorted_epochs = sorted(self.epochs, key=itemgetter('loss'))
@@ -711,3 +1217,40 @@ class Hyperopt:
             # This is printed when Ctrl+C is pressed quickly, before first epochs have
             # a chance to be evaluated.
             print("No epochs evaluated yet, no best result.")
+
+    def _print_run_statistics(self, run_epochs: List[Dict]) -> None:
+        """
+        Log and print statistics of this run: optimizer overhead, cache hits, pruned epochs
+        and the time spent on each stage of the epochs
+        :param run_epochs: Epochs evaluated in this run
+        """
+        if self.optimizer_epochs:
+            logger.info(f"Optimizer ask/tell overhead: {self.optimizer_time:.1f} seconds, "
+                        f"{self.optimizer_time / self.optimizer_epochs * 1000:.1f} ms per epoch.")
+        if self.cache_hits:
+            logger.info(f"{self.cache_hits} {plural(self.cache_hits, 'epoch')} repeated "
+                        f"evaluated parameters, results were taken from the cache.")
+        if self.pruning_rungs:
+            pruned = len([epoch for epoch in self.epochs if epoch.get('is_pruned')])
+            logger.info(f"{pruned} of {len(self.epochs)} {plural(len(self.epochs), 'epoch')} "
+                        f"pruned before the full timerange.")
+
+        timed_epochs = [epoch for epoch in run_epochs if 'timings' in epoch]
+        if timed_epochs:
+            print(f"Time spent on the {len(timed_epochs)} {plural(len(timed_epochs), 'epoch')} "
+                  f"of this run:")
+            print(self.get_timings_table(timed_epochs))
+            print()
+
+    def start_worker(self) -> None:
+        """
+        Evaluate epochs for the hyperopt coordinator (`--worker`), until it is done
+        """
+        secret = self._get_remote_secret()
+        self.dimensions = self.hyperopt_space()
+        preprocessed = self._prepare_data()
+        try:
+            run_worker(self, parse_address(self.config['hyperopt_worker']), secret,
+                       self.get_remote_setup(preprocessed))
+        finally:
+            self.data_pickle_file.unlink()
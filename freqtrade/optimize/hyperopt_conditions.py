@@ -0,0 +1,106 @@
+"""
+Declarative buy / sell conditions for hyperopt, evaluated on NumPy arrays
+"""
+from typing import Dict, List, NamedTuple, Tuple, Union
+
+import numpy as np
+from pandas import DataFrame
+
+from freqtrade.exceptions import OperationalException
+
+
+# Comparison operators, applied to the current candle
+OPERATORS: Dict[str, np.ufunc] = {
+    '<': np.less,
+    '<=': np.less_equal,
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '==': np.equal,
+}
+
+# Crossings, as (comparison on the current candle, comparison on the previous candle).
+# Same as qtpylib.crossed_above() / qtpylib.crossed_below().
+CROSSINGS: Dict[str, Tuple[np.ufunc, np.ufunc]] = {
+    'crossed_above': (np.greater, np.less_equal),
+    'crossed_below': (np.less, np.greater_equal),
+}
+
+
+class Condition(NamedTuple):
+    """
+    Condition on an indicator column: `left op right`.
+    right is either the name of another column or a constant.
+    op is one of '<', '<=', '>', '>=', '==', 'crossed_above' and 'crossed_below'.
+    """
+    left: str
+    op: str
+    right: Union[str, float]
+
+
+class ConditionEvaluator:
+    """
+    Evaluates conditions on the candles of one pair.
+    Indicator columns are converted to float64 arrays once, on first use, and conditions
+    are combined with in-place operations on preallocated boolean masks - without
+    creating intermediate dataframes or series.
+    """
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        self.dataframe = dataframe
+        self._columns: Dict[str, np.ndarray] = {}
+        self._result = np.empty(len(dataframe), dtype=bool)
+        self._previous = np.empty(len(dataframe), dtype=bool)
+        # Signals which don't change between epochs (spaces not optimized), by signal name
+        self.signals: Dict[str, np.ndarray] = {}
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Indicator column as contiguous float64 array
+        """
+        if name not in self._columns:
+            if name not in self.dataframe.columns:
+                raise OperationalException(
+                    f"Condition on column '{name}', which is not populated by "
+                    f"populate_indicators().")
+            self._columns[name] = np.ascontiguousarray(self.dataframe[name].values,
+                                                       dtype=np.float64)
+        return self._columns[name]
+
+    def evaluate(self, conditions: List[Condition]) -> np.ndarray:
+        """
+        Candles matching all conditions. Without conditions, no candle matches.
+        :return: Boolean array, one value per candle
+        """
+        if not conditions:
+            return np.zeros(len(self.dataframe), dtype=bool)
+        mask = np.ones(len(self.dataframe), dtype=bool)
+        for condition in conditions:
+            np.logical_and(mask, self._evaluate(condition), out=mask)
+        return mask
+
+    def _evaluate(self, condition: Condition) -> np.ndarray:
+        left = self.column(condition.left)
+        right = (self.column(condition.right) if isinstance(condition.right, str)
+                 else condition.right)
+        if condition.op in OPERATORS:
+            return OPERATORS[condition.op](left, right, out=self._result)
+        if condition.op in CROSSINGS:
+            current, previous = CROSSINGS[condition.op]
+            current(left, right, out=self._result)
+            # No crossing on the first candle, it has no previous candle
+            self._previous[:1] = False
+            previous(left[:-1], right[:-1] if isinstance(right, np.ndarray) else right,
+                     out=self._previous[1:])
+            return np.logical_and(self._result, self._previous, out=self._result)
+        raise OperationalException(f"Invalid condition operator '{condition.op}' in {condition}.")
+
+
+def populate_conditions(dataframe: DataFrame, conditions: List[Condition],
+                        signal: str) -> DataFrame:
+    """
+    Set the signal column ('buy' or 'sell') to 1 on candles matching all conditions -
+    for use in populate_buy_trend() / populate_sell_trend().
+    """
+    if conditions:
+        dataframe.loc[ConditionEvaluator(dataframe).evaluate(conditions), signal] = 1
+    return dataframe
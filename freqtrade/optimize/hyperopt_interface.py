@@ -5,13 +5,14 @@ This module defines the interface to apply for hyperopt
 import logging
 import math
 from abc import ABC
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from skopt.space import Categorical, Dimension, Integer, Real
 
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import round_dict
+from freqtrade.optimize.hyperopt_conditions import Condition
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,22 @@ class IHyperOpt(ABC):
         # Assign ticker_interval to be used in hyperopt
         IHyperOpt.ticker_interval = str(config['ticker_interval'])
 
+    @staticmethod
+    def buy_conditions(params: Dict[str, Any]) -> Optional[List[Condition]]:
+        """
+        Create the buy conditions, evaluated on NumPy arrays.
+        Faster alternative to buy_strategy_generator(), which is used if this returns None.
+        """
+        return None
+
+    @staticmethod
+    def sell_conditions(params: Dict[str, Any]) -> Optional[List[Condition]]:
+        """
+        Create the sell conditions, evaluated on NumPy arrays.
+        Faster alternative to sell_strategy_generator(), which is used if this returns None.
+        """
+        return None
+
     @staticmethod
     def buy_strategy_generator(params: Dict[str, Any]) -> Callable:
         """
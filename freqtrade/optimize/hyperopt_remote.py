@@ -0,0 +1,277 @@
+"""
+Distributed hyperopt: a coordinator handing out epochs to workers on other machines
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Executor, Future
+from contextlib import closing
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from freqtrade.exceptions import OperationalException
+from freqtrade.misc import plural
+
+
+logger = logging.getLogger(__name__)
+
+# Workers send a heartbeat every HEARTBEAT_INTERVAL seconds while evaluating an epoch.
+# Workers not heard of for WORKER_TIMEOUT seconds are considered dead.
+HEARTBEAT_INTERVAL = 10
+WORKER_TIMEOUT = 60
+
+# Seconds a worker keeps trying to reach a coordinator which is not listening (yet)
+CONNECT_TIMEOUT = 300
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """
+    Split a `host:port` address
+    """
+    host, _, port = address.rpartition(':')
+    if not host or not port.isdigit():
+        raise OperationalException(f"Invalid address '{address}'. Expected `host:port`.")
+    return host, int(port)
+
+
+class HyperoptCoordinator(Executor):
+    """
+    Executor handing out hyperopt epochs to workers connecting over TCP.
+    Workers evaluate epochs with their own Hyperopt instance and their own copy of the data,
+    so only the name of the Hyperopt method to call, its arguments and its result are sent.
+    Workers can connect at any time. Epochs of workers which disconnect or stop sending
+    heartbeats are handed out again.
+    Messages are pickled - connections are authenticated with the shared secret (authkey).
+    """
+
+    def __init__(self, address: Tuple[str, int], authkey: bytes, setup: Dict[str, Any]) -> None:
+        """
+        :param address: (host, port) to listen on. Port 0 picks a free port
+        :param authkey: Secret shared with the workers
+        :param setup: Settings workers must match to evaluate epochs the same way,
+            as returned by Hyperopt.get_remote_setup()
+        """
+        self.setup = setup
+        self._listener = Listener(address, authkey=authkey)
+        self.address: Tuple[str, int] = self._listener.address  # type: ignore
+        self._tasks: Deque[Tuple[Future, str, Tuple]] = deque()
+        self._condition = threading.Condition()
+        self._num_workers = 0
+        self._shutdown = False
+        threading.Thread(target=self._accept_workers, daemon=True).start()
+
+    @property
+    def num_workers(self) -> int:
+        """
+        Number of connected workers
+        """
+        return self._num_workers
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:  # type: ignore
+        """
+        Queue a call of fn for the next free worker.
+        :param fn: Method of Hyperopt. Workers call the method of the same name
+            on their own Hyperopt instance.
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self._tasks.append((future, fn.__name__, args))
+            self._condition.notify()
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:  # type: ignore
+        """
+        Stop accepting workers, and stop workers as soon as they finished their current epoch.
+        Epochs not handed out yet are cancelled.
+        """
+        with self._condition:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            for future, _, _ in self._tasks:
+                future.cancel()
+            self._tasks.clear()
+            self._condition.notify_all()
+        # Wake up the thread waiting for new workers, closing the listener alone doesn't
+        host, port = self.address
+        try:
+            socket.create_connection(('127.0.0.1' if host == '0.0.0.0' else host, port),
+                                     timeout=1).close()
+        except OSError:
+            pass
+        self._listener.close()
+
+    def _accept_workers(self) -> None:
+        while True:
+            try:
+                conn = self._listener.accept()
+            except (AuthenticationError, EOFError, OSError) as e:
+                if self._shutdown:
+                    return
+                logger.warning(f"Rejected hyperopt worker connection: {e}")
+                continue
+            threading.Thread(target=self._serve_worker, args=(conn, ), daemon=True).start()
+
+    def _next_task(self) -> Optional[Tuple[Future, str, Tuple]]:
+        """
+        Wait for the next epoch to hand out. Returns None after shutdown.
+        """
+        with self._condition:
+            while True:
+                if self._shutdown:
+                    return None
+                while self._tasks:
+                    task = self._tasks.popleft()
+                    # Epochs handed out again are running already
+                    if task[0].running() or task[0].set_running_or_notify_cancel():
+                        return task
+                self._condition.wait()
+
+    def _requeue(self, task: Tuple[Future, str, Tuple]) -> None:
+        with self._condition:
+            # Hand out epochs of lost workers before new epochs
+            self._tasks.appendleft(task)
+            self._condition.notify()
+
+    @staticmethod
+    def _receive_result(conn: Connection) -> Tuple:
+        """
+        Wait for the result of the epoch handed out to a worker, skipping heartbeats
+        """
+        while True:
+            if not conn.poll(WORKER_TIMEOUT):
+                raise TimeoutError(f"No heartbeat for {WORKER_TIMEOUT} seconds")
+            message = conn.recv()
+            if message[0] != 'heartbeat':
+                return message
+
+    def _serve_worker(self, conn: Connection) -> None:
+        name = 'unknown'
+        connected = False
+        task = None
+        try:
+            with closing(conn):
+                _, name, setup = conn.recv()
+                if setup != self.setup:
+                    logger.warning(f"Rejected hyperopt worker {name}: its configuration, data "
+                                   f"or hyperopt spaces differ from the coordinator's.")
+                    conn.send(('reject', "Configuration, data or hyperopt spaces "
+                                         "differ from the coordinator's."))
+                    return
+                conn.send(('welcome', ))
+                with self._condition:
+                    self._num_workers += 1
+                    connected = True
+                logger.info(f"Hyperopt worker {name} connected "
+                            f"({self._num_workers} connected).")
+
+                while True:
+                    task = self._next_task()
+                    if task is None:
+                        conn.send(('stop', ))
+                        return
+                    future, method, args = task
+                    conn.send(('epoch', method, args))
+                    message = self._receive_result(conn)
+                    task = None
+                    if message[0] == 'error':
+                        future.set_exception(OperationalException(
+                            f"Hyperopt worker {name} failed to evaluate an epoch:\n{message[1]}"))
+                    else:
+                        future.set_result(message[1])
+        except (EOFError, OSError) as e:
+            if task is not None:
+                self._requeue(task)
+            if not self._shutdown:
+                logger.warning(f"Lost hyperopt worker {name}: {str(e) or type(e).__name__}.")
+        finally:
+            if connected:
+                with self._condition:
+                    self._num_workers -= 1
+
+
+def _connect(address: Tuple[str, int], authkey: bytes, timeout: float) -> Connection:
+    deadline = time.monotonic() + timeout
+    waiting = False
+    while True:
+        try:
+            return Client(address, authkey=authkey)
+        except AuthenticationError as e:
+            raise OperationalException(
+                "Hyperopt coordinator rejected the secret (`hyperopt_remote_secret`).") from e
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise OperationalException(
+                    f"Could not connect to the hyperopt coordinator at "
+                    f"{address[0]}:{address[1]}.")
+            if not waiting:
+                logger.info(f"Waiting for the hyperopt coordinator at "
+                            f"{address[0]}:{address[1]} ...")
+                waiting = True
+            time.sleep(1)
+
+
+def _send_heartbeats(conn: Connection, done: threading.Event) -> None:
+    try:
+        while not done.wait(HEARTBEAT_INTERVAL):
+            conn.send(('heartbeat', ))
+    except OSError:
+        # Lost the coordinator, noticed when sending the result
+        pass
+
+
+def run_worker(hyperopt: Any, address: Tuple[str, int], authkey: bytes, setup: Dict[str, Any],
+               connect_timeout: float = CONNECT_TIMEOUT) -> int:
+    """
+    Evaluate epochs handed out by a hyperopt coordinator, until the coordinator stops.
+    :param hyperopt: Hyperopt instance evaluating the epochs
+    :param address: (host, port) of the coordinator
+    :param authkey: Secret shared with the coordinator
+    :param setup: Settings of this worker, as returned by Hyperopt.get_remote_setup()
+    :return: Number of epochs evaluated
+    """
+    name = f"{socket.gethostname()}:{os.getpid()}"
+    epochs = 0
+    with closing(_connect(address, authkey, connect_timeout)) as conn:
+        conn.send(('hello', name, setup))
+        reply = conn.recv()
+        if reply[0] == 'reject':
+            raise OperationalException(f"Hyperopt coordinator rejected this worker. {reply[1]}")
+        logger.info(f"Connected to the hyperopt coordinator at {address[0]}:{address[1]} "
+                    f"as worker {name}.")
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                logger.warning("Lost the connection to the hyperopt coordinator.")
+                break
+            if message[0] == 'stop':
+                break
+            _, method, args = message
+
+            done = threading.Event()
+            heartbeat = threading.Thread(target=_send_heartbeats, args=(conn, done), daemon=True)
+            heartbeat.start()
+            try:
+                reply = ('result', getattr(hyperopt, method)(*args))
+            except Exception:
+                reply = ('error', traceback.format_exc())
+            finally:
+                # Only one thread may send at a time
+                done.set()
+                heartbeat.join()
+            try:
+                conn.send(reply)
+            except OSError:
+                logger.warning("Lost the connection to the hyperopt coordinator.")
+                break
+            epochs += 1
+    logger.info(f"Hyperopt worker done, evaluated {epochs} {plural(epochs, 'epoch')}.")
+    return epochs
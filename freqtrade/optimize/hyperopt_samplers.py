@@ -0,0 +1,267 @@
+"""
+Samplers suggesting the parameters of hyperopt epochs.
+
+Besides skopt's Optimizer (Bayesian optimization with a surrogate model), lightweight samplers
+with constant or bounded cost per epoch: random, quasi-random (Halton sequence) and
+Tree-structured Parzen Estimator. They implement the part of the Optimizer interface
+Hyperopt uses: ask(), tell(), copy(), Xi, yi and rng.
+"""
+import copy
+import warnings
+from abc import ABC, abstractmethod
+from math import ceil, floor, log
+from typing import Any, List, Optional, Sequence, Union
+
+import numpy as np
+from scipy.special import logsumexp, ndtr
+
+# Suppress scikit-learn FutureWarnings from skopt
+with warnings.catch_warnings():
+    warnings.filterwarnings("ignore", category=FutureWarning)
+    from skopt import Optimizer
+    from skopt.space import Categorical, Dimension, Integer
+
+
+class WindowedOptimizer(Optimizer):
+    """
+    skopt Optimizer fitting its surrogate model on the most recent `window` observations only,
+    so the cost of tell() (and of asking with pending points) stops growing with the number
+    of epochs. Older observations are forgotten. Without window, all observations are used.
+    """
+
+    def __init__(self, *args, window: int = 0, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.window = window
+
+    def _tell(self, x, y, fit=True):
+        if self.window:
+            new = len(y) if isinstance(y, (list, tuple, np.ndarray)) else 1
+            excess = len(self.Xi) - max(self.window - new, 0)
+            if excess > 0:
+                del self.Xi[:excess]
+                del self.yi[:excess]
+        return super()._tell(x, y, fit=fit)
+
+
+def _to_unit(dimension: Dimension, value: Any) -> float:
+    """
+    Position of a value of a numerical dimension in the unit interval.
+    Integers map to the middle of equally sized bins.
+    """
+    if isinstance(dimension, Integer):
+        return (value - dimension.low + 0.5) / (dimension.high - dimension.low + 1)
+    if dimension.high == dimension.low:
+        return 0.5
+    if getattr(dimension, 'prior', 'uniform') == 'log-uniform':
+        return (log(value) - log(dimension.low)) / (log(dimension.high) - log(dimension.low))
+    return (value - dimension.low) / (dimension.high - dimension.low)
+
+
+def _from_unit(dimension: Dimension, unit: float) -> Any:
+    """
+    Value of a dimension at a position of the unit interval
+    """
+    if isinstance(dimension, Categorical):
+        categories = dimension.categories
+        return categories[min(floor(unit * len(categories)), len(categories) - 1)]
+    if isinstance(dimension, Integer):
+        size = dimension.high - dimension.low + 1
+        return int(dimension.low + min(floor(unit * size), size - 1))
+    if getattr(dimension, 'prior', 'uniform') == 'log-uniform':
+        low, high = log(dimension.low), log(dimension.high)
+        value = float(np.exp(low + unit * (high - low)))
+    else:
+        value = float(dimension.low + unit * (dimension.high - dimension.low))
+    return min(max(value, dimension.low), dimension.high)
+
+
+class Sampler(ABC):
+    """
+    Base of the samplers without surrogate model: keeps the evaluated points and their losses.
+    Subclasses implement ask().
+    """
+
+    def __init__(self, dimensions: List[Dimension], random_state: Optional[int] = None) -> None:
+        self.dimensions = dimensions
+        self.rng = np.random.RandomState(random_state)
+        self.Xi: List[List[Any]] = []
+        self.yi: List[float] = []
+
+    @abstractmethod
+    def ask(self) -> List[Any]:
+        """
+        Suggest the next point to evaluate
+        """
+
+    def tell(self, x: List[Any], y: Any, fit: bool = True) -> None:
+        """
+        Record evaluated points: one point and its loss, or lists of points and losses.
+        :param fit: Accepted for compatibility with skopt's Optimizer, there is no model to fit
+        """
+        if isinstance(y, (list, tuple, np.ndarray)):
+            self.Xi.extend(x)
+            self.yi.extend(y)
+        else:
+            self.Xi.append(x)
+            self.yi.append(y)
+
+    def copy(self, random_state: Optional[int] = None) -> 'Sampler':
+        sampler = copy.copy(self)
+        sampler.rng = np.random.RandomState(random_state)
+        sampler.Xi = list(self.Xi)
+        sampler.yi = list(self.yi)
+        return sampler
+
+    def _random_point(self) -> List[Any]:
+        return [_from_unit(dimension, unit)
+                for dimension, unit in zip(self.dimensions, self.rng.uniform(
+                    size=len(self.dimensions)))]
+
+
+class RandomSampler(Sampler):
+    """
+    Samples points uniformly at random
+    """
+
+    def ask(self) -> List[Any]:
+        return self._random_point()
+
+
+def _primes(count: int) -> List[int]:
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def _van_der_corput(index: int, base: int) -> float:
+    result, denominator = 0.0, 1.0
+    while index:
+        index, remainder = divmod(index, base)
+        denominator *= base
+        result += remainder / denominator
+    return result
+
+
+class HaltonSampler(Sampler):
+    """
+    Quasi-random sampler: points of the Halton sequence cover the space more evenly than
+    random points. The sequence starts at a random offset, drawn from the random state.
+    """
+
+    def __init__(self, dimensions: List[Dimension], random_state: Optional[int] = None) -> None:
+        super().__init__(dimensions, random_state)
+        self.bases = _primes(len(dimensions))
+        self.offset = int(self.rng.randint(1, 2 ** 16))
+
+    def ask(self) -> List[Any]:
+        index = self.offset + len(self.Xi)
+        return [_from_unit(dimension, _van_der_corput(index, base))
+                for dimension, base in zip(self.dimensions, self.bases)]
+
+
+class _NumericalParzenEstimator:
+    """
+    Mixture of truncated normal distributions on the unit interval, one around each observed
+    value, plus a wide prior. Bandwidths follow the distance to the neighbouring values.
+    """
+
+    def __init__(self, units: Sequence[float]) -> None:
+        mus = np.append(np.asarray(units, dtype=np.float64), 0.5)
+        order = np.argsort(mus)
+        padded = np.concatenate(([0.0], mus[order], [1.0]))
+        sigmas = np.empty_like(mus)
+        sigmas[order] = np.maximum(padded[1:-1] - padded[:-2], padded[2:] - padded[1:-1])
+        sigmas = np.clip(sigmas, 1.0 / min(100, len(mus)), 1.0)
+        sigmas[-1] = 1.0
+        self.mus = mus
+        self.sigmas = sigmas
+        # Probability mass of each component within the unit interval
+        self.mass = ndtr((1 - mus) / sigmas) - ndtr(-mus / sigmas)
+
+    def sample(self, rng: np.random.RandomState, size: int) -> np.ndarray:
+        components = rng.randint(0, len(self.mus), size=size)
+        samples = rng.normal(self.mus[components], self.sigmas[components])
+        outside = (samples < 0) | (samples > 1)
+        while outside.any():
+            samples[outside] = rng.normal(self.mus[components[outside]],
+                                          self.sigmas[components[outside]])
+            outside = (samples < 0) | (samples > 1)
+        return samples
+
+    def log_pdf(self, samples: np.ndarray) -> np.ndarray:
+        z = (samples[:, None] - self.mus) / self.sigmas
+        log_pdfs = -0.5 * z ** 2 - np.log(np.sqrt(2 * np.pi) * self.sigmas * self.mass)
+        with np.errstate(under='ignore'):
+            return logsumexp(log_pdfs, axis=1) - np.log(len(self.mus))
+
+
+class _CategoricalParzenEstimator:
+    """
+    Frequencies of the observed categories, smoothed by a prior of one observation each
+    """
+
+    def __init__(self, indices: Sequence[int], num_categories: int) -> None:
+        weights = np.bincount(np.asarray(indices, dtype=np.int64),
+                              minlength=num_categories) + 1.0
+        self.probabilities = weights / weights.sum()
+
+    def sample(self, rng: np.random.RandomState, size: int) -> np.ndarray:
+        return rng.choice(len(self.probabilities), size=size, p=self.probabilities)
+
+    def log_pdf(self, samples: np.ndarray) -> np.ndarray:
+        return np.log(self.probabilities[samples])
+
+
+class TPESampler(Sampler):
+    """
+    Tree-structured Parzen Estimator (Bergstra et al., 2011).
+    Splits the evaluated points into the best ones and the others, models both groups with
+    Parzen estimators per dimension, and suggests the candidate drawn from the best group's
+    distribution which is most likely under it, compared to the others' distribution.
+    Random points are suggested until n_initial_points are evaluated.
+    With window, only the most recent `window` evaluations are modelled.
+    """
+
+    def __init__(self, dimensions: List[Dimension], n_initial_points: int = 10,
+                 window: int = 0, n_candidates: int = 24,
+                 random_state: Optional[int] = None) -> None:
+        super().__init__(dimensions, random_state)
+        self.n_initial_points = n_initial_points
+        self.window = window
+        self.n_candidates = n_candidates
+
+    def ask(self) -> List[Any]:
+        if len(self.yi) < self.n_initial_points:
+            return self._random_point()
+        points = self.Xi[-self.window:] if self.window else self.Xi
+        losses = np.asarray(self.yi[-self.window:] if self.window else self.yi)
+        order = np.argsort(losses, kind='stable')
+        num_best = min(ceil(0.1 * len(losses)), 25)
+        groups = order[:num_best], order[num_best:]
+
+        scores = np.zeros(self.n_candidates)
+        candidates = []
+        estimators: List[Union[_NumericalParzenEstimator, _CategoricalParzenEstimator]]
+        for i, dimension in enumerate(self.dimensions):
+            if isinstance(dimension, Categorical):
+                values = [dimension.categories.index(point[i]) for point in points]
+                estimators = [_CategoricalParzenEstimator([values[j] for j in group],
+                                                          len(dimension.categories))
+                              for group in groups]
+            else:
+                units = [_to_unit(dimension, point[i]) for point in points]
+                estimators = [_NumericalParzenEstimator([units[j] for j in group])
+                              for group in groups]
+            best, others = estimators
+            samples = best.sample(self.rng, self.n_candidates)
+            scores += best.log_pdf(samples) - others.log_pdf(samples)
+            candidates.append(samples)
+
+        chosen = int(np.argmax(scores))
+        return [dimension.categories[samples[chosen]] if isinstance(dimension, Categorical)
+                else _from_unit(dimension, samples[chosen])
+                for dimension, samples in zip(self.dimensions, candidates)]
@@ -0,0 +1,152 @@
+"""
+Append-only storage of hyperopt results
+"""
+import logging
+import pickle
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from joblib import load
+
+from freqtrade.exceptions import OperationalException
+from freqtrade.misc import plural
+
+
+logger = logging.getLogger(__name__)
+
+# Filters on results_metrics, mapped to (column, comparison operator)
+METRIC_FILTERS = {
+    'filter_min_avg_time': ('duration', '>'),
+    'filter_max_avg_time': ('duration', '<'),
+    'filter_min_avg_profit': ('avg_profit', '>'),
+    'filter_max_avg_profit': ('avg_profit', '<'),
+    'filter_min_total_profit': ('profit', '>'),
+    'filter_max_total_profit': ('profit', '<'),
+}
+
+INDEXED_COLUMNS = ['loss', 'is_best', 'trade_count', 'avg_profit', 'profit', 'duration']
+
+
+class HyperoptResultStore:
+    """
+    SQLite file holding one row per evaluated hyperopt epoch, in evaluation order.
+    Epochs are appended as they are evaluated, instead of rewriting all epochs on every save.
+    The metrics used to filter epochs are stored in indexed columns, so filtering
+    only unpickles the matching epochs.
+    Results from the former pickle file (hyperopt_results.pickle) next to the store are
+    imported the first time the store is read.
+    """
+
+    def __init__(self, results_file: Path) -> None:
+        self.results_file = results_file
+        self.legacy_file = results_file.with_suffix('.pickle')
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.results_file))
+        conn.execute("""CREATE TABLE IF NOT EXISTS epochs (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            loss REAL, is_best INTEGER,
+                            trade_count INTEGER, avg_profit REAL, profit REAL, duration REAL,
+                            epoch BLOB NOT NULL)""")
+        for column in INDEXED_COLUMNS:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS epochs_{column} ON epochs ({column})")
+        return conn
+
+    @staticmethod
+    def _to_row(epoch: Dict) -> Tuple:
+        # Metrics are usually numpy scalars, which sqlite3 can't store as numbers.
+        # Pruned epochs have no metrics of the complete timerange to filter on.
+        metrics = {} if epoch.get('is_pruned') else epoch.get('results_metrics', {})
+        values = [metrics.get(m) for m in ['avg_profit', 'profit', 'duration']]
+        return (float(epoch['loss']), bool(epoch.get('is_best', False)),
+                int(metrics.get('trade_count', 0)),
+                *[float(value) if value is not None else None for value in values],
+                pickle.dumps(epoch, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def append(self, epochs: List[Dict]) -> None:
+        """
+        Append epochs to the store, in one transaction.
+        :param epochs: List of epochs, in evaluation order
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT INTO epochs (loss, is_best, trade_count, avg_profit, "
+                             "profit, duration, epoch) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             [self._to_row(epoch) for epoch in epochs])
+
+    def _import_legacy(self) -> None:
+        """
+        Import epochs from the pickle file written by former versions, if there is no store yet.
+        """
+        if (self.results_file.is_file() or not self.legacy_file.is_file()
+                or self.legacy_file.stat().st_size == 0):
+            return
+        logger.info("Reading epochs from '%s'", self.legacy_file)
+        epochs = load(self.legacy_file)
+        # Detection of some old format, without 'is_best' field saved
+        if epochs and epochs[0].get('is_best') is None:
+            raise OperationalException(
+                "The file with Hyperopt results is incompatible with this version "
+                "of Freqtrade and cannot be loaded.")
+        self.append(epochs)
+        logger.info(f"Imported {len(epochs)} {plural(len(epochs), 'epoch')} "
+                    f"from '{self.legacy_file}' to '{self.results_file}'.")
+
+    @staticmethod
+    def _get_where_clause(filteroptions: Optional[Dict[str, Any]]) -> Tuple[str, List]:
+        """
+        Translate the hyperopt-list filter options into a SQL where clause.
+        Filters on trade durations and profits only match epochs with trades.
+        """
+        if not filteroptions:
+            return '', []
+        conditions = []
+        values: List[Any] = []
+        if filteroptions.get('only_best'):
+            conditions.append('is_best = 1')
+        if filteroptions.get('only_profitable'):
+            conditions.append('profit > 0')
+        if filteroptions.get('filter_min_trades', 0) > 0:
+            conditions.append('trade_count > ?')
+            values.append(filteroptions['filter_min_trades'])
+        if filteroptions.get('filter_max_trades', 0) > 0:
+            conditions.append('trade_count < ?')
+            values.append(filteroptions['filter_max_trades'])
+        for option, (column, operator) in METRIC_FILTERS.items():
+            if filteroptions.get(option) is not None:
+                conditions.append(f'trade_count > 0 AND {column} {operator} ?')
+                values.append(filteroptions[option])
+        if not conditions:
+            return '', []
+        return ' WHERE ' + ' AND '.join(f'({c})' for c in conditions), values
+
+    def count(self, filteroptions: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count stored epochs
+        :param filteroptions: Filter options, as used by hyperopt-list. None counts all epochs
+        """
+        self._import_legacy()
+        if not self.results_file.is_file():
+            return 0
+        where, values = self._get_where_clause(filteroptions)
+        with closing(self._connect()) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM epochs{where}", values).fetchone()[0]
+
+    def load(self, filteroptions: Optional[Dict[str, Any]] = None,
+             offset: int = 0, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Load stored epochs, in evaluation order
+        :param filteroptions: Filter options, as used by hyperopt-list. None loads all epochs
+        :param offset: Number of (filtered) epochs to skip
+        :param limit: Maximum number of epochs to load. None loads all remaining epochs
+        :return: List of epochs
+        """
+        self._import_legacy()
+        if not self.results_file.is_file():
+            return []
+        where, values = self._get_where_clause(filteroptions)
+        query = f"SELECT epoch FROM epochs{where} ORDER BY id LIMIT ? OFFSET ?"
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, values + [-1 if limit is None else limit, offset])
+            return [pickle.loads(row[0]) for row in rows]
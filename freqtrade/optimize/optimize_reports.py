@@ -1,12 +1,15 @@
 import logging
-from datetime import timedelta
+import shutil
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
+import pandas as pd
 from pandas import DataFrame
 from tabulate import tabulate
 
-from freqtrade.misc import file_dump_json
+from freqtrade.exceptions import OperationalException
+from freqtrade.misc import file_dump_json, pair_to_filename
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,50 @@ def store_backtest_result(recordfilename: Path, all_results: Dict[str, DataFrame
             file_dump_json(filename, records)
 
 
+def store_backtest_result_parquet(recordfilename: Path,
+                                  all_results: Dict[str, DataFrame]) -> None:
+    """
+    Stores backtest results to a Parquet dataset (a directory), partitioned by strategy and pair.
+    Results replace previous results of the same strategy, results of other strategies are kept.
+    :param recordfilename: Destination directory
+    :param all_results: Dict of Dataframes, one results dataframe per strategy
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise OperationalException(
+            f"{e}. Please install pyarrow (`pip3 install pyarrow`) "
+            "to export backtest results to Parquet.") from e
+
+    for strategy, results in all_results.items():
+        strategy_dir = recordfilename / f'strategy={strategy}'
+        if strategy_dir.is_dir():
+            shutil.rmtree(strategy_dir)
+        if results.empty:
+            continue
+
+        # Same columns as the json export, but with native types
+        records = DataFrame({
+            'pair': results['pair'],
+            'profitperc': results['profit_percent'],
+            'open_time': pd.to_datetime(results['open_time'], utc=True),
+            'close_time': pd.to_datetime(results['close_time'], utc=True),
+            'index': results['open_index'] - 1,
+            'duration': results['trade_duration'],
+            'open_rate': results['open_rate'],
+            'close_rate': results['close_rate'],
+            'open_at_end': results['open_at_end'],
+            'sell_reason': [sell_reason.value for sell_reason in results['sell_reason']],
+            # Partition keys
+            'strategy': strategy,
+            'pair_key': results['pair'].map(pair_to_filename),
+        })
+        logger.info(f'Dumping backtest results of {strategy} to {recordfilename}')
+        pq.write_to_dataset(pyarrow.Table.from_pandas(records, preserve_index=False),
+                            str(recordfilename), partition_cols=['strategy', 'pair_key'])
+
+
 def generate_text_table(data: Dict[str, Dict], stake_currency: str, max_open_trades: int,
                         results: DataFrame, skip_nan: bool = False) -> str:
     """
@@ -144,19 +191,20 @@ def generate_text_table_sell_reason(stake_currency: str, max_open_trades: int,
     return tabulate(tabular_data, headers=headers, tablefmt="orgtbl", stralign="right")
 
 
-def generate_text_table_strategy(stake_currency: str, max_open_trades: str,
-                                 all_results: Dict) -> str:
+def generate_text_table_strategy(stake_currency: str, max_open_trades: int,
+                                 all_results: Dict, key_header: str = 'Strategy') -> str:
     """
     Generate summary table per strategy
     :param stake_currency: stake-currency - used to correctly name headers
     :param max_open_trades: Maximum allowed open trades used for backtest
     :param all_results: Dict of <Strategyname: BacktestResult> containing results for all strategies
+    :param key_header: Header of the column containing the keys of all_results
     :return: pretty printed table with tabulate as string
     """
 
     floatfmt = ('s', 'd', '.2f', '.2f', '.8f', '.2f', 'd', '.1f', '.1f')
     tabular_data = []
-    headers = ['Strategy', 'Buys', 'Avg Profit %', 'Cum Profit %',
+    headers = [key_header, 'Buys', 'Avg Profit %', 'Cum Profit %',
                f'Tot Profit {stake_currency}', 'Tot Profit %', 'Avg Duration',
                'Wins', 'Draws', 'Losses']
     for strategy, results in all_results.items():
@@ -178,6 +226,67 @@ def generate_text_table_strategy(stake_currency: str, max_open_trades: str,
                     floatfmt=floatfmt, tablefmt="orgtbl", stralign="right")  # type: ignore
 
 
+def _format_timerange(timerange) -> str:
+    if timerange is None:
+        return '-'
+    start = datetime.fromtimestamp(timerange.startts, tz=timezone.utc)
+    stop = datetime.fromtimestamp(timerange.stopts + 1, tz=timezone.utc)
+    return f"{start:%Y-%m-%d %H:%M} -> {stop:%Y-%m-%d %H:%M}"
+
+
+def generate_text_table_walk_forward(stake_currency: str, wf_results: List) -> str:
+    """
+    Generate summary table per walk-forward window
+    :param stake_currency: stake-currency - used to correctly name headers
+    :param wf_results: List of WalkForwardResult, one per window
+    :return: pretty printed table with tabulate as string
+    """
+
+    floatfmt = ('d', 's', 'd', '.2f', 's', 'd', '.2f', '.2f', '.8f', 'd', 'd', 'd')
+    tabular_data = []
+    headers = ['Window', 'Train Period', 'Train Buys', 'Train Cum Profit %',
+               'Test Period', 'Test Buys', 'Test Avg Profit %', 'Test Cum Profit %',
+               f'Test Tot Profit {stake_currency}', 'Wins', 'Draws', 'Losses']
+    for idx, wf_result in enumerate(wf_results, start=1):
+        train, test = wf_result.train, wf_result.test
+        tabular_data.append([
+            idx,
+            _format_timerange(wf_result.window.train),
+            len(train.index),
+            train.profit_percent.sum() * 100.0,
+            _format_timerange(wf_result.window.test),
+            len(test.index),
+            test.profit_percent.mean() * 100.0 if not test.empty else 0.0,
+            test.profit_percent.sum() * 100.0,
+            test.profit_abs.sum(),
+            len(test[test.profit_abs > 0]),
+            len(test[test.profit_abs == 0]),
+            len(test[test.profit_abs < 0])
+        ])
+    # Ignore type as floatfmt does allow tuples but mypy does not know that
+    return tabulate(tabular_data, headers=headers,
+                    floatfmt=floatfmt, tablefmt="orgtbl", stralign="right")  # type: ignore
+
+
+def generate_text_table_walk_forward_summary(stake_currency: str, max_open_trades: int,
+                                             wf_results: List) -> str:
+    """
+    Generate aggregate table of all train (in-sample) and test (out-of-sample) periods
+    :param stake_currency: stake-currency - used to correctly name headers
+    :param max_open_trades: Maximum allowed open trades used for backtest
+    :param wf_results: List of WalkForwardResult, one per window
+    :return: pretty printed table with tabulate as string
+    """
+    all_results = {}
+    if any(wf_result.window.train is not None for wf_result in wf_results):
+        all_results['Train'] = pd.concat([wf_result.train for wf_result in wf_results],
+                                         ignore_index=True, sort=False)
+    all_results['Test'] = pd.concat([wf_result.test for wf_result in wf_results],
+                                    ignore_index=True, sort=False)
+    return generate_text_table_strategy(stake_currency, max_open_trades, all_results,
+                                        key_header='Period')
+
+
 def generate_edge_table(results: dict) -> str:
 
     floatfmt = ('s', '.10g', '.2f', '.2f', '.2f', '.2f', 'd', '.d')
@@ -242,3 +351,16 @@ def show_backtest_results(config: Dict, btdata: Dict[str, DataFrame],
         print(table)
         print('=' * len(table.splitlines()[0]))
         print('\nFor more details, please look at the detail tables above')
+
+
+def show_walk_forward_results(config: Dict, wf_results: List) -> None:
+    table = generate_text_table_walk_forward(config['stake_currency'], wf_results)
+    print(' WALK-FORWARD WINDOWS '.center(len(table.splitlines()[0]), '='))
+    print(table)
+    print()
+
+    table = generate_text_table_walk_forward_summary(config['stake_currency'],
+                                                     config['max_open_trades'], wf_results)
+    print(' WALK-FORWARD SUMMARY '.center(len(table.splitlines()[0]), '='))
+    print(table)
+    print('=' * len(table.splitlines()[0]))
@@ -0,0 +1,172 @@
+# pragma pylint: disable=missing-docstring, W0212, too-many-arguments
+
+"""
+This module contains the walk-forward analysis logic
+"""
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import arrow
+from pandas import DataFrame
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data import history
+from freqtrade.data.converter import trim_dataframe
+from freqtrade.exceptions import OperationalException
+from freqtrade.misc import fork_map
+from freqtrade.optimize.backtesting import Backtesting, BacktestResult
+from freqtrade.optimize.optimize_reports import show_walk_forward_results
+
+logger = logging.getLogger(__name__)
+
+
+class WalkForwardWindow(NamedTuple):
+    """
+    NamedTuple defining one walk-forward window.
+    The train period is None when walk-forward runs without train period (rolling windows).
+    """
+    train: Optional[TimeRange]
+    test: TimeRange
+
+
+class WalkForwardResult(NamedTuple):
+    """
+    NamedTuple holding the backtest results of one walk-forward window.
+    """
+    window: WalkForwardWindow
+    train: DataFrame
+    test: DataFrame
+
+
+class WalkForward:
+    """
+    Walk-forward class, can be called with:
+
+    wf = WalkForward(config)
+    wf.start()
+
+    Analyzes the complete timerange once, then backtests the strategy on consecutive
+    (train, test) windows sliced from the analyzed data.
+    """
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.config = config
+        self.backtesting = Backtesting(self.config)
+        self.backtesting._set_strategy(self.backtesting.strategylist[0])
+
+        self.train_days = self.config.get('wf_train_days', 0)
+        self.test_days = self.config.get('wf_test_days', 0)
+        if not self.test_days:
+            raise OperationalException(
+                "Walk-forward requires the length of the test period. "
+                "Please use `--wf-test-days` or set `wf_test_days` in the configuration.")
+        self.step_days = self.config.get('wf_step_days') or self.test_days
+
+    def get_windows(self, min_date: arrow.Arrow,
+                    max_date: arrow.Arrow) -> List[WalkForwardWindow]:
+        """
+        Split the timerange from min_date to max_date into walk-forward windows.
+        Periods don't overlap inside one window, the last window ends with the last candle.
+        :param min_date: First candle date of the analyzed data
+        :param max_date: Last candle date of the analyzed data
+        :return: List of windows, ordered by date
+        """
+        windows = []
+        start = min_date.datetime
+        train_length = timedelta(days=self.train_days)
+        test_length = timedelta(days=self.test_days)
+        # Date right after the last candle
+        end = max_date.datetime + timedelta(minutes=self.backtesting.timeframe_min)
+        while start + train_length + test_length <= end:
+            test_start = start + train_length
+            test_stop = test_start + test_length
+            train = None
+            if self.train_days:
+                # Stop is inclusive for trim_dataframe, so stop one second before the next period
+                train = TimeRange('date', 'date', int(start.timestamp()),
+                                  int(test_start.timestamp()) - 1)
+            test = TimeRange('date', 'date', int(test_start.timestamp()),
+                             int(test_stop.timestamp()) - 1)
+            windows.append(WalkForwardWindow(train=train, test=test))
+            start += timedelta(days=self.step_days)
+        return windows
+
+    def backtest_period(self, preprocessed: Dict[str, DataFrame],
+                        timerange: Optional[TimeRange], max_open_trades: int,
+                        position_stacking: bool) -> DataFrame:
+        """
+        Backtest one period of a window on the analyzed data.
+        :param preprocessed: Dict of analyzed dataframes, covering the complete timerange
+        :param timerange: Period to backtest. None results in an empty result
+        :return: DataFrame with trades (results of backtesting)
+        """
+        processed = {}
+        if timerange is not None:
+            for pair, df in preprocessed.items():
+                pair_data = trim_dataframe(df, timerange)
+                if not pair_data.empty:
+                    processed[pair] = pair_data
+        if not processed:
+            return DataFrame(columns=BacktestResult._fields)
+
+        min_date, max_date = history.get_timerange(processed)
+        return self.backtesting.backtest(
+            processed=processed,
+            stake_amount=self.config['stake_amount'],
+            start_date=min_date,
+            end_date=max_date,
+            max_open_trades=max_open_trades,
+            position_stacking=position_stacking,
+        )
+
+    def backtest_window(self, preprocessed: Dict[str, DataFrame], window: WalkForwardWindow,
+                        max_open_trades: int, position_stacking: bool) -> WalkForwardResult:
+        return WalkForwardResult(
+            window=window,
+            train=self.backtest_period(preprocessed, window.train,
+                                       max_open_trades, position_stacking),
+            test=self.backtest_period(preprocessed, window.test,
+                                      max_open_trades, position_stacking),
+        )
+
+    def start(self) -> None:
+        """
+        Run walk-forward analysis end-to-end
+        :return: None
+        """
+        logger.info('Using stake_currency: %s ...', self.config['stake_currency'])
+        logger.info('Using stake_amount: %s ...', self.config['stake_amount'])
+
+        if self.config.get('use_max_market_positions', True):
+            max_open_trades = self.config['max_open_trades']
+        else:
+            logger.info('Ignoring max_open_trades (--disable-max-market-positions was used) ...')
+            max_open_trades = 0
+        position_stacking = self.config.get('position_stacking', False)
+
+        data, timerange = self.backtesting.load_bt_data()
+
+        # Populate indicators once for the complete timerange, windows are sliced from it
+        preprocessed = self.backtesting.strategy.ohlcvdata_to_dataframe(data)
+        for pair, df in preprocessed.items():
+            preprocessed[pair] = trim_dataframe(df, timerange)
+        min_date, max_date = history.get_timerange(preprocessed)
+
+        windows = self.get_windows(min_date, max_date)
+        if not windows:
+            raise OperationalException(
+                f"Not enough data for one walk-forward window of {self.train_days} train days "
+                f"and {self.test_days} test days. "
+                f"Data only covers {(max_date - min_date).days} days.")
+        logger.info('Running walk-forward analysis on %s windows from %s up to %s ..',
+                    len(windows), min_date.isoformat(), max_date.isoformat())
+
+        # Workers are forked after indicators are populated, so they inherit the
+        # analyzed data (copy-on-write) instead of receiving a pickled copy per window.
+        results = fork_map(
+            lambda idx: self.backtest_window(preprocessed, windows[idx], max_open_trades,
+                                             position_stacking),
+            range(len(windows)), self.config.get('wf_jobs', 1), 'walk-forward')
+
+        show_walk_forward_results(self.config, results)
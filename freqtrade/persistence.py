@@ -4,7 +4,7 @@ This module contains the class to persist trades into SQLite
 import logging
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import arrow
 from sqlalchemy import (Boolean, Column, DateTime, Float, Integer, String,
@@ -570,3 +570,138 @@ class Trade(_DECL_BASE):
                 trade.stop_loss = None
                 trade.adjust_stop_loss(trade.open_rate, desired_stoploss)
                 logger.info(f"New stoploss: {trade.stop_loss}.")
+
+
+_SPLITTER = 134217729.0  # 2**27 + 1, used to split a float into two 26-bit halves
+
+
+def _two_product(a: float, b: float) -> Tuple[float, float]:
+    """
+    Error-free float multiplication (Dekker / Veltkamp).
+    :return: tuple (product, error) so that product + error == a * b exactly
+    """
+    product = a * b
+    t = _SPLITTER * a
+    a_hi = t - (t - a)
+    a_lo = a - a_hi
+    t = _SPLITTER * b
+    b_hi = t - (t - b)
+    b_lo = b - b_hi
+    return product, ((a_hi * b_hi - product) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+
+
+def _calc_trade_price(amount: float, rate: float, fee: float) -> float:
+    """
+    Calculates `amount * rate * (1 - fee)` in double-double precision, rounded to float once.
+    Gives the same result as the Decimal based calculation in `Trade`,
+    without having to convert every value to Decimal.
+    """
+    trade, trade_err = _two_product(amount, rate)
+    fees, fees_err = _two_product(trade, fee)
+    # Error-free subtraction (Knuth's TwoSum)
+    price = trade - fees
+    tmp = price - trade
+    price_err = (trade - (price - tmp)) + (-fees - tmp)
+    return price + (price_err + trade_err - fees_err - trade_err * fee)
+
+
+class BacktestTrade:
+    """
+    Lightweight, non-persisted trade used during backtesting and hyperopt.
+    Mirrors the attributes and methods of `Trade` used by `IStrategy.should_sell()`,
+    but uses `__slots__` and float arithmetic instead of SQLAlchemy columns and `Decimal`.
+    Profit calculations produce the same (rounded) results as `Trade`.
+    """
+    __slots__ = ('pair', 'open_rate', 'open_date', 'stake_amount', 'amount',
+                 'fee_open', 'fee_close', 'open_trade_price', 'close_rate',
+                 'stop_loss', 'stop_loss_pct', 'initial_stop_loss', 'initial_stop_loss_pct',
+                 'max_rate', 'min_rate', 'is_open')
+
+    def __init__(self, pair: str, open_rate: float, open_date: datetime, stake_amount: float,
+                 amount: float, fee_open: float, fee_close: float, is_open: bool = True):
+        self.pair = pair
+        self.open_rate = open_rate
+        self.open_date = open_date
+        self.stake_amount = stake_amount
+        self.amount = amount
+        self.fee_open = fee_open
+        self.fee_close = fee_close
+        self.is_open = is_open
+        self.close_rate: Optional[float] = None
+        self.stop_loss = 0.0
+        self.stop_loss_pct: Optional[float] = None
+        self.initial_stop_loss = 0.0
+        self.initial_stop_loss_pct: Optional[float] = None
+        self.max_rate = 0.0
+        self.min_rate: Optional[float] = None
+        self.open_trade_price = _calc_trade_price(amount, open_rate, -fee_open)
+
+    def __repr__(self):
+        return (f'BacktestTrade(pair={self.pair}, amount={self.amount:.8f}, '
+                f'open_rate={self.open_rate:.8f}, open_since={self.open_date})')
+
+    def adjust_min_max_rates(self, current_price: float) -> None:
+        """
+        Adjust the max_rate and min_rate.
+        """
+        self.max_rate = max(current_price, self.max_rate or self.open_rate)
+        self.min_rate = min(current_price, self.min_rate or self.open_rate)
+
+    def adjust_stop_loss(self, current_price: float, stoploss: float,
+                         initial: bool = False) -> None:
+        """
+        This adjusts the stop loss to it's most recently observed setting.
+        Same behaviour as `Trade.adjust_stop_loss()`, without logging.
+        """
+        if initial and self.stop_loss:
+            # Don't modify if called with initial and nothing to do
+            return
+
+        new_loss = float(current_price * (1 - abs(stoploss)))
+
+        # no stop loss assigned yet
+        if not self.stop_loss:
+            self.stop_loss = new_loss
+            self.stop_loss_pct = -1 * abs(stoploss)
+            self.initial_stop_loss = new_loss
+            self.initial_stop_loss_pct = -1 * abs(stoploss)
+        # stop losses only walk up, never down!
+        elif new_loss > self.stop_loss:
+            self.stop_loss = new_loss
+            self.stop_loss_pct = -1 * abs(stoploss)
+
+    def calc_close_trade_price(self, rate: Optional[float] = None,
+                               fee: Optional[float] = None) -> float:
+        """
+        Calculate the close_rate including fee
+        :param fee: fee to use on the close rate (optional).
+        :param rate: rate to compare with (optional).
+        :return: Price in BTC of the open trade
+        """
+        if rate is None and not self.close_rate:
+            return 0.0
+
+        return _calc_trade_price(self.amount, rate or self.close_rate or 0.0,
+                                 fee or self.fee_close)
+
+    def calc_profit(self, rate: Optional[float] = None,
+                    fee: Optional[float] = None) -> float:
+        """
+        Calculate the absolute profit in stake currency between Close and Open trade
+        :param fee: fee to use on the close rate (optional).
+        :param rate: close rate to compare with (optional).
+        :return:  profit in stake currency as float
+        """
+        profit = self.calc_close_trade_price(rate, fee) - self.open_trade_price
+        return float(f"{profit:.8f}")
+
+    def calc_profit_ratio(self, rate: Optional[float] = None,
+                          fee: Optional[float] = None) -> float:
+        """
+        Calculates the profit as ratio (including fee).
+        :param rate: rate to compare with (optional).
+        :param fee: fee to use on the close rate (optional).
+        :return: profit ratio as float
+        """
+        profit_ratio = (self.calc_close_trade_price(rate, fee) / self.open_trade_price) - 1
+        return float(f"{profit_ratio:.8f}")
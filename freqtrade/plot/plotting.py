@@ -53,16 +53,28 @@ def init_plotscript(config):
     no_trades = False
     if config.get('no_trades', False):
         no_trades = True
-    elif not config['exportfilename'].is_file() and config['trade_source'] == 'file':
+    elif not config['exportfilename'].exists() and config['trade_source'] == 'file':
         logger.warning("Backtest file is missing skipping trades.")
         no_trades = True
 
+    strategy = config.get('strategy')
+    if (not no_trades and config['trade_source'] == 'file' and strategy
+            and config['exportfilename'].is_dir()):
+        logger.info(f"Using backtest results of strategy {strategy}.")
     trades = load_trades(
         config['trade_source'],
         db_url=config.get('db_url'),
         exportfilename=config.get('exportfilename'),
-        no_trades=no_trades
+        no_trades=no_trades,
+        strategy=strategy,
+        pairs=pairs,
     )
+    # Parquet exports contain the trades of all backtested strategies
+    if 'strategy' in trades and trades['strategy'].nunique() > 1:
+        raise OperationalException(
+            "Backtest results contain trades of multiple strategies "
+            f"({', '.join(sorted(trades['strategy'].unique()))}). "
+            "Please select one using `--strategy`.")
     trades = trim_dataframe(trades, timerange, 'open_time')
 
     return {"ohlcv": data,
@@ -29,6 +29,27 @@ class StrategyResolver(IResolver):
     user_subdir = USERPATH_STRATEGIES
     initial_search_path = None
 
+    # Strategy attributes which can be overridden by the configuration
+    #                       (Attribute name,                    default,     ask_strategy)
+    override_attributes = [("minimal_roi",                     {"0": 10.0}, False),
+                           ("ticker_interval",                 None,        False),
+                           ("stoploss",                        None,        False),
+                           ("trailing_stop",                   None,        False),
+                           ("trailing_stop_positive",          None,        False),
+                           ("trailing_stop_positive_offset",   0.0,         False),
+                           ("trailing_only_offset_is_reached", None,        False),
+                           ("process_only_new_candles",        None,        False),
+                           ("order_types",                     None,        False),
+                           ("order_time_in_force",             None,        False),
+                           ("stake_currency",                  None,        False),
+                           ("stake_amount",                    None,        False),
+                           ("startup_candle_count",            None,        False),
+                           ("unfilledtimeout",                 None,        False),
+                           ("use_sell_signal",                 True,        True),
+                           ("sell_profit_only",                False,       True),
+                           ("ignore_roi_if_buy_signal",        False,       True),
+                           ]
+
     @staticmethod
     def load_strategy(config: Dict[str, Any] = None) -> IStrategy:
         """
@@ -52,25 +73,7 @@ class StrategyResolver(IResolver):
 
         # Set attributes
         # Check if we need to override configuration
-        #             (Attribute name,                    default,     ask_strategy)
-        attributes = [("minimal_roi",                     {"0": 10.0}, False),
-                      ("ticker_interval",                 None,        False),
-                      ("stoploss",                        None,        False),
-                      ("trailing_stop",                   None,        False),
-                      ("trailing_stop_positive",          None,        False),
-                      ("trailing_stop_positive_offset",   0.0,         False),
-                      ("trailing_only_offset_is_reached", None,        False),
-                      ("process_only_new_candles",        None,        False),
-                      ("order_types",                     None,        False),
-                      ("order_time_in_force",             None,        False),
-                      ("stake_currency",                  None,        False),
-                      ("stake_amount",                    None,        False),
-                      ("startup_candle_count",            None,        False),
-                      ("unfilledtimeout",                 None,        False),
-                      ("use_sell_signal",                 True,        True),
-                      ("sell_profit_only",                False,       True),
-                      ("ignore_roi_if_buy_signal",        False,       True),
-                      ]
+        attributes = StrategyResolver.override_attributes
         for attribute, default, ask_strategy in attributes:
             if ask_strategy:
                 StrategyResolver._override_attribute_helper(strategy, config['ask_strategy'],
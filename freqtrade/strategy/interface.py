@@ -7,15 +7,16 @@ import warnings
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, NamedTuple, Optional, Tuple
+from typing import Dict, NamedTuple, Optional, Tuple, Union
 
 import arrow
 from pandas import DataFrame
 
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.data.indicator_cache import IndicatorCache
 from freqtrade.exceptions import StrategyError
 from freqtrade.exchange import timeframe_to_minutes
-from freqtrade.persistence import Trade
+from freqtrade.persistence import BacktestTrade, Trade
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.wallets import Wallets
@@ -351,8 +352,8 @@ class IStrategy(ABC):
         )
         return buy, sell
 
-    def should_sell(self, trade: Trade, rate: float, date: datetime, buy: bool,
-                    sell: bool, low: float = None, high: float = None,
+    def should_sell(self, trade: Union[Trade, BacktestTrade], rate: float, date: datetime,
+                    buy: bool, sell: bool, low: float = None, high: float = None,
                     force_stoploss: float = 0) -> SellCheckTuple:
         """
         This function evaluates if one of the conditions required to trigger a sell
@@ -410,7 +411,7 @@ class IStrategy(ABC):
         # logger.debug(f"{trade.pair} - No sell signal. sell_flag=False")
         return SellCheckTuple(sell_flag=False, sell_type=SellType.NONE)
 
-    def stop_loss_reached(self, current_rate: float, trade: Trade,
+    def stop_loss_reached(self, current_rate: float, trade: Union[Trade, BacktestTrade],
                           current_time: datetime, current_profit: float,
                           force_stoploss: float, high: float = None) -> SellCheckTuple:
         """
@@ -477,7 +478,8 @@ class IStrategy(ABC):
         roi_entry = max(roi_list)
         return roi_entry, self.minimal_roi[roi_entry]
 
-    def min_roi_reached(self, trade: Trade, current_profit: float, current_time: datetime) -> bool:
+    def min_roi_reached(self, trade: Union[Trade, BacktestTrade], current_profit: float,
+                        current_time: datetime) -> bool:
         """
         Based on trade duration, current profit of the trade and ROI configuration,
         decides whether bot should sell.
@@ -499,7 +501,10 @@ class IStrategy(ABC):
         Using .copy() to get a fresh copy of the dataframe for every strategy run.
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
+        Uses the on-disk indicator cache if `indicator_cache` is enabled.
         """
+        if self.config.get('indicator_cache', False):
+            return IndicatorCache(self.config).populate_indicators(self, data)
         return {pair: self.advise_indicators(pair_data.copy(), {'pair': pair})
                 for pair, pair_data in data.items()}
 
@@ -1,14 +1,15 @@
 # pragma pylint: disable=missing-docstring, invalid-name, pointless-string-statement
 
 # --- Do not remove these libs ---
-from functools import reduce
-from typing import Any, Callable, Dict, List
+from functools import reduce  # noqa
+from typing import Any, Callable, Dict, List  # noqa
 
 import numpy as np  # noqa
 import pandas as pd  # noqa
 from pandas import DataFrame
 from skopt.space import Categorical, Dimension, Integer, Real  # noqa
 
+from freqtrade.optimize.hyperopt_conditions import Condition
 from freqtrade.optimize.hyperopt_interface import IHyperOpt
 
 # --------------------------------
@@ -32,7 +33,9 @@ class SampleHyperOpt(IHyperOpt):
     `freqtrade new-hyperopt --hyperopt MyCoolHyperopt`.
 
     You must keep:
-    - The prototypes for the methods: populate_indicators, indicator_space, buy_strategy_generator.
+    - The prototypes for the methods: populate_indicators, indicator_space, buy_conditions.
+    Hyperopts which can't express their buy / sell signals as conditions can implement
+    buy_strategy_generator / sell_strategy_generator instead.
 
     The methods roi_space, generate_roi_table and stoploss_space are not required
     and are provided by default.
@@ -45,50 +48,37 @@ class SampleHyperOpt(IHyperOpt):
     """
 
     @staticmethod
-    def buy_strategy_generator(params: Dict[str, Any]) -> Callable:
+    def buy_conditions(params: Dict[str, Any]) -> List[Condition]:
         """
-        Define the buy strategy parameters to be used by Hyperopt.
+        Define the buy conditions Hyperopt will evaluate, from the buy strategy parameters.
+        Conditions are evaluated on NumPy arrays, which is a lot faster than populating
+        dataframes in buy_strategy_generator().
         """
-        def populate_buy_trend(dataframe: DataFrame, metadata: dict) -> DataFrame:
-            """
-            Buy strategy Hyperopt will build and use.
-            """
-            conditions = []
-
-            # GUARDS AND TRENDS
-            if 'mfi-enabled' in params and params['mfi-enabled']:
-                conditions.append(dataframe['mfi'] < params['mfi-value'])
-            if 'fastd-enabled' in params and params['fastd-enabled']:
-                conditions.append(dataframe['fastd'] < params['fastd-value'])
-            if 'adx-enabled' in params and params['adx-enabled']:
-                conditions.append(dataframe['adx'] > params['adx-value'])
-            if 'rsi-enabled' in params and params['rsi-enabled']:
-                conditions.append(dataframe['rsi'] < params['rsi-value'])
-
-            # TRIGGERS
-            if 'trigger' in params:
-                if params['trigger'] == 'bb_lower':
-                    conditions.append(dataframe['close'] < dataframe['bb_lowerband'])
-                if params['trigger'] == 'macd_cross_signal':
-                    conditions.append(qtpylib.crossed_above(
-                        dataframe['macd'], dataframe['macdsignal']
-                    ))
-                if params['trigger'] == 'sar_reversal':
-                    conditions.append(qtpylib.crossed_above(
-                        dataframe['close'], dataframe['sar']
-                    ))
-
-            # Check that volume is not 0
-            conditions.append(dataframe['volume'] > 0)
-
-            if conditions:
-                dataframe.loc[
-                    reduce(lambda x, y: x & y, conditions),
-                    'buy'] = 1
-
-            return dataframe
-
-        return populate_buy_trend
+        conditions = []
+
+        # GUARDS AND TRENDS
+        if 'mfi-enabled' in params and params['mfi-enabled']:
+            conditions.append(Condition('mfi', '<', params['mfi-value']))
+        if 'fastd-enabled' in params and params['fastd-enabled']:
+            conditions.append(Condition('fastd', '<', params['fastd-value']))
+        if 'adx-enabled' in params and params['adx-enabled']:
+            conditions.append(Condition('adx', '>', params['adx-value']))
+        if 'rsi-enabled' in params and params['rsi-enabled']:
+            conditions.append(Condition('rsi', '<', params['rsi-value']))
+
+        # TRIGGERS
+        if 'trigger' in params:
+            if params['trigger'] == 'bb_lower':
+                conditions.append(Condition('close', '<', 'bb_lowerband'))
+            if params['trigger'] == 'macd_cross_signal':
+                conditions.append(Condition('macd', 'crossed_above', 'macdsignal'))
+            if params['trigger'] == 'sar_reversal':
+                conditions.append(Condition('close', 'crossed_above', 'sar'))
+
+        # Check that volume is not 0
+        conditions.append(Condition('volume', '>', 0))
+
+        return conditions
 
     @staticmethod
     def indicator_space() -> List[Dimension]:
@@ -108,50 +98,35 @@ class SampleHyperOpt(IHyperOpt):
         ]
 
     @staticmethod
-    def sell_strategy_generator(params: Dict[str, Any]) -> Callable:
+    def sell_conditions(params: Dict[str, Any]) -> List[Condition]:
         """
-        Define the sell strategy parameters to be used by Hyperopt.
+        Define the sell conditions Hyperopt will evaluate, from the sell strategy parameters.
         """
-        def populate_sell_trend(dataframe: DataFrame, metadata: dict) -> DataFrame:
-            """
-            Sell strategy Hyperopt will build and use.
-            """
-            conditions = []
-
-            # GUARDS AND TRENDS
-            if 'sell-mfi-enabled' in params and params['sell-mfi-enabled']:
-                conditions.append(dataframe['mfi'] > params['sell-mfi-value'])
-            if 'sell-fastd-enabled' in params and params['sell-fastd-enabled']:
-                conditions.append(dataframe['fastd'] > params['sell-fastd-value'])
-            if 'sell-adx-enabled' in params and params['sell-adx-enabled']:
-                conditions.append(dataframe['adx'] < params['sell-adx-value'])
-            if 'sell-rsi-enabled' in params and params['sell-rsi-enabled']:
-                conditions.append(dataframe['rsi'] > params['sell-rsi-value'])
-
-            # TRIGGERS
-            if 'sell-trigger' in params:
-                if params['sell-trigger'] == 'sell-bb_upper':
-                    conditions.append(dataframe['close'] > dataframe['bb_upperband'])
-                if params['sell-trigger'] == 'sell-macd_cross_signal':
-                    conditions.append(qtpylib.crossed_above(
-                        dataframe['macdsignal'], dataframe['macd']
-                    ))
-                if params['sell-trigger'] == 'sell-sar_reversal':
-                    conditions.append(qtpylib.crossed_above(
-                        dataframe['sar'], dataframe['close']
-                    ))
-
-            # Check that volume is not 0
-            conditions.append(dataframe['volume'] > 0)
-
-            if conditions:
-                dataframe.loc[
-                    reduce(lambda x, y: x & y, conditions),
-                    'sell'] = 1
-
-            return dataframe
-
-        return populate_sell_trend
+        conditions = []
+
+        # GUARDS AND TRENDS
+        if 'sell-mfi-enabled' in params and params['sell-mfi-enabled']:
+            conditions.append(Condition('mfi', '>', params['sell-mfi-value']))
+        if 'sell-fastd-enabled' in params and params['sell-fastd-enabled']:
+            conditions.append(Condition('fastd', '>', params['sell-fastd-value']))
+        if 'sell-adx-enabled' in params and params['sell-adx-enabled']:
+            conditions.append(Condition('adx', '<', params['sell-adx-value']))
+        if 'sell-rsi-enabled' in params and params['sell-rsi-enabled']:
+            conditions.append(Condition('rsi', '>', params['sell-rsi-value']))
+
+        # TRIGGERS
+        if 'sell-trigger' in params:
+            if params['sell-trigger'] == 'sell-bb_upper':
+                conditions.append(Condition('close', '>', 'bb_upperband'))
+            if params['sell-trigger'] == 'sell-macd_cross_signal':
+                conditions.append(Condition('macdsignal', 'crossed_above', 'macd'))
+            if params['sell-trigger'] == 'sell-sar_reversal':
+                conditions.append(Condition('sar', 'crossed_above', 'close'))
+
+        # Check that volume is not 0
+        conditions.append(Condition('volume', '>', 0))
+
+        return conditions
 
     @staticmethod
     def sell_indicator_space() -> List[Dimension]:
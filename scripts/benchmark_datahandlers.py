@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading candle (OHLCV) data in the available data formats.
+
+Stores the same candles in each format in a temporary directory, then times loading them
+with load_data() - as backtesting does.
+Candles are either read from a data directory (in json format by default), or generated.
+
+Examples:
+    python scripts/benchmark_datahandlers.py --datadir user_data/data/binance -t 5m
+    python scripts/benchmark_datahandlers.py --synthetic-candles 1000000 --pairs A/B C/D -t 1m
+    python scripts/benchmark_datahandlers.py --synthetic-candles 2500000 -t 1m \
+        --timerange 20200101-20200108
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from pandas import DataFrame, date_range
+from tabulate import tabulate
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from freqtrade.configuration import TimeRange  # noqa: E402
+from freqtrade.constants import AVAILABLE_DATAHANDLERS  # noqa: E402
+from freqtrade.data.history import load_data  # noqa: E402
+from freqtrade.data.history.idatahandler import get_datahandler  # noqa: E402
+from freqtrade.exchange import timeframe_to_minutes  # noqa: E402
+
+
+def synthetic_candles(pairs: List[str], timeframe: str, candles: int) -> Dict[str, DataFrame]:
+    """
+    Random walk candles, ending now
+    """
+    rng = np.random.RandomState(42)
+    dates = date_range(end='now', periods=candles, tz='UTC',
+                       freq=f'{timeframe_to_minutes(timeframe)}min').floor('min')
+    data = {}
+    for pair in pairs:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, candles)))
+        open_ = np.append(close[0], close[:-1])
+        data[pair] = DataFrame({
+            'date': dates,
+            'open': open_,
+            'high': np.maximum(open_, close) * (1 + rng.uniform(0, 0.001, candles)),
+            'low': np.minimum(open_, close) * (1 - rng.uniform(0, 0.001, candles)),
+            'close': close,
+            'volume': rng.uniform(0, 1000, candles),
+        })
+    return data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--datadir', type=Path, help='Directory to read candles from.')
+    parser.add_argument('--data-format', default='json', choices=AVAILABLE_DATAHANDLERS,
+                        help='Format of the candles in datadir (default: %(default)s).')
+    parser.add_argument('-t', '--timeframe', default='5m')
+    parser.add_argument('-p', '--pairs', nargs='+',
+                        help='Pairs to load (default: all pairs in datadir).')
+    parser.add_argument('--synthetic-candles', type=int,
+                        help='Generate this number of candles per pair instead of '
+                             'reading datadir.')
+    parser.add_argument('--formats', nargs='+', default=AVAILABLE_DATAHANDLERS,
+                        choices=AVAILABLE_DATAHANDLERS,
+                        help='Formats to benchmark (default: all).')
+    parser.add_argument('--timerange', type=TimeRange.parse_timerange,
+                        help='Only load this timerange (e.g. 20200101-20200108).')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Loads per format, the fastest one counts (default: %(default)s).')
+    args = parser.parse_args()
+
+    if args.synthetic_candles:
+        data = synthetic_candles(args.pairs or ['BENCH/BTC'], args.timeframe,
+                                 args.synthetic_candles)
+    elif args.datadir:
+        pairs = args.pairs or get_datahandler(args.datadir, args.data_format).ohlcv_get_pairs(
+            args.datadir, args.timeframe)
+        data = load_data(args.datadir, args.timeframe, pairs, fill_up_missing=False,
+                         data_format=args.data_format)
+    else:
+        parser.error('Either --datadir or --synthetic-candles is required.')
+    if not data:
+        parser.error('No candles found.')
+    candles = sum(len(pair_data) for pair_data in data.values())
+    print(f"Loading {candles} candles of {len(data)} pairs ({args.timeframe}).")
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for data_format in args.formats:
+            datadir = Path(tmpdir) / data_format
+            datadir.mkdir()
+            handler = get_datahandler(datadir, data_format)
+            for pair, pair_data in data.items():
+                handler.ohlcv_store(pair, args.timeframe, pair_data)
+            size = sum(file.stat().st_size for file in datadir.iterdir())
+
+            durations = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                load_data(datadir, args.timeframe, list(data), timerange=args.timerange,
+                          fill_up_missing=False, data_format=data_format)
+                durations.append(time.perf_counter() - start)
+            rows.append([data_format, min(durations), size / 2 ** 20])
+
+    baseline = rows[0][1]
+    print(tabulate([[data_format, f'{duration:.3f}', f'{baseline / duration:.1f}x',
+                     f'{size:.1f}'] for data_format, duration, size in rows],
+                   headers=['Format', 'Load time (s)', f'Speedup vs {rows[0][0]}',
+                            'Size (MiB)'],
+                   disable_numparse=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -18,6 +18,7 @@ if readme_file.is_file():
 # Requirements used for submodules
 api = ['flask', 'flask-jwt-extended', 'flask-cors']
 plot = ['plotly>=4.0']
+parquet = ['pyarrow']
 hyperopt = [
     'scipy',
     'scikit-learn',
@@ -47,7 +48,7 @@ jupyter = [
     'nbconvert',
     ]
 
-all_extra = api + plot + develop + jupyter + hyperopt
+all_extra = api + plot + parquet + develop + jupyter + hyperopt
 
 setup(name='freqtrade',
       version=__version__,
@@ -90,6 +91,7 @@ setup(name='freqtrade',
           'api': api,
           'dev': all_extra,
           'plot': plot,
+          'parquet': parquet,
           'jupyter': jupyter,
           'hyperopt': hyperopt,
           'all': all_extra,
@@ -14,6 +14,8 @@ from freqtrade.commands import (start_convert_data, start_create_userdir,
                                 start_trading)
 from freqtrade.configuration import setup_utils_configuration
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt import MAX_LOSS, PRUNED_RESULTS_METRICS
+from freqtrade.optimize.hyperopt_store import HyperoptResultStore
 from freqtrade.state import RunMode
 from tests.conftest import (create_mock_trades, get_args, log_has, log_has_re,
                             patch_exchange,
@@ -728,11 +730,10 @@ def test_start_test_pairlist(mocker, caplog, tickers, default_conf, capsys):
     assert re.match("['ETH/BTC', 'TKN/BTC', 'BLK/BTC', 'LTC/BTC', 'XRP/BTC']", captured.out)
 
 
-def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
-    mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.load_previous_results',
-        MagicMock(return_value=hyperopt_results)
-    )
+def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results, tmpdir):
+    (Path(tmpdir) / 'hyperopt_results').mkdir()
+    HyperoptResultStore(
+        Path(tmpdir) / 'hyperopt_results' / 'hyperopt_results.sqlite').append(hyperopt_results)
 
     args = [
         "hyperopt-list",
@@ -740,6 +741,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -753,6 +755,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -767,6 +770,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -780,6 +784,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -796,6 +801,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -810,6 +816,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -825,6 +832,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -839,6 +847,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -853,6 +862,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -867,6 +877,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -882,6 +893,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -896,6 +908,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     assert all(x in captured.out
@@ -910,6 +923,7 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_list(pargs)
     captured = capsys.readouterr()
     log_has("CSV file created: test_file.csv", caplog)
@@ -919,17 +933,17 @@ def test_hyperopt_list(mocker, capsys, caplog, hyperopt_results):
     f.unlink()
 
 
-def test_hyperopt_show(mocker, capsys, hyperopt_results):
-    mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.load_previous_results',
-        MagicMock(return_value=hyperopt_results)
-    )
+def test_hyperopt_show(mocker, capsys, hyperopt_results, tmpdir):
+    (Path(tmpdir) / 'hyperopt_results').mkdir()
+    HyperoptResultStore(
+        Path(tmpdir) / 'hyperopt_results' / 'hyperopt_results.sqlite').append(hyperopt_results)
 
     args = [
         "hyperopt-show",
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_show(pargs)
     captured = capsys.readouterr()
     assert " 12/12" in captured.out
@@ -940,6 +954,7 @@ def test_hyperopt_show(mocker, capsys, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_show(pargs)
     captured = capsys.readouterr()
     assert " 10/12" in captured.out
@@ -950,6 +965,7 @@ def test_hyperopt_show(mocker, capsys, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_show(pargs)
     captured = capsys.readouterr()
     assert " 1/12" in captured.out
@@ -961,6 +977,7 @@ def test_hyperopt_show(mocker, capsys, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_show(pargs)
     captured = capsys.readouterr()
     assert " 5/12" in captured.out
@@ -972,6 +989,7 @@ def test_hyperopt_show(mocker, capsys, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     start_hyperopt_show(pargs)
     captured = capsys.readouterr()
     assert " 10/12" in captured.out
@@ -983,6 +1001,7 @@ def test_hyperopt_show(mocker, capsys, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     with pytest.raises(OperationalException,
                        match="The index of the epoch to show should be greater than -4."):
         start_hyperopt_show(pargs)
@@ -994,11 +1013,44 @@ def test_hyperopt_show(mocker, capsys, hyperopt_results):
     ]
     pargs = get_args(args)
     pargs['config'] = None
+    pargs['user_data_dir'] = str(tmpdir)
     with pytest.raises(OperationalException,
                        match="The index of the epoch to show should be less than 4."):
         start_hyperopt_show(pargs)
 
 
+def test_hyperopt_list_pruned(mocker, capsys, hyperopt_results, tmpdir):
+    # Epoch 10 was profitable on the shortened timerange, but got pruned
+    epoch = hyperopt_results[9]
+    epoch.update({'loss': MAX_LOSS, 'is_best': False, 'is_pruned': True,
+                  'rung_metrics': epoch['results_metrics'],
+                  'results_metrics': PRUNED_RESULTS_METRICS.copy(), 'total_profit': 0.0})
+    (Path(tmpdir) / 'hyperopt_results').mkdir()
+    HyperoptResultStore(
+        Path(tmpdir) / 'hyperopt_results' / 'hyperopt_results.sqlite').append(hyperopt_results)
+
+    pargs = get_args(["hyperopt-list", "--no-details"])
+    pargs['user_data_dir'] = str(tmpdir)
+    start_hyperopt_list(pargs)
+    captured = capsys.readouterr()
+    assert re.search(r" 10/12 \|.*\| +Pruned \|", captured.out)
+
+    for args in (["hyperopt-list", "--profitable", "--no-details"],
+                 ["hyperopt-list", "--min-total-profit", "0", "--no-details"]):
+        pargs = get_args(args)
+        pargs['user_data_dir'] = str(tmpdir)
+        start_hyperopt_list(pargs)
+        captured = capsys.readouterr()
+        assert " 2/12" in captured.out
+        assert " 10/12" not in captured.out
+
+    pargs = get_args(["hyperopt-show", "--profitable", "-n", "-1"])
+    pargs['user_data_dir'] = str(tmpdir)
+    start_hyperopt_show(pargs)
+    captured = capsys.readouterr()
+    assert " 2/12" in captured.out
+
+
 def test_convert_data(mocker, testdatadir):
     ohlcv_mock = mocker.patch("freqtrade.commands.data_commands.convert_ohlcv_format")
     trades_mock = mocker.patch("freqtrade.commands.data_commands.convert_trades_format")
@@ -15,6 +15,7 @@ from freqtrade.data.btanalysis import (BT_DATA_COLUMNS,
                                        load_backtest_data, load_trades,
                                        load_trades_from_db)
 from freqtrade.data.history import load_data, load_pair_history
+from freqtrade.exceptions import OperationalException
 from tests.conftest import create_mock_trades
 
 
@@ -34,6 +35,25 @@ def test_load_backtest_data(testdatadir):
         load_backtest_data(str("filename") + "nofile")
 
 
+def test_load_backtest_data_filtered(testdatadir):
+    filename = testdatadir / "backtest-result_test.json"
+    bt_data = load_backtest_data(filename)
+
+    bt_data2 = load_backtest_data(filename, pairs=['ETH/BTC', 'ADA/BTC'])
+    assert set(bt_data2['pair'].unique()) == {'ETH/BTC', 'ADA/BTC'}
+    assert len(bt_data2) == len(bt_data.loc[bt_data['pair'].isin(['ETH/BTC', 'ADA/BTC'])])
+
+    bt_data2 = load_backtest_data(filename, columns=['pair', 'close_time'])
+    assert list(bt_data2.columns) == ['pair', 'close_time']
+    assert bt_data2['close_time'].equals(bt_data['close_time'])
+
+
+def test_load_backtest_data_parquet_no_pyarrow(mocker, tmpdir):
+    mocker.patch.dict('sys.modules', {'pyarrow': None})
+    with pytest.raises(OperationalException, match=r'.*Please install pyarrow.*'):
+        load_backtest_data(Path(tmpdir))
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_load_trades_from_db(default_conf, fee, mocker):
 
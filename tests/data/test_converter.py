@@ -1,5 +1,9 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
+from pathlib import Path
+from shutil import copyfile
+
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.data.converter import (convert_ohlcv_format,
@@ -291,3 +295,20 @@ def test_convert_ohlcv_format(mocker, default_conf, testdatadir):
         file1_new.unlink()
     if file2_new.exists():
         file2_new.unlink()
+
+
+def test_convert_ohlcv_format_feather(default_conf, testdatadir, tmpdir):
+    tmpdir = Path(tmpdir)
+    copyfile(testdatadir / "XRP_ETH-5m.json", tmpdir / "XRP_ETH-5m.json")
+    default_conf['datadir'] = tmpdir
+    default_conf['timeframes'] = ['5m']
+
+    convert_ohlcv_format(default_conf, convert_from='json', convert_to='feather', erase=True)
+    assert (tmpdir / "XRP_ETH-5m.feather").exists()
+    assert not (tmpdir / "XRP_ETH-5m.json").exists()
+
+    data = load_data(datadir=tmpdir, pairs=['XRP/ETH'], timeframe='5m',
+                     data_format='feather', fill_up_missing=False)
+    expected = load_data(datadir=testdatadir, pairs=['XRP/ETH'], timeframe='5m',
+                         fill_up_missing=False)
+    assert_frame_equal(data['XRP/ETH'], expected['XRP/ETH'])
@@ -1,9 +1,12 @@
+from datetime import timedelta
 from unittest.mock import MagicMock
 
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
 import pytest
 
+from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.data.history import load_pair_history
 from freqtrade.pairlist.pairlistmanager import PairListManager
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.state import RunMode
@@ -50,6 +53,39 @@ def test_historic_ohlcv(mocker, default_conf, ohlcv_history):
     assert historymock.call_count == 1
     assert historymock.call_args_list[0][1]["timeframe"] == "5m"
 
+    # Data is kept in memory
+    assert dp.historic_ohlcv("UNITTEST/BTC", "5m").equals(data)
+    assert historymock.call_count == 1
+    assert dp.historic_ohlcv("UNITTEST/BTC", "5m") is not ohlcv_history
+    assert dp.historic_ohlcv("UNITTEST/BTC", "5m", copy=False) is ohlcv_history
+
+    dp.historic_ohlcv("UNITTEST/BTC", "1h")
+    assert historymock.call_count == 2
+
+    # Partial loads are kept separately, per timerange
+    timerange = TimeRange.parse_timerange('20180110-20180112')
+    dp.historic_ohlcv("UNITTEST/BTC", "5m", timerange=timerange)
+    assert historymock.call_count == 3
+    assert historymock.call_args_list[2][1]["timerange"] == timerange
+    dp.historic_ohlcv("UNITTEST/BTC", "5m",
+                      timerange=TimeRange.parse_timerange('20180110-20180112'))
+    assert historymock.call_count == 3
+    assert dp.historic_ohlcv("UNITTEST/BTC", "5m", copy=False) is ohlcv_history
+    assert historymock.call_count == 3
+
+
+def test_preload_historic_ohlcv(mocker, default_conf, ohlcv_history):
+    historymock = MagicMock(return_value=ohlcv_history)
+    mocker.patch("freqtrade.data.dataprovider.load_pair_history", historymock)
+
+    dp = DataProvider(default_conf, None)
+    dp.preload_historic_ohlcv([("UNITTEST/BTC", "5m"), ("ETH/BTC", "1h")])
+    assert historymock.call_count == 2
+
+    dp.get_pair_dataframe("UNITTEST/BTC", "5m")
+    dp.get_pair_dataframe("ETH/BTC", "1h")
+    assert historymock.call_count == 2
+
 
 def test_get_pair_dataframe(mocker, default_conf, ohlcv_history):
     default_conf["runmode"] = RunMode.DRY_RUN
@@ -85,6 +121,56 @@ def test_get_pair_dataframe(mocker, default_conf, ohlcv_history):
     # assert dp.get_pair_dataframe("NONESENSE/AAA", ticker_interval).empty
 
 
+def test_merge_informative(mocker, default_conf, testdatadir):
+    default_conf.update({"runmode": RunMode.BACKTEST, "datadir": testdatadir,
+                         "ticker_interval": "5m"})
+    dp = DataProvider(default_conf, None)
+    dataframe = load_pair_history("UNITTEST/BTC", "5m", testdatadir)
+    align_mock = mocker.spy(dp, "_align_informative")
+
+    result = dp.merge_informative(dataframe, "UNITTEST/BTC", "30m")
+    assert "close_30m" in result.columns
+    assert "date_30m" in result.columns
+    assert len(result) == len(dataframe)
+    assert "close_30m" not in dataframe.columns
+    # Only complete informative candles are merged
+    assert (result["date_30m"].dropna() + timedelta(minutes=30)
+            <= result.loc[result["date_30m"].notnull(), "date"] + timedelta(minutes=5)).all()
+    # 5m candle 05:25 closes together with the 30m candle 05:00
+    result = result.set_index("date")
+    assert result.at[Timestamp("2018-01-10 05:20", tz="UTC"), "date_30m"] == \
+        Timestamp("2018-01-10 04:30", tz="UTC")
+    assert result.at[Timestamp("2018-01-10 05:25", tz="UTC"), "date_30m"] == \
+        Timestamp("2018-01-10 05:00", tz="UTC")
+    assert result.at[Timestamp("2018-01-10 05:50", tz="UTC"), "close_30m"] == \
+        result.at[Timestamp("2018-01-10 05:25", tz="UTC"), "close"]
+
+    # Alignment is memoized
+    result2 = dp.merge_informative(dataframe, "UNITTEST/BTC", "30m")
+    assert align_mock.call_count == 1
+    assert result2.set_index("date").equals(result)
+
+    result = dp.merge_informative(dataframe, "UNITTEST/BTC", "30m", ffill=False)
+    assert align_mock.call_count == 1
+    assert result["close_30m"].isnull().sum() > 0
+    merged = result.loc[result["close_30m"].notnull()]
+    assert ((merged["date_30m"] + timedelta(minutes=25)) == merged["date"]).all()
+
+    # Different date range is aligned again
+    dp.merge_informative(dataframe.iloc[10:], "UNITTEST/BTC", "30m")
+    assert align_mock.call_count == 2
+
+    # Live data is not memoized
+    default_conf["runmode"] = RunMode.DRY_RUN
+    exchange = MagicMock()
+    informative = load_pair_history("UNITTEST/BTC", "30m", testdatadir)
+    exchange.klines = MagicMock(return_value=informative)
+    dp = DataProvider(default_conf, exchange)
+    result = dp.merge_informative(dataframe, "UNITTEST/BTC", "30m")
+    assert result["close_30m"].notnull().any()
+    assert dp._informative_alignments == {}
+
+
 def test_available_pairs(mocker, default_conf, ohlcv_history):
     exchange = get_patched_exchange(mocker, default_conf)
     ticker_interval = default_conf["ticker_interval"]
@@ -18,10 +18,12 @@ from freqtrade.data.history.history_utils import (
     _load_cached_data_for_updating, convert_trades_to_ohlcv, get_timerange,
     load_data, load_pair_history, refresh_backtest_ohlcv_data,
     refresh_backtest_trades_data, refresh_data, validate_backtest_data)
+from freqtrade.data.history.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.idatahandler import (IDataHandler, get_datahandler,
                                                  get_datahandlerclass)
 from freqtrade.data.history.jsondatahandler import (JsonDataHandler,
                                                     JsonGzDataHandler)
+from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import file_dump_json
 from freqtrade.resolvers import StrategyResolver
@@ -658,6 +660,87 @@ def test_jsondatahandler_trades_append(testdatadir):
         dh.trades_append('UNITTEST/ETH', [])
 
 
+def test_featherdatahandler_ohlcv(testdatadir, tmpdir):
+    tmpdir = Path(tmpdir)
+    expected = JsonDataHandler(testdatadir).ohlcv_load('UNITTEST/BTC', '5m')
+    dh = FeatherDataHandler(tmpdir)
+    assert dh.ohlcv_load('UNITTEST/BTC', '5m', warn_no_data=False).empty
+
+    dh.ohlcv_store('UNITTEST/BTC', '5m', expected)
+    assert (tmpdir / 'UNITTEST_BTC-5m.feather').exists()
+    assert dh.ohlcv_get_pairs(tmpdir, '5m') == ['UNITTEST/BTC']
+    assert dh.ohlcv_get_pairs(tmpdir, '1m') == []
+
+    pairdata = dh.ohlcv_load('UNITTEST/BTC', '5m', drop_incomplete=False)
+    assert_frame_equal(pairdata, expected)
+    assert pairdata['date'].dtype == expected['date'].dtype
+    assert (pairdata.dtypes[1:] == 'float64').all()
+
+    timerange = TimeRange.parse_timerange('20180110-20180112')
+    assert_frame_equal(dh.ohlcv_load('UNITTEST/BTC', '5m', timerange=timerange),
+                       JsonDataHandler(testdatadir).ohlcv_load('UNITTEST/BTC', '5m',
+                                                               timerange=timerange))
+
+    assert dh.ohlcv_purge('UNITTEST/BTC', '5m')
+    assert not dh.ohlcv_purge('UNITTEST/BTC', '5m')
+    with pytest.raises(NotImplementedError):
+        dh.ohlcv_append('UNITTEST/BTC', '5m', DataFrame())
+
+
+@pytest.mark.parametrize('timerange,startup_candles', [
+    ('20180110-20180112', 0),
+    ('20180115-', 20),
+    ('-20180112', 0),
+    ('20180101-20180111', 20),
+    ('1515600300-1515600900', 0),
+    ('20180125-20180301', 20),
+    ('20180301-20180401', 0),
+])
+def test_featherdatahandler_ohlcv_timerange(testdatadir, tmpdir, caplog, timerange,
+                                            startup_candles):
+    tmpdir = Path(tmpdir)
+    timerange = TimeRange.parse_timerange(timerange)
+    jsondh = JsonDataHandler(testdatadir)
+    dh = FeatherDataHandler(tmpdir)
+    dh.ohlcv_store('UNITTEST/BTC', '5m',
+                   jsondh.ohlcv_load('UNITTEST/BTC', '5m', drop_incomplete=False))
+
+    expected = jsondh.ohlcv_load('UNITTEST/BTC', '5m', timerange=timerange,
+                                 startup_candles=startup_candles)
+    expected_log = caplog.record_tuples
+    caplog.clear()
+    pairdata = dh.ohlcv_load('UNITTEST/BTC', '5m', timerange=timerange,
+                             startup_candles=startup_candles)
+    assert_frame_equal(pairdata.reset_index(drop=True), expected.reset_index(drop=True),
+                       check_index_type=False)
+    assert caplog.record_tuples == expected_log
+
+    # Only the timerange is read, with one candle before and after it
+    assert len(dh._ohlcv_load('UNITTEST/BTC', '5m', timerange)) <= len(expected) + 2
+
+
+def test_featherdatahandler_trades(testdatadir, tmpdir):
+    tmpdir = Path(tmpdir)
+    expected = JsonGzDataHandler(testdatadir).trades_load('XRP/ETH')
+    dh = FeatherDataHandler(tmpdir)
+    assert dh.trades_load('XRP/ETH') == []
+
+    dh.trades_store('XRP/ETH', expected)
+    assert dh.trades_get_pairs(tmpdir) == ['XRP/ETH']
+    assert dh.trades_load('XRP/ETH') == expected
+
+    assert dh.trades_purge('XRP/ETH')
+    assert not dh.trades_purge('XRP/ETH')
+    with pytest.raises(NotImplementedError):
+        dh.trades_append('XRP/ETH', [])
+
+
+def test_featherdatahandler_no_pyarrow(mocker, testdatadir):
+    mocker.patch.dict('sys.modules', {'pyarrow': None})
+    with pytest.raises(OperationalException, match=r".*Please install pyarrow.*"):
+        get_datahandler(testdatadir, 'feather')
+
+
 def test_gethandlerclass():
     cl = get_datahandlerclass('json')
     assert cl == JsonDataHandler
@@ -666,6 +749,9 @@ def test_gethandlerclass():
     assert cl == JsonGzDataHandler
     assert issubclass(cl, IDataHandler)
     assert issubclass(cl, JsonDataHandler)
+    cl = get_datahandlerclass('feather')
+    assert cl == FeatherDataHandler
+    assert issubclass(cl, IDataHandler)
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass('DeadBeef')
 
@@ -0,0 +1,171 @@
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from freqtrade.configuration import TimeRange
+from freqtrade.data.history import load_data
+from freqtrade.data.indicator_cache import IndicatorCache
+from freqtrade.resolvers import StrategyResolver
+from freqtrade.strategy.interface import IStrategy
+from tests.conftest import log_has
+
+
+def _load_test_data(testdatadir, timerange='20180110-20180120'):
+    return load_data(testdatadir, '5m', ['UNITTEST/BTC', 'ETH/BTC'],
+                     timerange=TimeRange.parse_timerange(timerange))
+
+
+def test_ohlcvdata_to_dataframe_indicator_cache(mocker, default_conf, testdatadir, tmpdir,
+                                                caplog) -> None:
+    default_conf.update({'strategy': 'DefaultStrategy', 'indicator_cache': True,
+                         'user_data_dir': Path(tmpdir)})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    data = _load_test_data(testdatadir)
+
+    expected = strategy.ohlcvdata_to_dataframe(data)
+    assert log_has("Indicator cache: reused indicators for 0 of 2 pairs.", caplog)
+    assert len(list((Path(tmpdir) / 'indicator_cache').iterdir())) == 2
+
+    aimock = mocker.spy(IStrategy, 'advise_indicators')
+    cached = strategy.ohlcvdata_to_dataframe(data)
+    assert aimock.call_count == 0
+    assert log_has("Indicator cache: reused indicators for 2 of 2 pairs.", caplog)
+    for pair, df in expected.items():
+        pd.testing.assert_frame_equal(df, cached[pair])
+
+    # Different timerange -> different data, recalculated
+    strategy.ohlcvdata_to_dataframe(_load_test_data(testdatadir, '20180110-20180119'))
+    assert aimock.call_count == 2
+
+
+def test_indicator_cache_disabled(mocker, default_conf, testdatadir, tmpdir) -> None:
+    default_conf.update({'strategy': 'DefaultStrategy', 'user_data_dir': Path(tmpdir)})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    cachemock = mocker.patch('freqtrade.strategy.interface.IndicatorCache')
+
+    strategy.ohlcvdata_to_dataframe(_load_test_data(testdatadir))
+    assert cachemock.call_count == 0
+    assert not (Path(tmpdir) / 'indicator_cache').exists()
+
+
+def test_indicator_cache_strategy_fingerprint(default_conf) -> None:
+    default_conf.update({'strategy': 'DefaultStrategy'})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    fingerprint = IndicatorCache.strategy_fingerprint(strategy)
+    assert fingerprint == IndicatorCache.strategy_fingerprint(strategy)
+
+    # Hyperopt replacing populate_indicators
+    def populate_indicators(dataframe, metadata):
+        return dataframe
+
+    strategy.advise_indicators = populate_indicators
+    assert IndicatorCache.strategy_fingerprint(strategy) != fingerprint
+
+
+def test_indicator_cache_config_overrides(mocker, default_conf, testdatadir, tmpdir) -> None:
+    default_conf.update({'strategy': 'DefaultStrategy', 'indicator_cache': True,
+                         'user_data_dir': Path(tmpdir)})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    data = _load_test_data(testdatadir)
+    fingerprint = IndicatorCache.config_fingerprint(strategy)
+    strategy.ohlcvdata_to_dataframe(data)
+
+    # Strategy parameters overridden in the configuration
+    default_conf['startup_candle_count'] = 50
+    strategy = StrategyResolver.load_strategy(default_conf)
+    assert IndicatorCache.config_fingerprint(strategy) != fingerprint
+    aimock = mocker.spy(IStrategy, 'advise_indicators')
+    strategy.ohlcvdata_to_dataframe(data)
+    assert aimock.call_count == 2
+
+
+def test_indicator_cache_informative_pairs(mocker, default_conf, testdatadir, tmpdir) -> None:
+    default_conf.update({'strategy': 'DefaultStrategy', 'indicator_cache': True,
+                         'user_data_dir': Path(tmpdir)})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    informative = load_data(testdatadir, '5m', ['XLM/BTC'])['XLM/BTC']
+    dp = MagicMock(get_pair_dataframe=MagicMock(return_value=informative))
+    mocker.patch.object(strategy, 'dp', dp)
+    mocker.patch.object(strategy, 'informative_pairs', return_value=[('XLM/BTC', '5m')])
+    data = _load_test_data(testdatadir)
+
+    strategy.ohlcvdata_to_dataframe(data)
+    dp.get_pair_dataframe.assert_called_with('XLM/BTC', '5m', copy=False)
+    aimock = mocker.spy(IStrategy, 'advise_indicators')
+    strategy.ohlcvdata_to_dataframe(data)
+    assert aimock.call_count == 0
+
+    # Changed informative data -> recalculated
+    dp.get_pair_dataframe.return_value = informative.iloc[:-1]
+    strategy.ohlcvdata_to_dataframe(data)
+    assert aimock.call_count == 2
+
+
+_HELPER_STRATEGY = """
+from freqtrade.strategy.interface import IStrategy
+from indicator_cache_helpers import indicator
+
+
+class HelperStrategy(IStrategy):
+    minimal_roi = {"0": 0.1}
+    stoploss = -0.1
+    ticker_interval = '5m'
+
+    def populate_indicators(self, dataframe, metadata):
+        dataframe['indicator'] = indicator(dataframe)
+        return dataframe
+
+    def populate_buy_trend(self, dataframe, metadata):
+        return dataframe
+
+    def populate_sell_trend(self, dataframe, metadata):
+        return dataframe
+"""
+
+
+def test_indicator_cache_strategy_fingerprint_helper_module(default_conf, tmpdir,
+                                                            monkeypatch) -> None:
+    strategy_dir = Path(tmpdir)
+    (strategy_dir / 'helper_strategy.py').write_text(_HELPER_STRATEGY)
+    helper = strategy_dir / 'indicator_cache_helpers.py'
+    helper.write_text("def indicator(dataframe):\n    return dataframe['close'] * 2\n")
+    monkeypatch.syspath_prepend(str(strategy_dir))
+    monkeypatch.delitem(sys.modules, 'indicator_cache_helpers', raising=False)
+    default_conf.update({'strategy': 'HelperStrategy', 'strategy_path': str(strategy_dir)})
+
+    strategy = StrategyResolver.load_strategy(default_conf)
+    fingerprint = IndicatorCache.strategy_fingerprint(strategy)
+    assert IndicatorCache._imported_files(
+        [type(strategy).populate_indicators.__globals__], {strategy_dir.resolve()}
+    ) == [helper.resolve()]
+
+    # Changing the imported helper module changes the fingerprint
+    helper.write_text("def indicator(dataframe):\n    return dataframe['close'] * 3\n")
+    assert IndicatorCache.strategy_fingerprint(strategy) != fingerprint
+    monkeypatch.delitem(sys.modules, 'indicator_cache_helpers')
+
+
+def test_indicator_cache_evict(default_conf, testdatadir, tmpdir) -> None:
+    default_conf.update({'strategy': 'DefaultStrategy', 'user_data_dir': Path(tmpdir),
+                         'indicator_cache_size': 1})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    cache = IndicatorCache(default_conf)
+    cache_dir = Path(tmpdir) / 'indicator_cache'
+
+    cache.populate_indicators(strategy, _load_test_data(testdatadir))
+    files = sorted(cache_dir.iterdir())
+    assert len(files) == 2
+    size = sum(f.stat().st_size for f in files)
+    # Make the first file the least recently used one
+    os.utime(files[0], (1, 1))
+
+    cache._max_size = size - 1
+    cache.evict()
+    assert sorted(cache_dir.iterdir()) == files[1:]
+
+    cache._max_size = 0
+    cache.evict()
+    assert list(cache_dir.iterdir()) == []
@@ -3,16 +3,18 @@
 
 import logging
 import math
+import threading
 from unittest.mock import MagicMock
 
 import arrow
 import numpy as np
 import pytest
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade.exceptions import OperationalException
 from freqtrade.data.converter import ohlcv_to_dataframe
 from freqtrade.edge import Edge, PairInfo
+from freqtrade.resolvers import StrategyResolver
 from freqtrade.strategy.interface import SellType
 from tests.conftest import get_patched_freqtradebot, log_has
 from tests.optimize import (BTContainer, BTrade, _build_backtest_dataframe,
@@ -153,7 +155,7 @@ def test_edge_results(edge_conf, mocker, caplog, data) -> None:
     edge.fee = 0
 
     trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', [data.stop_loss])
-    results = edge._fill_calculable_fields(DataFrame(trades)) if trades else DataFrame()
+    results = edge._fill_calculable_fields(trades) if not trades.empty else DataFrame()
 
     assert len(trades) == len(data.trades)
 
@@ -167,6 +169,71 @@ def test_edge_results(edge_conf, mocker, caplog, data) -> None:
         assert res.close_time == _get_frame_time_from_offset(trade.close_tick).replace(tzinfo=None)
 
 
+def _find_trades_loop(df, stoploss):
+    """
+    Reference: search the trades of one stoploss candle by candle
+    """
+    trades = []
+    index = 0
+    while True:
+        buys = np.flatnonzero(df['buy'].values[index:-1] == 1)
+        if len(buys) == 0:
+            return trades
+        open_index = index + buys[0] + 1
+        stop_price = df['open'][open_index] * (stoploss + 1)
+        for exit_index in range(open_index, len(df)):
+            if df['low'][exit_index] < stop_price:
+                trades.append((open_index, exit_index, stop_price, SellType.STOP_LOSS))
+                break
+            if df['sell'][exit_index] == 1:
+                if exit_index + 1 == len(df):
+                    return trades
+                trades.append((open_index, exit_index + 1, df['open'][exit_index + 1],
+                               SellType.SELL_SIGNAL))
+                exit_index += 1
+                break
+        else:
+            return trades
+        index = exit_index
+
+
+@pytest.mark.parametrize("buy_ratio,sell_ratio", [(0.05, 0.05), (0.5, 0.02), (0.02, 0.5)])
+def test_find_trades_for_stoploss_range(mocker, edge_conf, buy_ratio, sell_ratio) -> None:
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    rng = np.random.RandomState(42)
+    close = np.exp(np.cumsum(rng.normal(0, 0.01, 1000)))
+    frame = DataFrame({
+        'date': to_datetime(np.arange(1000) * 3600, unit='s', utc=True),
+        'buy': (rng.rand(1000) < buy_ratio).astype(int),
+        'sell': (rng.rand(1000) < sell_ratio).astype(int),
+        'open': np.append(1.0, close[:-1]),
+        'close': close,
+    })
+    frame['low'] = np.minimum(frame['open'], frame['close']) * (1 - rng.rand(1000) * 0.02)
+    frame['high'] = np.maximum(frame['open'], frame['close'])
+
+    trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', edge._stoploss_range)
+    assert list(trades.columns) == ['pair', 'stoploss', 'open_time', 'close_time', 'open_index',
+                                    'close_index', 'open_rate', 'close_rate', 'exit_type']
+    assert (trades['pair'] == 'TEST/BTC').all()
+    # Trades are ordered by stoploss, then by open time
+    assert trades['stoploss'].unique().tolist() == [round(sl, 6) for sl in edge._stoploss_range]
+    for stoploss, sl_trades in trades.groupby('stoploss', sort=False):
+        expected = _find_trades_loop(frame, stoploss)
+        assert len(expected) > 0
+        assert sl_trades['open_index'].tolist() == [trade[0] for trade in expected]
+        assert sl_trades['close_index'].tolist() == [trade[1] for trade in expected]
+        assert sl_trades['close_rate'].tolist() == pytest.approx([trade[2] for trade in expected])
+        assert sl_trades['exit_type'].tolist() == [trade[3] for trade in expected]
+        assert (sl_trades['close_time'].values
+                == frame['date'].values[sl_trades['close_index']]).all()
+
+    # No buy signal
+    frame['buy'] = 0
+    assert edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', edge._stoploss_range).empty
+
+
 def test_adjust(mocker, edge_conf):
     freqtrade = get_patched_freqtradebot(mocker, edge_conf)
     edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
@@ -301,6 +368,220 @@ def test_edge_process_downloaded_data(mocker, edge_conf):
     assert edge._last_updated <= arrow.utcnow().timestamp + 2
 
 
+def test_edge_process_downloaded_data_jobs(mocker, edge_conf, caplog):
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
+    mocker.patch('freqtrade.edge.edge_positioning.refresh_data', MagicMock())
+    mocker.patch('freqtrade.edge.edge_positioning.load_data', mocked_load_data)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    assert edge.calculate()
+
+    edge_conf['edge']['jobs'] = 2
+    parallel_edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    assert parallel_edge.calculate()
+    assert DataFrame(parallel_edge._cached_pairs).equals(DataFrame(edge._cached_pairs))
+
+    mocker.patch('freqtrade.misc.multiprocessing.get_all_start_methods',
+                 MagicMock(return_value=['spawn']))
+    parallel_edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    assert parallel_edge.calculate()
+    assert DataFrame(parallel_edge._cached_pairs).equals(DataFrame(edge._cached_pairs))
+    assert log_has("Parallel Edge calculation requires the 'fork' start method, "
+                   "which is not available on this platform. "
+                   "Calculating one after another.", caplog)
+
+
+def test_edge_update(mocker, edge_conf, caplog):
+    history = mocked_load_data(None)
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
+    mocker.patch('freqtrade.edge.edge_positioning.refresh_data', MagicMock())
+    load_mock = mocker.patch('freqtrade.edge.edge_positioning.load_data',
+                             MagicMock(return_value={pair: candles.iloc[:400]
+                                                     for pair, candles in history.items()}))
+    refresh_mock = mocker.patch('freqtrade.exchange.Exchange.refresh_latest_ohlcv', MagicMock())
+    # The exchange's candle cache reaches back to the start of the history
+    mocker.patch('freqtrade.exchange.Exchange.klines',
+                 lambda _, pair_interval, copy=True: history[pair_interval[0]])
+    edge_conf['exchange']['pair_whitelist'] = list(history)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    # The calculation window includes all candles
+    edge._since_number_of_days = (arrow.utcnow() - tests_start_time).days + 1
+
+    assert edge.calculate()
+    assert load_mock.call_count == 1
+    assert len(edge._analyzed['NEO/BTC']) == 400
+    assert edge._update_thread is None
+    assert edge._update_strategy is None
+
+    # Next calculation adds the new candles in the background, with its own strategy
+    edge._last_updated = 0
+    assert edge.calculate()
+    edge._update_thread.join()
+    assert load_mock.call_count == 1
+    assert refresh_mock.call_args[0][0] == [('NEO/BTC', '5m'), ('LTC/BTC', '5m')]
+    assert edge._update_strategy is not freqtrade.strategy
+    assert edge._update_strategy.startup_candle_count == 20
+    assert len(edge._candles['NEO/BTC']) == len(history['NEO/BTC'])
+    assert len(edge._analyzed['NEO/BTC']) == len(history['NEO/BTC'])
+
+    # Same trades as when calculating from the whole history
+    full_edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    load_mock.return_value = history
+    assert full_edge.calculate()
+    for pair in history:
+        columns = ['stoploss', 'open_index', 'close_index', 'close_rate', 'exit_type']
+        trades = edge._trades[pair].sort_values(['stoploss', 'open_index'])[columns]
+        expected = full_edge._trades[pair].sort_values(['stoploss', 'open_index'])[columns]
+        assert len(trades) > 0
+        assert trades.reset_index(drop=True).equals(expected.reset_index(drop=True))
+    assert DataFrame(edge._cached_pairs).equals(DataFrame(full_edge._cached_pairs))
+
+    # Trades opened before the calculation window roll out, with the candles before
+    # the startup candles of the window
+    edge._last_updated = 0
+    edge._since_number_of_days = (arrow.utcnow() - tests_start_time.shift(days=15)).days
+    assert edge.calculate()
+    edge._update_thread.join()
+    analyzed = edge._analyzed['NEO/BTC']
+    window_start = analyzed['date'].searchsorted(
+        arrow.utcnow().shift(days=-edge._since_number_of_days).datetime)
+    assert window_start == edge._update_strategy.startup_candle_count
+    # Candles are kept for the indicators of the next update
+    assert edge._candles['NEO/BTC']['date'].equals(history['NEO/BTC']['date'])
+    trades = edge._trades['NEO/BTC']
+    assert (trades['open_index'] >= window_start).all()
+    assert (analyzed['date'].values[trades['open_index']] == trades['open_time'].values).all()
+    # Running statistics match the ones calculated from the remaining trades
+    remaining = full_edge._fill_calculable_fields(concat(edge._trades.values()))
+    expected = full_edge._process_expectancy(remaining)
+    assert list(edge._cached_pairs) == list(expected)
+    for pair, info in expected.items():
+        assert edge._cached_pairs[pair] == pytest.approx(info, nan_ok=True)
+
+    # Missing candles: Edge is calculated from history again
+    mocker.patch('freqtrade.exchange.Exchange.klines', MagicMock(return_value=DataFrame()))
+    edge._last_updated = 0
+    assert edge.calculate()
+    assert edge._update_thread.is_alive() is False
+    assert load_mock.call_count == 3
+    assert log_has('Candles of NEO/BTC since the last Edge calculation are missing, '
+                   'calculating Edge from history ...', caplog)
+
+
+def test_edge_update_indicator_window(mocker, edge_conf):
+    history = mocked_load_data(None)
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
+    mocker.patch('freqtrade.edge.edge_positioning.refresh_data', MagicMock())
+    mocker.patch('freqtrade.edge.edge_positioning.load_data',
+                 MagicMock(return_value={pair: candles.iloc[:400]
+                                         for pair, candles in history.items()}))
+    mocker.patch('freqtrade.exchange.Exchange.refresh_latest_ohlcv', MagicMock())
+    mocker.patch('freqtrade.exchange.Exchange.klines',
+                 lambda _, pair_interval, copy=True: history[pair_interval[0]].iloc[300:])
+    edge_conf['exchange']['pair_whitelist'] = list(history)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    edge._since_number_of_days = (arrow.utcnow() - tests_start_time).days + 1
+
+    assert edge.calculate()
+    edge._last_updated = 0
+    assert edge.calculate()
+    edge._update_thread.join()
+
+    # Signals of the new candles are the ones the bot gets from the candle cache,
+    # not only from the startup candles before them
+    strategy = freqtrade.strategy
+    assert strategy.startup_candle_count == 20
+    for pair in history:
+        metadata = {'pair': pair}
+        cached = history[pair].iloc[300:].reset_index(drop=True)
+        expected = strategy.advise_sell(strategy.advise_buy(
+            strategy.advise_indicators(cached, metadata), metadata), metadata)
+        analyzed = edge._analyzed[pair]
+        assert len(analyzed) == len(history[pair])
+        assert analyzed['sell'].iloc[400:].sum() > 0
+        for column in ['buy', 'sell']:
+            assert analyzed[column].iloc[400:].reset_index(drop=True).equals(
+                expected[column].iloc[100:].reset_index(drop=True))
+        assert len(edge._candles[pair]) >= len(cached)
+
+
+def test_edge_update_analyze(mocker, edge_conf):
+    history = mocked_load_data(None)
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
+    mocker.patch('freqtrade.edge.edge_positioning.refresh_data', MagicMock())
+    mocker.patch('freqtrade.edge.edge_positioning.load_data',
+                 MagicMock(return_value={pair: candles.iloc[:400]
+                                         for pair, candles in history.items()}))
+    mocker.patch('freqtrade.exchange.Exchange.refresh_latest_ohlcv', MagicMock())
+    mocker.patch('freqtrade.exchange.Exchange.klines',
+                 lambda _, pair_interval, copy=True: history[pair_interval[0]])
+    edge_conf['exchange']['pair_whitelist'] = list(history)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    edge._since_number_of_days = (arrow.utcnow() - tests_start_time).days + 1
+    assert edge.calculate()
+
+    # The update blocks in its analysis while the bot analyzes the same pair
+    update_strategy = StrategyResolver.load_strategy(edge_conf)
+    mocker.patch('freqtrade.edge.edge_positioning.StrategyResolver.load_strategy',
+                 MagicMock(return_value=update_strategy))
+    populate_indicators = update_strategy.populate_indicators
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_populate_indicators(dataframe, metadata):
+        started.set()
+        release.wait(10)
+        return populate_indicators(dataframe, metadata)
+
+    update_strategy.populate_indicators = blocking_populate_indicators
+    bot_threads = []
+    bot_populate_indicators = freqtrade.strategy.populate_indicators
+
+    def recording_populate_indicators(dataframe, metadata):
+        bot_threads.append(threading.current_thread())
+        return bot_populate_indicators(dataframe, metadata)
+
+    freqtrade.strategy.populate_indicators = recording_populate_indicators
+
+    edge._last_updated = 0
+    assert edge.calculate()
+    assert started.wait(10)
+    analyzed = freqtrade.strategy.analyze_ticker(history['NEO/BTC'].copy(), {'pair': 'NEO/BTC'})
+    release.set()
+    edge._update_thread.join()
+
+    assert bot_threads == [threading.current_thread()]
+    assert len(analyzed) == len(history['NEO/BTC'])
+    assert len(edge._analyzed['NEO/BTC']) == len(history['NEO/BTC'])
+    expected = freqtrade.strategy.advise_sell(freqtrade.strategy.advise_buy(
+        analyzed, {'pair': 'NEO/BTC'}), {'pair': 'NEO/BTC'})
+    for column in ['buy', 'sell']:
+        assert edge._analyzed['NEO/BTC'][column].equals(expected[column])
+
+
+def test_edge_update_running(mocker, edge_conf, caplog):
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    edge._update_thread = MagicMock(is_alive=MagicMock(return_value=True))
+    calculate_mock = mocker.patch('freqtrade.edge.Edge._calculate_from_history')
+
+    assert not edge.calculate()
+    assert calculate_mock.call_count == 0
+    assert log_has('Previous Edge update is still running ...', caplog)
+
+
+def test_edge_update_failed(mocker, edge_conf, caplog):
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    mocker.patch('freqtrade.edge.Edge._update_pair', MagicMock(side_effect=ValueError()))
+
+    edge._update({'NEO/BTC': DataFrame()})
+    assert log_has('Edge update failed.', caplog)
+
+
 def test_edge_process_no_data(mocker, edge_conf, caplog):
     freqtrade = get_patched_freqtradebot(mocker, edge_conf)
     mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
@@ -320,7 +601,8 @@ def test_edge_process_no_trades(mocker, edge_conf, caplog):
     mocker.patch('freqtrade.edge.edge_positioning.refresh_data', MagicMock())
     mocker.patch('freqtrade.edge.edge_positioning.load_data', mocked_load_data)
     # Return empty
-    mocker.patch('freqtrade.edge.Edge._find_trades_for_stoploss_range', MagicMock(return_value=[]))
+    mocker.patch('freqtrade.edge.Edge._find_trades_for_stoploss_range',
+                 MagicMock(return_value=DataFrame()))
     edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
 
     assert not edge.calculate()
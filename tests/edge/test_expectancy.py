@@ -0,0 +1,88 @@
+# pragma pylint: disable=missing-docstring, W0212, C0103
+import math
+
+import numpy as np
+import pytest
+
+from freqtrade.edge.expectancy import PairInfo, RunningExpectancy
+
+
+START = np.datetime64('2020-01-01T00:00:00', 'ns')
+
+
+def _times(count, start=0):
+    return START + np.arange(start, start + count) * np.timedelta64(5, 'm')
+
+
+def test_running_expectancy() -> None:
+    stats = RunningExpectancy(min_trade_number=2, max_trade_duration=100)
+    assert stats.pair_info(-0.01) is None
+
+    stats.add_trades(_times(3), np.array([0.002, -0.001, 0.0]), np.array([10, 20, 30]))
+    info = stats.pair_info(-0.01)
+    assert info == pytest.approx(PairInfo(-0.01, 1 / 3, 4.0, 2.0, 2 / 3, 3, 20.0))
+
+    # Trades lasting max_trade_duration or longer count for min_trade_number only
+    stats.add(_times(1, 3)[0], 0.01, 100)
+    assert stats.nb_all_trades == 4
+    assert stats.pair_info(-0.01) == info
+
+    # Same as adding the trades one by one
+    single = RunningExpectancy(min_trade_number=2, max_trade_duration=100)
+    for open_time, profit, duration in zip(_times(4), [0.002, -0.001, 0.0, 0.01],
+                                           [10, 20, 30, 100]):
+        single.add(open_time, profit, duration)
+    assert single.pair_info(-0.01) == info
+
+    # Trades opened before the given time expire
+    stats.expire(_times(1, 1)[0])
+    assert stats.nb_all_trades == 3
+    info = stats.pair_info(-0.01)
+    assert info.nb_trades == 2
+    # Average win is 0 / 0: risk reward ratio and expectancy are unknown (nan)
+    assert info.winrate == 0.0
+    assert math.isnan(info.risk_reward_ratio)
+    assert math.isinf(info.required_risk_reward)
+    assert math.isnan(info.expectancy)
+
+    # Without winning trades, the profit sum is exactly 0 again
+    stats.add(_times(1, 4)[0], 0.1 + 0.2, 10)
+    stats.add(_times(1, 5)[0], -0.3, 10)
+    stats.expire(_times(1, 5)[0])
+    assert stats.nb_win_trades == 0
+    assert stats.profit_sum == 0.0
+    assert stats.loss_sum == 0.3
+
+    stats.expire(_times(1, 10)[0])
+    assert stats.nb_all_trades == 0
+    assert (stats.nb_trades, stats.profit_sum, stats.loss_sum, stats.duration_sum) == (0, 0, 0, 0)
+    assert stats.pair_info(-0.01) is None
+
+
+def test_running_expectancy_no_loss() -> None:
+    stats = RunningExpectancy(min_trade_number=0)
+    stats.add_trades(_times(2), np.array([0.002, 0.004]), np.array([10, 20]))
+    info = stats.pair_info(-0.02)
+    # Average loss is 0 / 0: risk reward ratio and expectancy are unknown (nan)
+    assert info.winrate == 1.0
+    assert math.isnan(info.risk_reward_ratio)
+    assert info.required_risk_reward == 0.0
+    assert math.isnan(info.expectancy)
+
+    # Only trades longer than max_trade_duration
+    stats = RunningExpectancy(min_trade_number=0, max_trade_duration=5)
+    stats.add_trades(_times(2), np.array([0.002, 0.004]), np.array([10, 20]))
+    assert stats.pair_info(-0.02) is None
+
+
+@pytest.mark.parametrize("remove_pumps,nb_trades,risk_reward_ratio", [
+    (False, 12, 0.017 / 6 / 0.001),
+    (True, 11, 1.0),
+])
+def test_running_expectancy_remove_pumps(remove_pumps, nb_trades, risk_reward_ratio) -> None:
+    stats = RunningExpectancy(min_trade_number=10, remove_pumps=remove_pumps)
+    profits = np.array([0.001, -0.001] * 5 + [-0.001, 0.012])
+    stats.add_trades(_times(12), profits, np.full(12, 10))
+    info = stats.pair_info(-0.01)
+    assert info.nb_trades == nb_trades
+    assert info.risk_reward_ratio == pytest.approx(risk_reward_ratio)
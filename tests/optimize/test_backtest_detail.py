@@ -2,8 +2,11 @@
 import logging
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from freqtrade.data import history
 from freqtrade.data.history import get_timerange
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.strategy.interface import SellType
@@ -353,11 +356,13 @@ TESTS = [
 ]
 
 
+@pytest.mark.parametrize("engine", ['classic', 'columnar'])
 @pytest.mark.parametrize("data", TESTS)
-def test_backtest_results(default_conf, fee, mocker, caplog, data) -> None:
+def test_backtest_results(default_conf, fee, mocker, caplog, data, engine) -> None:
     """
     run functional tests
     """
+    default_conf["backtest_engine"] = engine
     default_conf["stoploss"] = data.stop_loss
     default_conf["minimal_roi"] = data.roi
     default_conf["ticker_interval"] = tests_timeframe
@@ -397,3 +402,228 @@ def test_backtest_results(default_conf, fee, mocker, caplog, data) -> None:
         assert res.sell_reason == trade.sell_reason
         assert res.open_time == _get_frame_time_from_offset(trade.open_tick)
         assert res.close_time == _get_frame_time_from_offset(trade.close_tick)
+
+
+def _multi_pair_signals(dataframe, metadata):
+    """
+    Deterministic signals with overlapping trades across pairs.
+    """
+    multi = 17 if metadata['pair'] in ('ETH/BTC', 'LTC/BTC') else 13
+    dataframe['buy'] = np.where(dataframe.index % multi == 0, 1, 0)
+    dataframe['sell'] = np.where((dataframe.index + multi - 4) % multi == 0, 1, 0)
+    return dataframe
+
+
+def _run_engine(default_conf, processed, engine, advise=None, strategy_overrides=None,
+                **kwargs):
+    default_conf['backtest_engine'] = engine
+    backtesting = Backtesting(default_conf)
+    if strategy_overrides:
+        strategy_cls = type(backtesting.strategy)
+        backtesting.strategy.__class__ = type(strategy_cls.__name__, (strategy_cls, ),
+                                              strategy_overrides)
+    if advise:
+        backtesting.strategy.advise_buy = advise
+        backtesting.strategy.advise_sell = advise
+    min_date, max_date = get_timerange(processed)
+    return backtesting.backtest(
+        processed={pair: df.copy() for pair, df in processed.items()},
+        stake_amount=default_conf['stake_amount'],
+        start_date=min_date,
+        end_date=max_date,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("max_open_trades,position_stacking", [
+    (3, False), (1, False), (0, False), (2, True)])
+@pytest.mark.parametrize("ask_strategy", [
+    {'use_sell_signal': True},
+    {'use_sell_signal': True, 'sell_profit_only': True, 'ignore_roi_if_buy_signal': True},
+])
+def test_backtest_engine_parity_multi_pair(default_conf, fee, mocker, testdatadir,
+                                           max_open_trades, position_stacking,
+                                           ask_strategy) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    default_conf['ticker_interval'] = '5m'
+    default_conf['ask_strategy'] = ask_strategy
+    default_conf['minimal_roi'] = {"0": 0.02, "30": 0.01, "60": 0}
+    default_conf['stoploss'] = -0.02
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    # Only use 600 candles, and let one pair start late to cover missing data at the start
+    data = {pair: df[-600:].reset_index(drop=True) for pair, df in data.items()}
+    data['LTC/BTC'] = data['LTC/BTC'][25:].reset_index(drop=True)
+
+    backtesting = Backtesting(default_conf)
+    processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
+
+    kwargs = {'max_open_trades': max_open_trades, 'position_stacking': position_stacking}
+    classic = _run_engine(default_conf, processed, 'classic', _multi_pair_signals, **kwargs)
+    columnar = _run_engine(default_conf, processed, 'columnar', _multi_pair_signals, **kwargs)
+
+    assert len(classic) > 5
+    pd.testing.assert_frame_equal(classic, columnar)
+
+
+@pytest.mark.parametrize("trailing", [
+    {'trailing_stop': False},
+    {'trailing_stop': True},
+    {'trailing_stop': True, 'trailing_stop_positive': 0.01,
+     'trailing_stop_positive_offset': 0.02, 'trailing_only_offset_is_reached': True},
+])
+def test_backtest_engine_parity_strategy(default_conf, fee, mocker, testdatadir, trailing) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    default_conf.update(trailing)
+    default_conf['ticker_interval'] = '1m'
+
+    data = history.load_data(datadir=testdatadir, timeframe='1m', pairs=['UNITTEST/BTC'])
+    backtesting = Backtesting(default_conf)
+    processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
+
+    classic = _run_engine(default_conf, processed, 'classic', max_open_trades=1)
+    columnar = _run_engine(default_conf, processed, 'columnar', max_open_trades=1)
+
+    assert len(classic) > 0
+    pd.testing.assert_frame_equal(classic, columnar)
+
+
+def test_backtest_engine_parity_no_trades(default_conf, fee, mocker, testdatadir) -> None:
+    patch_exchange(mocker)
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'])
+    backtesting = Backtesting(default_conf)
+    processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
+
+    def no_signals(dataframe, metadata):
+        dataframe['buy'] = 0
+        dataframe['sell'] = 0
+        return dataframe
+
+    classic = _run_engine(default_conf, processed, 'classic', no_signals, max_open_trades=1)
+    columnar = _run_engine(default_conf, processed, 'columnar', no_signals, max_open_trades=1)
+    assert classic.empty
+    pd.testing.assert_frame_equal(classic, columnar)
+
+
+@pytest.mark.parametrize("max_open_trades", [0, 1, 3])
+def test_backtest_engine_parity_sparse_signals(default_conf, fee, mocker, testdatadir,
+                                               max_open_trades) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    default_conf['ticker_interval'] = '5m'
+    default_conf['minimal_roi'] = {"0": 0.03, "60": 0.01}
+    default_conf['stoploss'] = -0.03
+
+    pairs = ['ADA/BTC', 'ETH/BTC', 'LTC/BTC', 'XLM/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    # Missing data at the end, at the start and in the middle of the data
+    data['ADA/BTC'] = data['ADA/BTC'][:-400].reset_index(drop=True)
+    data['LTC/BTC'] = data['LTC/BTC'][300:].reset_index(drop=True)
+    data['XLM/BTC'] = data['XLM/BTC'].drop(range(500, 650)).reset_index(drop=True)
+
+    backtesting = Backtesting(default_conf)
+    processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
+
+    def sparse_signals(dataframe, metadata):
+        # Signals at the same time across pairs, and a few per pair only
+        dataframe['buy'] = np.where(dataframe.index % 97 < 2, 1, 0)
+        dataframe['sell'] = np.where(dataframe.index % 97 == 40, 1, 0)
+        return dataframe
+
+    classic = _run_engine(default_conf, processed, 'classic', sparse_signals,
+                          max_open_trades=max_open_trades)
+    columnar = _run_engine(default_conf, processed, 'columnar', sparse_signals,
+                           max_open_trades=max_open_trades)
+
+    assert len(classic) > 10
+    pd.testing.assert_frame_equal(classic, columnar)
+
+
+@pytest.mark.parametrize("minimal_roi,stoploss", [
+    ({"0": 0.05, "20": 0.03, "60": 0.01, "180": 0}, -0.05),
+    # Forcesell via negative ROI, on and off candle open
+    ({"0": 0.1, "120": -1}, -0.9),
+    ({"0": 0.1, "33": -1}, -0.9),
+    # Long running trades, sold by sell signal or at the end of the data
+    ({"0": 10}, -0.99),
+    ({"30": 0.02}, -0.03),
+])
+def test_backtest_engine_parity_exit_search(default_conf, fee, mocker, testdatadir,
+                                            minimal_roi, stoploss) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    default_conf['ticker_interval'] = '5m'
+    default_conf['minimal_roi'] = minimal_roi
+    default_conf['stoploss'] = stoploss
+
+    pairs = ['ETH/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    backtesting = Backtesting(default_conf)
+    processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
+    assert backtesting._get_exit_roi_table() is not None
+
+    def sparse_signals(dataframe, metadata):
+        dataframe['buy'] = np.where(dataframe.index % 211 == 0, 1, 0)
+        dataframe['sell'] = np.where(dataframe.index % 509 == 0, 1, 0)
+        return dataframe
+
+    classic = _run_engine(default_conf, processed, 'classic', sparse_signals, max_open_trades=2)
+    columnar = _run_engine(default_conf, processed, 'columnar', sparse_signals, max_open_trades=2)
+
+    assert len(classic) > 5
+    pd.testing.assert_frame_equal(classic, columnar)
+
+
+def test_backtest_engine_parity_dynamic_roi(default_conf, fee, mocker, testdatadir) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    default_conf['ticker_interval'] = '5m'
+    default_conf['minimal_roi'] = {"0": 10}
+    default_conf['stoploss'] = -0.05
+
+    def min_roi_reached_entry(self, trade_dur):
+        # ROI decreasing with every minute, instead of the minimal_roi table
+        return trade_dur, max(0.04 - trade_dur * 0.0002, 0.0)
+
+    pairs = ['ETH/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    backtesting = Backtesting(default_conf)
+    processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
+
+    def sparse_signals(dataframe, metadata):
+        dataframe['buy'] = np.where(dataframe.index % 211 == 0, 1, 0)
+        dataframe['sell'] = 0
+        return dataframe
+
+    overrides = {'min_roi_reached_entry': min_roi_reached_entry}
+    classic = _run_engine(default_conf, processed, 'classic', sparse_signals,
+                          strategy_overrides=overrides, max_open_trades=2)
+    columnar = _run_engine(default_conf, processed, 'columnar', sparse_signals,
+                           strategy_overrides=overrides, max_open_trades=2)
+
+    assert (classic['sell_reason'] == SellType.ROI).sum() > 5
+    pd.testing.assert_frame_equal(classic, columnar)
+
+
+def test_get_exit_roi_table(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    default_conf['minimal_roi'] = {"40": 0.0, "0": 0.04, "20": 0.02}
+    backtesting = Backtesting(default_conf)
+
+    roi_minutes, roi_values = backtesting._get_exit_roi_table()
+    assert roi_minutes.tolist() == [0, 20, 40]
+    assert roi_values.tolist() == [0.04, 0.02, 0.0]
+
+    # Trailing stoploss depends on the path of the trade - candles are checked one by one.
+    backtesting.strategy.trailing_stop = True
+    assert backtesting._get_exit_roi_table() is None
+
+    # ROI entries overridden by the strategy
+    backtesting.strategy.trailing_stop = False
+    strategy_cls = type(backtesting.strategy)
+    backtesting.strategy.__class__ = type(strategy_cls.__name__, (strategy_cls, ), {
+        'min_roi_reached_entry': lambda self, trade_dur: (0, 0.01)})
+    assert backtesting._get_exit_roi_table() is None
@@ -15,11 +15,11 @@ from freqtrade.commands.optimize_commands import (setup_optimize_configuration,
 from freqtrade.configuration import TimeRange
 from freqtrade.data import history
 from freqtrade.data.btanalysis import evaluate_result_multi
-from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.data.converter import clean_ohlcv_dataframe, trim_dataframe
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import get_timerange
 from freqtrade.exceptions import DependencyException, OperationalException
-from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.backtesting import Backtesting, _get_candle_positions
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.state import RunMode
 from freqtrade.strategy.interface import SellType
@@ -196,6 +196,9 @@ def test_setup_bt_configuration_with_arguments(mocker, default_conf, caplog) ->
         '--export', '/bar/foo',
         '--export-filename', 'foo_bar.json',
         '--fee', '0',
+        '--backtest-engine', 'columnar',
+        '--strategy-jobs', '2',
+        '--indicator-cache',
     ]
 
     config = setup_optimize_configuration(get_args(args), RunMode.BACKTEST)
@@ -231,6 +234,15 @@ def test_setup_bt_configuration_with_arguments(mocker, default_conf, caplog) ->
     assert 'fee' in config
     assert log_has('Parameter --fee detected, setting fee to: {} ...'.format(config['fee']), caplog)
 
+    assert config['backtest_engine'] == 'columnar'
+    assert log_has('Parameter --backtest-engine detected: columnar ...', caplog)
+
+    assert config['backtest_jobs'] == 2
+    assert log_has('Parameter --strategy-jobs detected: 2 ...', caplog)
+
+    assert config['indicator_cache'] is True
+    assert log_has('Parameter --indicator-cache detected ...', caplog)
+
 
 def test_setup_optimize_configuration_unlimited_stake_amount(mocker, default_conf, caplog) -> None:
     default_conf['stake_amount'] = constants.UNLIMITED_STAKE_AMOUNT
@@ -355,6 +367,62 @@ def test_backtesting_start(default_conf, mocker, testdatadir, caplog) -> None:
         assert log_has(line, caplog)
 
 
+@pytest.mark.parametrize("export,json_calls,parquet_calls", [
+    ('trades', 1, 0),
+    ('parquet', 0, 1),
+    (None, 0, 0),
+])
+def test_backtesting_start_export(default_conf, mocker, testdatadir,
+                                  export, json_calls, parquet_calls) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting.backtest')
+    mocker.patch('freqtrade.optimize.backtesting.show_backtest_results')
+    json_mock = mocker.patch('freqtrade.optimize.backtesting.store_backtest_result')
+    parquet_mock = mocker.patch('freqtrade.optimize.backtesting.store_backtest_result_parquet')
+    mocker.patch('freqtrade.pairlist.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['UNITTEST/BTC']))
+
+    default_conf.update({
+        'ticker_interval': '1m',
+        'datadir': testdatadir,
+        'export': export,
+        'exportfilename': Path('backtest-result.parquet'),
+        'timerange': '-1510694220',
+    })
+    backtesting = Backtesting(default_conf)
+    backtesting.start()
+    assert json_mock.call_count == json_calls
+    assert parquet_mock.call_count == parquet_calls
+
+
+def test_load_bt_data_informative_pairs(default_conf, mocker, testdatadir, caplog) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.pairlist.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['UNITTEST/BTC']))
+    history_mock = mocker.patch('freqtrade.data.dataprovider.load_pair_history',
+                                MagicMock(return_value=pd.DataFrame()))
+    default_conf.update({
+        'ticker_interval': '5m',
+        'datadir': testdatadir,
+        'timerange': '20180110-20180111',
+        'strategy_path': str(Path(__file__).parents[1] / 'strategy/strats'),
+        'strategy_list': ['DefaultStrategy', 'TestStrategyLegacy'],
+    })
+
+    backtesting = Backtesting(default_conf)
+    backtesting.strategylist[0].informative_pairs = lambda: [('ETH/BTC', '1h'),
+                                                             ('UNITTEST/BTC', '1h')]
+    backtesting.strategylist[1].informative_pairs = lambda: [('ETH/BTC', '1h')]
+    backtesting.load_bt_data()
+    assert log_has('Loading 2 informative pairs ..', caplog)
+    assert history_mock.call_count == 2
+
+    # Strategies access preloaded data
+    backtesting.dataprovider.get_pair_dataframe('ETH/BTC', '1h')
+    backtesting.dataprovider.get_pair_dataframe('UNITTEST/BTC', '1h')
+    assert history_mock.call_count == 2
+
+
 def test_backtesting_start_no_data(default_conf, mocker, caplog, testdatadir) -> None:
     def get_timerange(input1):
         return Arrow(2017, 11, 14, 21, 17), Arrow(2017, 11, 14, 22, 59)
@@ -703,3 +771,138 @@ def test_backtest_start_multi_strat(default_conf, mocker, caplog, testdatadir):
 
     for line in exists:
         assert log_has(line, caplog)
+
+
+@pytest.mark.parametrize("fork_available", [True, False])
+def test_backtest_start_multi_strat_parallel(default_conf, mocker, caplog, testdatadir,
+                                             fork_available):
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.pairlist.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['UNITTEST/BTC']))
+    show_mock = mocker.patch('freqtrade.optimize.backtesting.show_backtest_results')
+    default_conf.update({
+        'datadir': testdatadir,
+        'strategy_path': str(Path(__file__).parents[1] / 'strategy/strats'),
+        'ticker_interval': '1m',
+        'timerange': '-1510694220',
+        'strategy_list': ['DefaultStrategy', 'TestStrategyLegacy'],
+        'fee': 0.0025,
+    })
+
+    backtesting = Backtesting(default_conf)
+    backtesting.start()
+    sequential = show_mock.call_args[0][2]
+
+    if not fork_available:
+        mocker.patch('freqtrade.misc.multiprocessing.get_all_start_methods',
+                     return_value=['spawn'])
+    default_conf['backtest_jobs'] = 2
+    backtesting = Backtesting(default_conf)
+    backtesting.start()
+    parallel = show_mock.call_args[0][2]
+
+    if fork_available:
+        assert log_has("Running backtesting of 2 items using 2 worker processes", caplog)
+    else:
+        assert log_has_re(r"Parallel backtesting requires the 'fork' start method.*", caplog)
+    assert list(parallel.keys()) == ['DefaultStrategy', 'TestStrategyLegacy']
+    assert list(parallel.keys()) == list(sequential.keys())
+    for strategy, result in sequential.items():
+        assert len(result) > 0
+        pd.testing.assert_frame_equal(result, parallel[strategy])
+
+
+def test_get_candle_positions():
+    assert _get_candle_positions({}) == {}
+
+    positions = _get_candle_positions({
+        'ETH/BTC': np.array([300, 600, 900, 1200]),
+        # Late start, gap in the middle and an unaligned candle
+        'LTC/BTC': np.array([600, 1200, 1350, 1500]),
+    })
+    assert positions['ETH/BTC'].tolist() == [0, 1, 2, 3]
+    assert positions['LTC/BTC'].tolist() == [1, 3, 4, 5]
+
+
+def test_get_ohlcv_as_lists_candle_pos(default_conf, mocker, testdatadir) -> None:
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC', 'ETH/BTC'],
+                             timerange=TimeRange.parse_timerange('20180110-20180112'))
+    data['ETH/BTC'] = data['ETH/BTC'][10:]
+    rows = backtesting._get_ohlcv_as_lists(backtesting.strategy.ohlcvdata_to_dataframe(data))
+
+    # Same date, same position
+    assert rows['UNITTEST/BTC'][0].candle_pos == 0
+    assert rows['ETH/BTC'][0].candle_pos == 10
+    assert rows['ETH/BTC'][0].date == rows['UNITTEST/BTC'][10].date
+    assert rows['UNITTEST/BTC'][-1].candle_pos == len(rows['UNITTEST/BTC']) - 1
+
+
+@pytest.mark.parametrize("engine", ['classic', 'columnar'])
+def test_backtest_signal_cache(default_conf, fee, mocker, testdatadir, engine) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    default_conf['backtest_engine'] = engine
+    backtesting = Backtesting(default_conf)
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC', 'ETH/BTC'],
+                             timerange=TimeRange.parse_timerange('20180110-20180120'))
+    processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
+    min_date, max_date = get_timerange(processed)
+
+    def run_backtest(processed, max_date=max_date):
+        return backtesting.backtest(processed={p: df.copy() for p, df in processed.items()},
+                                    stake_amount=default_conf['stake_amount'],
+                                    start_date=min_date, end_date=max_date, max_open_trades=2)
+
+    expected = [run_backtest(processed)]
+    backtesting.strategy.stoploss = -0.01
+    expected.append(run_backtest(processed))
+    assert not expected[0].equals(expected[1])
+
+    backtesting.signal_cache = {}
+    buy_mock = mocker.spy(backtesting.strategy, 'advise_buy')
+    backtesting.strategy.stoploss = -0.10
+    pd.testing.assert_frame_equal(run_backtest(processed), expected[0])
+    backtesting.strategy.stoploss = -0.01
+    pd.testing.assert_frame_equal(run_backtest(processed), expected[1])
+    # Signals were analyzed once for both backtests
+    assert buy_mock.call_count == 2
+    assert len(backtesting.signal_cache) == 1
+
+    # Different data
+    timerange = TimeRange.parse_timerange('20180110-20180115')
+    trimmed = {pair: trim_dataframe(df, timerange) for pair, df in processed.items()}
+    run_backtest(trimmed, get_timerange(trimmed)[1])
+    assert buy_mock.call_count == 4
+    assert len(backtesting.signal_cache) == 2
+
+
+@pytest.mark.parametrize("engine", ['classic', 'columnar'])
+def test_backtest_signal_generator(default_conf, fee, mocker, testdatadir, engine) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    default_conf['backtest_engine'] = engine
+    backtesting = Backtesting(default_conf)
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC', 'ETH/BTC'],
+                             timerange=TimeRange.parse_timerange('20180110-20180120'))
+    processed = backtesting.strategy.ohlcvdata_to_dataframe(data)
+    min_date, max_date = get_timerange(processed)
+
+    def run_backtest():
+        return backtesting.backtest(processed={p: df.copy() for p, df in processed.items()},
+                                    stake_amount=default_conf['stake_amount'],
+                                    start_date=min_date, end_date=max_date, max_open_trades=2)
+
+    expected = run_backtest()
+    assert len(expected) > 0
+
+    def signal_generator(pair, pair_data):
+        dataframe = backtesting.strategy.advise_sell(
+            backtesting.strategy.advise_buy(pair_data.copy(), {'pair': pair}), {'pair': pair})
+        return dataframe['buy'].values == 1, dataframe['sell'].values == 1
+
+    backtesting.signal_generator = MagicMock(side_effect=signal_generator)
+    pd.testing.assert_frame_equal(run_backtest(), expected)
+    assert backtesting.signal_generator.call_count == 2
+    assert backtesting.signal_generator.call_args_list[0][0][0] == 'UNITTEST/BTC'
@@ -1,24 +1,35 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
 import locale
 import logging
+import pstats
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import ANY, MagicMock, call
 
+import numpy as np
 import pandas as pd
 import pytest
 from arrow import Arrow
 from filelock import Timeout
+from joblib import dump, load
 
 from freqtrade import constants
 from freqtrade.commands.optimize_commands import (setup_optimize_configuration,
                                                   start_hyperopt)
-from freqtrade.data.history import load_data
+from freqtrade.data.history import get_timerange, load_data
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.optimize.default_hyperopt import DefaultHyperOpt
 from freqtrade.optimize.default_hyperopt_loss import DefaultHyperOptLoss
-from freqtrade.optimize.hyperopt import Hyperopt
+from freqtrade.optimize.hyperopt import (MAX_LOSS, Hyperopt, _load_processed_data,
+                                         _processed_data_cache)
+from freqtrade.optimize.hyperopt_remote import HyperoptCoordinator, run_worker
+from freqtrade.optimize.hyperopt_samplers import (HaltonSampler, RandomSampler,
+                                                  TPESampler, WindowedOptimizer)
+from freqtrade.optimize.hyperopt_store import HyperoptResultStore
 from freqtrade.resolvers.hyperopt_resolver import (HyperOptLossResolver,
                                                    HyperOptResolver)
 from freqtrade.state import RunMode
@@ -57,24 +68,8 @@ def hyperopt_results():
 
 
 # Functions for recurrent object patching
-def create_results(mocker, hyperopt, testdatadir) -> List[Dict]:
-    """
-    When creating results, mock the hyperopt so that *by default*
-      - we don't create any pickle'd files in the filesystem
-      - we might have a pickle'd file so make sure that we return
-        false when looking for it
-    """
-    hyperopt.results_file = testdatadir / 'optimize/ut_results.pickle'
-
-    mocker.patch.object(Path, "is_file", MagicMock(return_value=False))
-    stat_mock = MagicMock()
-    stat_mock.st_size = PropertyMock(return_value=1)
-    mocker.patch.object(Path, "stat", MagicMock(return_value=False))
-
-    mocker.patch.object(Path, "unlink", MagicMock(return_value=True))
-    mocker.patch('freqtrade.optimize.hyperopt.dump', return_value=None)
-
-    return [{'loss': 1, 'result': 'foo', 'params': {}}]
+def create_results() -> List[Dict]:
+    return [{'loss': 1, 'result': 'foo', 'params': {}, 'is_best': True}]
 
 
 def test_setup_hyperopt_configuration_without_arguments(mocker, default_conf, caplog) -> None:
@@ -123,7 +118,10 @@ def test_setup_hyperopt_configuration_with_arguments(mocker, default_conf, caplo
         '--disable-max-market-positions',
         '--epochs', '1000',
         '--spaces', 'default',
-        '--print-all'
+        '--print-all',
+        '--pruning-rungs', '2',
+        '--pruning-factor', '4',
+        '--coordinator', '0.0.0.0:8765',
     ]
 
     config = setup_optimize_configuration(get_args(args), RunMode.HYPEROPT)
@@ -159,6 +157,13 @@ def test_setup_hyperopt_configuration_with_arguments(mocker, default_conf, caplo
     assert 'print_all' in config
     assert log_has('Parameter --print-all detected ...', caplog)
 
+    assert config['hyperopt_pruning_rungs'] == 2
+    assert log_has('Parameter --pruning-rungs detected: 2', caplog)
+    assert config['hyperopt_pruning_factor'] == 4
+    assert log_has('Parameter --pruning-factor detected: 4', caplog)
+    assert config['hyperopt_coordinator'] == '0.0.0.0:8765'
+    assert log_has('Parameter --coordinator detected: 0.0.0.0:8765', caplog)
+
 
 def test_setup_hyperopt_configuration_unlimited_stake_amount(mocker, default_conf, caplog) -> None:
     default_conf['stake_amount'] = constants.UNLIMITED_STAKE_AMOUNT
@@ -271,6 +276,28 @@ def test_start(mocker, default_conf, caplog) -> None:
     assert start_mock.call_count == 1
 
 
+def test_start_worker(mocker, default_conf, caplog) -> None:
+    start_mock = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.start')
+    worker_mock = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.start_worker')
+    lock_mock = mocker.patch('filelock.FileLock.acquire')
+    patched_configuration_load_config_file(mocker, default_conf)
+    patch_exchange(mocker)
+
+    args = [
+        'hyperopt',
+        '--config', 'config.json',
+        '--hyperopt', 'DefaultHyperOpt',
+        '--worker', '127.0.0.1:8765',
+    ]
+    start_hyperopt(get_args(args))
+
+    assert log_has('Parameter --worker detected: 127.0.0.1:8765', caplog)
+    assert worker_mock.call_count == 1
+    assert start_mock.call_count == 0
+    # Several workers can run on one machine
+    assert lock_mock.call_count == 0
+
+
 def test_start_no_data(mocker, default_conf, caplog) -> None:
     patched_configuration_load_config_file(mocker, default_conf)
     mocker.patch('freqtrade.data.history.load_pair_history', MagicMock(return_value=pd.DataFrame))
@@ -478,31 +505,33 @@ def test_no_log_if_loss_does_not_improve(hyperopt, caplog) -> None:
     assert caplog.record_tuples == []
 
 
-def test_save_results_saves_epochs(mocker, hyperopt, testdatadir, caplog) -> None:
-    epochs = create_results(mocker, hyperopt, testdatadir)
-    mock_dump = mocker.patch('freqtrade.optimize.hyperopt.dump', return_value=None)
-    results_file = testdatadir / 'optimize' / 'ut_results.pickle'
+def test_save_results_saves_epochs(hyperopt, tmpdir, caplog) -> None:
+    epochs = create_results()
+    results_file = Path(tmpdir) / 'ut_results.sqlite'
+    hyperopt.results_file = results_file
+    hyperopt.results_store = HyperoptResultStore(results_file)
 
     caplog.set_level(logging.DEBUG)
 
     hyperopt.epochs = epochs
     hyperopt._save_results()
     assert log_has(f"1 epoch saved to '{results_file}'.", caplog)
-    mock_dump.assert_called_once()
 
     hyperopt.epochs = epochs + epochs
     hyperopt._save_results()
+    assert log_has("Saving 1 epoch.", caplog)
     assert log_has(f"2 epochs saved to '{results_file}'.", caplog)
+    assert hyperopt.results_store.load() == epochs + epochs
+
 
+def test_load_previous_results(tmpdir, caplog) -> None:
+    results_file = Path(tmpdir) / 'ut_results.sqlite'
+    assert Hyperopt.load_previous_results(results_file) == []
 
-def test_read_results_returns_epochs(mocker, hyperopt, testdatadir, caplog) -> None:
-    epochs = create_results(mocker, hyperopt, testdatadir)
-    mock_load = mocker.patch('freqtrade.optimize.hyperopt.load', return_value=epochs)
-    results_file = testdatadir / 'optimize' / 'ut_results.pickle'
-    hyperopt_epochs = hyperopt._read_results(results_file)
-    assert log_has(f"Reading epochs from '{results_file}'", caplog)
-    assert hyperopt_epochs == epochs
-    mock_load.assert_called_once()
+    epochs = create_results()
+    HyperoptResultStore(results_file).append(epochs)
+    assert Hyperopt.load_previous_results(results_file) == epochs
+    assert log_has("Loaded 1 previous evaluations from disk.", caplog)
 
 
 def test_roi_table_generation(hyperopt) -> None:
@@ -520,6 +549,7 @@ def test_roi_table_generation(hyperopt) -> None:
 
 def test_start_calls_optimizer(mocker, default_conf, caplog, capsys) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    append_mock = mocker.patch('freqtrade.optimize.hyperopt.HyperoptResultStore.append')
     mocker.patch('freqtrade.optimize.backtesting.Backtesting.load_bt_data',
                  MagicMock(return_value=(MagicMock(), None)))
     mocker.patch(
@@ -527,9 +557,9 @@ def test_start_calls_optimizer(mocker, default_conf, caplog, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result',
             'params': {'buy': {}, 'sell': {}, 'roi': {}, 'stoploss': 0.0},
             'results_metrics':
@@ -540,7 +570,7 @@ def test_start_calls_optimizer(mocker, default_conf, caplog, capsys) -> None:
                 'profit': 1.0,
                 'duration': 20.0
             },
-        }])
+        })
     )
     patch_exchange(mocker)
     # Co-test loading timeframe from strategy
@@ -558,13 +588,15 @@ def test_start_calls_optimizer(mocker, default_conf, caplog, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert 'Best result:\n\n*    1/1: foo result Objective: 1.00000\n' in out
-    assert dumper.called
-    # Should be called twice, once for historical candle data, once to save evaluations
-    assert dumper.call_count == 2
+    assert 'Time spent on the 1 epoch of this run:\n|     Stage |' in out
+    assert log_has_re(r'Optimizer ask/tell overhead: .* ms per epoch\.', caplog)
+    # Should be called once for historical candle data, evaluations are appended to the store
+    assert dumper.call_count == 1
+    assert append_mock.call_count == 1
     assert hasattr(hyperopt.backtesting.strategy, "advise_sell")
     assert hasattr(hyperopt.backtesting.strategy, "advise_buy")
     assert hasattr(hyperopt, "max_open_trades")
@@ -708,7 +740,7 @@ def test_generate_optimizer(mocker, default_conf) -> None:
         MagicMock(return_value=(Arrow(2017, 12, 10), Arrow(2017, 12, 13)))
     )
     patch_exchange(mocker)
-    mocker.patch('freqtrade.optimize.hyperopt.load', MagicMock())
+    mocker.patch('freqtrade.optimize.hyperopt._load_processed_data', MagicMock())
 
     optimizer_param = {
         'adx-value': 0,
@@ -785,7 +817,211 @@ def test_generate_optimizer(mocker, default_conf) -> None:
     hyperopt = Hyperopt(default_conf)
     hyperopt.dimensions = hyperopt.hyperopt_space()
     generate_optimizer_value = hyperopt.generate_optimizer(list(optimizer_param.values()))
+    timings = generate_optimizer_value.pop('timings')
     assert generate_optimizer_value == response_expected
+    assert set(timings) == {'data', 'signals', 'backtest', 'loss'}
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_generate_optimizer_pruning(mocker, hyperopt, testdatadir) -> None:
+    trades = [('TRX/BTC', 0.023117, 0.000233, 100)]
+    labels = ['currency', 'profit_percent', 'profit_abs', 'trade_duration']
+    backtest_mock = mocker.patch('freqtrade.optimize.hyperopt.Backtesting.backtest',
+                                 MagicMock(return_value=pd.DataFrame.from_records(trades,
+                                                                                  columns=labels)))
+    processed = load_data(testdatadir, '5m', ['UNITTEST/BTC'])
+    mocker.patch('freqtrade.optimize.hyperopt._load_processed_data', return_value=processed)
+    min_date, max_date = get_timerange(processed)
+    hyperopt.config['hyperopt_min_trades'] = 1
+    hyperopt.pruning_factor = 3
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    params = [d.rvs(n_samples=1, random_state=1)[0] for d in hyperopt.dimensions]
+
+    # Promoted on the first 1/9 of the timerange, pruned after the first 1/3
+    result = hyperopt.generate_optimizer(params, pruning_thresholds=[float('inf'), 0])
+    assert backtest_mock.call_count == 2
+    for i, fraction in enumerate([1 / 9, 1 / 3]):
+        rung_max_date = min_date + (max_date - min_date) * fraction
+        assert backtest_mock.call_args_list[i][1]['end_date'] == rung_max_date
+        assert backtest_mock.call_args_list[i][1]['processed']['UNITTEST/BTC']['date'].max() \
+            <= rung_max_date
+    assert result['is_pruned']
+    assert result['loss'] == MAX_LOSS
+    assert len(result['rung_losses']) == 2
+    assert result['results_explanation'].endswith('Pruned after 33% of the timerange.')
+    # Metrics of the shortened timerange are not results of the complete timerange
+    assert result['rung_metrics']['trade_count'] > 0
+    assert result['results_metrics']['trade_count'] == 0
+    assert result['results_metrics']['total_profit'] == 0
+
+    backtest_mock.reset_mock()
+    result = hyperopt.generate_optimizer(params, pruning_thresholds=[float('inf'), 10])
+    assert backtest_mock.call_count == 3
+    assert backtest_mock.call_args[1]['end_date'] == max_date
+    assert not result['is_pruned']
+    assert result['loss'] < MAX_LOSS
+    assert result['rung_losses'][1] < 10
+
+
+def test_generate_optimizer_timings(mocker, hyperopt, testdatadir, tmpdir) -> None:
+    trades = [('TRX/BTC', 0.023117, 0.000233, 100)]
+    labels = ['currency', 'profit_percent', 'profit_abs', 'trade_duration']
+
+    def backtest(**kwargs):
+        # Signals are analyzed within the backtest
+        hyperopt.backtesting.signals_time += 0.01
+        time.sleep(0.02)
+        return pd.DataFrame.from_records(trades, columns=labels)
+
+    mocker.patch('freqtrade.optimize.hyperopt.Backtesting.backtest', side_effect=backtest)
+    processed = load_data(testdatadir, '5m', ['UNITTEST/BTC'])
+    mocker.patch('freqtrade.optimize.hyperopt._load_processed_data', return_value=processed)
+    hyperopt.config.update({'hyperopt_min_trades': 1, 'hyperopt_profile': True})
+    hyperopt.results_file = Path(tmpdir) / 'hyperopt_results.sqlite'
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    params = [d.rvs(n_samples=1, random_state=1)[0] for d in hyperopt.dimensions]
+
+    result = hyperopt.generate_optimizer(params, 2)
+    assert set(result['timings']) == {'data', 'signals', 'backtest', 'loss'}
+    assert result['timings']['signals'] >= 0.01
+    assert result['timings']['backtest'] >= 0.01
+    assert not list(Path(tmpdir).glob('*.prof'))
+
+    # Epochs 1, 11, 21, ... are profiled
+    result = hyperopt.generate_optimizer(params, 11)
+    assert result['loss'] < MAX_LOSS
+    stats = pstats.Stats(str(Path(tmpdir) / 'hyperopt_profile_11.prof'))
+    assert any(function[2] == '_evaluate_epoch' for function in stats.stats)  # type: ignore
+
+    # Timings of all rungs are added up
+    result = hyperopt.generate_optimizer(params, pruning_thresholds=[float('inf')])
+    assert result['timings']['backtest'] >= 0.02
+    assert result['timings']['signals'] >= 0.02
+
+
+def test_get_timings_table() -> None:
+    epochs = [{'timings': {'data': 0.001, 'signals': 0.002, 'backtest': 0.005, 'loss': 0.001,
+                           'optimizer': 0.001}}] * 19
+    epochs.append({'timings': {'optimizer': 0.01}, 'is_cached': True})
+    table = Hyperopt.get_timings_table(epochs)
+    assert table.splitlines()[0] == '|     Stage |   Mean (ms) |   P95 (ms) |   Share |'
+    # Cached epochs only count in the optimizer stage
+    assert '|      data |         0.9 |        1.0 |    9.5% |' in table
+    assert '|  backtest |         4.8 |        5.0 |   47.5% |' in table
+    assert '| optimizer |         1.4 |        1.5 |   14.5% |' in table
+    assert '|     total |        10.0 |       10.0 |  100.0% |' in table
+
+
+def test_get_pruning_thresholds(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    default_conf.update({'hyperopt': 'DefaultHyperOpt', 'spaces': ['default'],
+                         'hyperopt_pruning_rungs': 2, 'hyperopt_pruning_factor': 2})
+    hyperopt = Hyperopt(default_conf)
+    assert hyperopt.get_pruning_thresholds() == [float('inf'), float('inf')]
+
+    hyperopt._record_rung_losses({'rung_losses': [4.0, 1.0]})
+    hyperopt._record_rung_losses({'rung_losses': [3.0]})
+    hyperopt._record_rung_losses({'rung_losses': [2.0]})
+    assert hyperopt.get_pruning_thresholds() == [3.0, float('inf')]
+
+
+def test_load_processed_data(mocker, tmpdir, testdatadir) -> None:
+    data_file = Path(tmpdir) / 'processed.pkl'
+    data = load_data(testdatadir, '5m', ['UNITTEST/BTC'])
+    dump(data, data_file)
+    load_mock = mocker.patch('freqtrade.optimize.hyperopt.load', wraps=load)
+
+    processed = _load_processed_data(data_file)
+    assert load_mock.call_count == 1
+    pd.testing.assert_frame_equal(processed['UNITTEST/BTC'], data['UNITTEST/BTC'])
+    # Columns added during an epoch don't end up in the resident data
+    processed['UNITTEST/BTC']['buy'] = 1
+
+    # Neither do values an epoch changes in place
+    processed['UNITTEST/BTC'].loc[processed['UNITTEST/BTC']['close'] > 0, 'close'] = 0
+
+    processed = _load_processed_data(data_file)
+    assert load_mock.call_count == 1
+    assert 'buy' not in processed['UNITTEST/BTC']
+    pd.testing.assert_frame_equal(processed['UNITTEST/BTC'], data['UNITTEST/BTC'])
+
+    # A new hyperopt run dumps new data
+    dump({}, data_file)
+    assert _load_processed_data(data_file) == {}
+    assert load_mock.call_count == 2
+
+
+@pytest.mark.parametrize("spaces,expected", [
+    (['default'], False),
+    (['buy'], False),
+    (['sell', 'roi'], False),
+    (['roi', 'stoploss'], True),
+    (['trailing'], True),
+])
+def test_cache_signals(mocker, default_conf, testdatadir, caplog, spaces, expected) -> None:
+    patch_exchange(mocker)
+    default_conf.update({'hyperopt': 'DefaultHyperOpt', 'spaces': spaces,
+                         'hyperopt_min_trades': 1})
+    hyperopt = Hyperopt(default_conf)
+    hyperopt.backtesting.fee = 0.0025
+    assert hyperopt.cache_signals is expected
+    assert bool(log_has('Buy and sell signals are not optimized, analyzing them once for all '
+                        'epochs.', caplog)) is expected
+
+    processed = hyperopt.backtesting.strategy.ohlcvdata_to_dataframe(
+        load_data(testdatadir, '5m', ['UNITTEST/BTC']))
+    mocker.patch('freqtrade.optimize.hyperopt._load_processed_data', return_value=processed)
+    mocker.patch.dict('freqtrade.optimize.hyperopt._processed_data_cache', {'signals': {}})
+    signals_mock = mocker.spy(hyperopt.backtesting, '_get_ohlcv_as_lists')
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    for random_state in range(3):
+        hyperopt.generate_optimizer([d.rvs(n_samples=1, random_state=random_state)[0]
+                                     for d in hyperopt.dimensions])
+    assert signals_mock.call_count == (1 if expected else 3)
+    assert len(_processed_data_cache['signals']) == (1 if expected else 0)
+
+
+@pytest.mark.parametrize("spaces", [['buy', 'sell'], ['buy'], ['sell', 'roi']])
+def test_generate_optimizer_conditions(mocker, default_conf, testdatadir, spaces) -> None:
+    patch_exchange(mocker)
+    default_conf.update({'hyperopt': 'DefaultHyperOpt', 'spaces': spaces,
+                         'hyperopt_min_trades': 1, 'max_open_trades': 3})
+    hyperopt = Hyperopt(default_conf)
+    hyperopt.backtesting.fee = 0.0025
+    processed = hyperopt.backtesting.strategy.ohlcvdata_to_dataframe(
+        load_data(testdatadir, '5m', ['UNITTEST/BTC', 'ETH/BTC']))
+    mocker.patch('freqtrade.optimize.hyperopt._load_processed_data',
+                 side_effect=lambda _: {pair: df.copy()
+                                        for pair, df in processed.items()})
+    mocker.patch.dict('freqtrade.optimize.hyperopt._processed_data_cache', {'evaluators': {}})
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    points = [[d.rvs(n_samples=1, random_state=random_state)[0] for d in hyperopt.dimensions]
+              for random_state in range(4)]
+    advise_buy = MagicMock(wraps=hyperopt.backtesting.strategy.advise_buy)
+    advise_sell = MagicMock(wraps=hyperopt.backtesting.strategy.advise_sell)
+    hyperopt.backtesting.strategy.advise_buy = advise_buy
+    hyperopt.backtesting.strategy.advise_sell = advise_sell
+
+    results = [hyperopt.generate_optimizer(point) for point in points]
+    assert hyperopt.backtesting.signal_generator == hyperopt._get_signal_arrays
+    # Conditions are evaluated on arrays, signals of spaces which are not optimized
+    # are populated once per pair
+    assert advise_buy.call_count == (0 if 'buy' in spaces else 2)
+    assert advise_sell.call_count == (0 if 'sell' in spaces else 2)
+    assert len(_processed_data_cache['evaluators']) == 2
+
+    # Same results as the strategy generators
+    hyperopt = Hyperopt(default_conf)
+    hyperopt.backtesting.fee = 0.0025
+    hyperopt.custom_hyperopt.buy_conditions = MagicMock(return_value=None)
+    hyperopt.custom_hyperopt.sell_conditions = MagicMock(return_value=None)
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    for point, result in zip(points, results):
+        fallback_result = hyperopt.generate_optimizer(point)
+        assert fallback_result['loss'] == result['loss']
+        assert fallback_result['results_explanation'] == result['results_explanation']
+    assert hyperopt.backtesting.signal_generator is None
+    assert sum(result['results_metrics']['trade_count'] for result in results) > 0
 
 
 def test_clean_hyperopt(mocker, default_conf, caplog):
@@ -801,8 +1037,9 @@ def test_clean_hyperopt(mocker, default_conf, caplog):
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(default_conf)
 
-    assert unlinkmock.call_count == 2
+    assert unlinkmock.call_count == 3
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
+    assert log_has(f"Removing `{h.results_store.legacy_file}`.", caplog)
 
 
 def test_continue_hyperopt(mocker, default_conf, caplog):
@@ -825,6 +1062,7 @@ def test_continue_hyperopt(mocker, default_conf, caplog):
 
 def test_print_json_spaces_all(mocker, default_conf, caplog, capsys) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    append_mock = mocker.patch('freqtrade.optimize.hyperopt.HyperoptResultStore.append')
     mocker.patch('freqtrade.optimize.backtesting.Backtesting.load_bt_data',
                  MagicMock(return_value=(MagicMock(), None)))
     mocker.patch(
@@ -832,9 +1070,9 @@ def test_print_json_spaces_all(mocker, default_conf, caplog, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'params_details': {
                 'buy': {'mfi-value': None},
@@ -850,7 +1088,7 @@ def test_print_json_spaces_all(mocker, default_conf, caplog, capsys) -> None:
                 'profit': 1.0,
                 'duration': 20.0
             }
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -869,7 +1107,7 @@ def test_print_json_spaces_all(mocker, default_conf, caplog, capsys) -> None:
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     result_str = (
@@ -877,13 +1115,14 @@ def test_print_json_spaces_all(mocker, default_conf, caplog, capsys) -> None:
         ':{},"stoploss":null,"trailing_stop":null}'
     )
     assert result_str in out  # noqa: E501
-    assert dumper.called
-    # Should be called twice, once for historical candle data, once to save evaluations
-    assert dumper.call_count == 2
+    # Should be called once for historical candle data, evaluations are appended to the store
+    assert dumper.call_count == 1
+    assert append_mock.call_count == 1
 
 
 def test_print_json_spaces_default(mocker, default_conf, caplog, capsys) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    append_mock = mocker.patch('freqtrade.optimize.hyperopt.HyperoptResultStore.append')
     mocker.patch('freqtrade.optimize.backtesting.Backtesting.load_bt_data',
                  MagicMock(return_value=(MagicMock(), None)))
     mocker.patch(
@@ -891,9 +1130,9 @@ def test_print_json_spaces_default(mocker, default_conf, caplog, capsys) -> None
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'params_details': {
                 'buy': {'mfi-value': None},
@@ -908,7 +1147,7 @@ def test_print_json_spaces_default(mocker, default_conf, caplog, capsys) -> None
                 'profit': 1.0,
                 'duration': 20.0
             }
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -927,17 +1166,18 @@ def test_print_json_spaces_default(mocker, default_conf, caplog, capsys) -> None
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert '{"params":{"mfi-value":null,"sell-mfi-value":null},"minimal_roi":{},"stoploss":null}' in out  # noqa: E501
-    assert dumper.called
-    # Should be called twice, once for historical candle data, once to save evaluations
-    assert dumper.call_count == 2
+    # Should be called once for historical candle data, evaluations are appended to the store
+    assert dumper.call_count == 1
+    assert append_mock.call_count == 1
 
 
 def test_print_json_spaces_roi_stoploss(mocker, default_conf, caplog, capsys) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    append_mock = mocker.patch('freqtrade.optimize.hyperopt.HyperoptResultStore.append')
     mocker.patch('freqtrade.optimize.backtesting.Backtesting.load_bt_data',
                  MagicMock(return_value=(MagicMock(), None)))
     mocker.patch(
@@ -945,9 +1185,9 @@ def test_print_json_spaces_roi_stoploss(mocker, default_conf, caplog, capsys) ->
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'params_details': {'roi': {}, 'stoploss': {'stoploss': None}},
             'results_metrics':
@@ -958,7 +1198,7 @@ def test_print_json_spaces_roi_stoploss(mocker, default_conf, caplog, capsys) ->
                 'profit': 1.0,
                 'duration': 20.0
             }
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -977,17 +1217,18 @@ def test_print_json_spaces_roi_stoploss(mocker, default_conf, caplog, capsys) ->
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert '{"minimal_roi":{},"stoploss":null}' in out
-    assert dumper.called
-    # Should be called twice, once for historical candle data, once to save evaluations
-    assert dumper.call_count == 2
+    # Should be called once for historical candle data, evaluations are appended to the store
+    assert dumper.call_count == 1
+    assert append_mock.call_count == 1
 
 
 def test_simplified_interface_roi_stoploss(mocker, default_conf, caplog, capsys) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    append_mock = mocker.patch('freqtrade.optimize.hyperopt.HyperoptResultStore.append')
     mocker.patch('freqtrade.optimize.backtesting.Backtesting.load_bt_data',
                  MagicMock(return_value=(MagicMock(), None)))
     mocker.patch(
@@ -995,9 +1236,9 @@ def test_simplified_interface_roi_stoploss(mocker, default_conf, caplog, capsys)
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {'stoploss': 0.0},
             'results_metrics':
             {
@@ -1007,7 +1248,7 @@ def test_simplified_interface_roi_stoploss(mocker, default_conf, caplog, capsys)
                 'profit': 1.0,
                 'duration': 20.0
             }
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -1029,13 +1270,13 @@ def test_simplified_interface_roi_stoploss(mocker, default_conf, caplog, capsys)
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert 'Best result:\n\n*    1/1: foo result Objective: 1.00000\n' in out
-    assert dumper.called
-    # Should be called twice, once for historical candle data, once to save evaluations
-    assert dumper.call_count == 2
+    # Should be called once for historical candle data, evaluations are appended to the store
+    assert dumper.call_count == 1
+    assert append_mock.call_count == 1
     assert hasattr(hyperopt.backtesting.strategy, "advise_sell")
     assert hasattr(hyperopt.backtesting.strategy, "advise_buy")
     assert hasattr(hyperopt, "max_open_trades")
@@ -1074,8 +1315,176 @@ def test_simplified_interface_all_failed(mocker, default_conf, caplog, capsys) -
         hyperopt.start()
 
 
+def test_run_optimizer_parallel(mocker, hyperopt) -> None:
+    """ Epochs finishing out of order are reported in the order they were asked """
+    def generate_optimizer(params, current, pruning_thresholds):
+        assert pruning_thresholds == []
+        if current == 1:
+            time.sleep(0.5)
+        return {'loss': 10 - current, 'params': params}
+
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+                 MagicMock(side_effect=generate_optimizer))
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.print_results')
+    save_mock = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._save_results')
+    hyperopt.total_epochs = 4
+    hyperopt.random_state = 1
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    hyperopt.opt = hyperopt.get_optimizer(hyperopt.dimensions, 1)
+    tell_mock = mocker.spy(hyperopt.opt, 'tell')
+    pbar = MagicMock()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        hyperopt.run_optimizer_parallel(executor, 2, pbar)
+
+    assert [epoch['current_epoch'] for epoch in hyperopt.epochs] == [1, 2, 3, 4]
+    assert [epoch['loss'] for epoch in hyperopt.epochs] == [9, 8, 7, 6]
+    assert all(epoch['is_best'] for epoch in hyperopt.epochs)
+    assert hyperopt.current_best_loss == 6
+    assert save_mock.call_count == 4
+    assert [c[1][0] for c in pbar.update.mock_calls] == [1, 2, 3, 4]
+    # Each point is told as soon as it is evaluated, epoch 1 is the slowest one
+    assert tell_mock.call_count == 4
+    assert tell_mock.call_args[0] == (hyperopt.epochs[0]['params'], 9)
+
+
+def test_run_optimizer_parallel_cache(mocker, hyperopt) -> None:
+    def generate_optimizer(params, current, pruning_thresholds):
+        params_dict = hyperopt._get_params_dict(params)
+        return {'loss': 10 - current, 'params_dict': params_dict,
+                'is_pruned': params_dict['trigger'] == 'bb_lower',
+                'timings': {'backtest': 0.1}}
+
+    generate_mock = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+                                 MagicMock(side_effect=generate_optimizer))
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.print_results')
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._save_results')
+    hyperopt.total_epochs = 6
+    hyperopt.random_state = 1
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    hyperopt.opt = hyperopt.get_optimizer(hyperopt.dimensions, 1)
+    points = [[d.rvs(n_samples=1, random_state=i)[0] for d in hyperopt.dimensions]
+              for i in range(2)]
+    trigger = [d.name for d in hyperopt.dimensions].index('trigger')
+    points[0][trigger] = 'sar_reversal'
+    points[1][trigger] = 'bb_lower'
+    # skopt returns numpy scalars, cached parameters are compared by value
+    repeated = [np.int64(v) if isinstance(v, int) and not isinstance(v, bool) else v
+                for v in points[0]]
+    mocker.patch.object(hyperopt, '_ask_point', side_effect=[
+        points[0], repeated, points[1], points[1], repeated, points[0]])
+    tell_mock = mocker.spy(hyperopt.opt, 'tell')
+    pbar = MagicMock()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        hyperopt.run_optimizer_parallel(executor, 1, pbar)
+
+    # Pruned epochs are evaluated again
+    assert generate_mock.call_count == 3
+    assert [epoch.get('is_cached', False) for epoch in hyperopt.epochs] == [
+        False, True, False, False, True, True]
+    assert [epoch['loss'] for epoch in hyperopt.epochs] == [9, 9, 7, 6, 9, 9]
+    assert [epoch['current_epoch'] for epoch in hyperopt.epochs] == [1, 2, 3, 4, 5, 6]
+    assert tell_mock.call_count == 6
+    assert hyperopt.cache_hits == 3
+    assert pbar.update.call_args_list[1] == call(2, cache_hits='1 (50%)',
+                                                 optimizer_time=ANY)
+    assert pbar.update.call_args_list[-1] == call(6, cache_hits='3 (50%)',
+                                                  optimizer_time=ANY)
+    # Overhead of asking and telling the optimizer is measured for all epochs
+    assert hyperopt.optimizer_epochs == 6
+    assert hyperopt.optimizer_time > 0
+    assert pbar.update.call_args_list[-1][1]['optimizer_time'].endswith(' ms/epoch')
+    # Epochs taken from the cache only spent time in the optimizer
+    assert [sorted(epoch['timings']) for epoch in hyperopt.epochs] == [
+        ['backtest', 'optimizer'], ['optimizer'], ['backtest', 'optimizer'],
+        ['backtest', 'optimizer'], ['optimizer'], ['optimizer']]
+    assert all(epoch['timings']['optimizer'] > 0 for epoch in hyperopt.epochs)
+
+
+def test_get_results_fingerprint(mocker, hyperopt, testdatadir) -> None:
+    processed = load_data(testdatadir, '5m', ['UNITTEST/BTC'])
+    hyperopt.config['hyperopt_min_trades'] = 1
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    fingerprint = hyperopt.get_results_fingerprint(processed)
+    assert fingerprint == hyperopt.get_results_fingerprint(
+        {pair: df.copy() for pair, df in processed.items()})
+    # Other dimensions don't change the results of an epoch
+    hyperopt.dimensions = hyperopt.hyperopt_space('buy')
+    assert hyperopt.get_results_fingerprint(processed) == fingerprint
+
+    changed = {pair: df.copy() for pair, df in processed.items()}
+    changed['UNITTEST/BTC'].loc[10, 'close'] += 1e-8
+    assert hyperopt.get_results_fingerprint(changed) != fingerprint
+
+    hyperopt.backtesting.strategy.stoploss = -0.5
+    assert hyperopt.get_results_fingerprint(processed) != fingerprint
+
+
+def test_cache_previous_results(mocker, hyperopt, testdatadir) -> None:
+    processed = load_data(testdatadir, '5m', ['UNITTEST/BTC'])
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._prepare_data', return_value=processed)
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.get_results_fingerprint',
+                 return_value='abc')
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel')
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.print_epoch_details')
+    epochs = [{'loss': 1, 'params_dict': {'mfi-value': 10}, 'results_fingerprint': 'abc'},
+              {'loss': 2, 'params_dict': {'mfi-value': 11}, 'results_fingerprint': 'def'},
+              {'loss': 3, 'params_dict': {'mfi-value': 12}}]
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.load_previous_results',
+                 return_value=epochs)
+    hyperopt.config['hyperopt_jobs'] = 1
+    hyperopt.start()
+
+    assert hyperopt.results_fingerprint == 'abc'
+    # Only results of the same data, strategy, hyperopt and loss are reused
+    assert list(hyperopt.result_cache.values()) == [epochs[0]]
+    assert hyperopt.result_cache[(('mfi-value', 10), )] is epochs[0]
+
+
+def test_ask_point_pending(mocker, hyperopt) -> None:
+    mocker.patch('freqtrade.optimize.hyperopt.INITIAL_POINTS', 2)
+    hyperopt.random_state = 1
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    hyperopt.opt = hyperopt.get_optimizer(hyperopt.dimensions, 1)
+    hyperopt.opt.tell(hyperopt.opt.ask(n_points=2), [1.0, 2.0])
+
+    point = hyperopt._ask_point([])
+    assert hyperopt._ask_point([]) == point
+    # Points being evaluated are not asked again
+    assert hyperopt._ask_point([point]) != point
+    assert hyperopt.opt.ask() == point
+
+
+@pytest.mark.parametrize("sampler,expected", [
+    ('et', WindowedOptimizer),
+    ('tpe', TPESampler),
+    ('random', RandomSampler),
+    ('halton', HaltonSampler),
+])
+def test_get_optimizer(hyperopt, sampler, expected) -> None:
+    hyperopt.config.update({'hyperopt_sampler': sampler, 'hyperopt_surrogate_window': 50})
+    hyperopt.random_state = 1
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    opt = hyperopt.get_optimizer(hyperopt.dimensions, 1)
+    assert isinstance(opt, expected)
+    if sampler in ('et', 'tpe'):
+        assert opt.window == 50
+
+    hyperopt.opt = opt
+    for _ in range(3):
+        point = hyperopt._ask_point([])
+        assert len(point) == len(hyperopt.dimensions)
+        assert all(value in dimension for value, dimension in zip(point, hyperopt.dimensions))
+        hyperopt.opt.tell(point, 1.0)
+    point = hyperopt._ask_point([])
+    # Points being evaluated are not asked again
+    assert hyperopt._ask_point([point]) != point
+
+
 def test_simplified_interface_buy(mocker, default_conf, caplog, capsys) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    append_mock = mocker.patch('freqtrade.optimize.hyperopt.HyperoptResultStore.append')
     mocker.patch('freqtrade.optimize.backtesting.Backtesting.load_bt_data',
                  MagicMock(return_value=(MagicMock(), None)))
     mocker.patch(
@@ -1083,9 +1492,9 @@ def test_simplified_interface_buy(mocker, default_conf, caplog, capsys) -> None:
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'results_metrics':
             {
@@ -1095,7 +1504,7 @@ def test_simplified_interface_buy(mocker, default_conf, caplog, capsys) -> None:
                 'profit': 1.0,
                 'duration': 20.0
             }
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -1111,19 +1520,19 @@ def test_simplified_interface_buy(mocker, default_conf, caplog, capsys) -> None:
     hyperopt.custom_hyperopt.generate_roi_table = MagicMock(return_value={})
 
     # TODO: sell_strategy_generator() is actually not called because
-    # run_optimizer_parallel() is mocked
+    # generate_optimizer() is mocked
     del hyperopt.custom_hyperopt.__class__.sell_strategy_generator
     del hyperopt.custom_hyperopt.__class__.sell_indicator_space
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert 'Best result:\n\n*    1/1: foo result Objective: 1.00000\n' in out
-    assert dumper.called
-    # Should be called twice, once for historical candle data, once to save evaluations
-    assert dumper.call_count == 2
+    # Should be called once for historical candle data, evaluations are appended to the store
+    assert dumper.call_count == 1
+    assert append_mock.call_count == 1
     assert hasattr(hyperopt.backtesting.strategy, "advise_sell")
     assert hasattr(hyperopt.backtesting.strategy, "advise_buy")
     assert hasattr(hyperopt, "max_open_trades")
@@ -1133,6 +1542,7 @@ def test_simplified_interface_buy(mocker, default_conf, caplog, capsys) -> None:
 
 def test_simplified_interface_sell(mocker, default_conf, caplog, capsys) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump', MagicMock())
+    append_mock = mocker.patch('freqtrade.optimize.hyperopt.HyperoptResultStore.append')
     mocker.patch('freqtrade.optimize.backtesting.Backtesting.load_bt_data',
                  MagicMock(return_value=(MagicMock(), None)))
     mocker.patch(
@@ -1140,9 +1550,9 @@ def test_simplified_interface_sell(mocker, default_conf, caplog, capsys) -> None
         MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
     )
 
-    parallel = mocker.patch(
-        'freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel',
-        MagicMock(return_value=[{
+    generate_optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        MagicMock(return_value={
             'loss': 1, 'results_explanation': 'foo result', 'params': {},
             'results_metrics':
             {
@@ -1152,7 +1562,7 @@ def test_simplified_interface_sell(mocker, default_conf, caplog, capsys) -> None
                 'profit': 1.0,
                 'duration': 20.0
             }
-        }])
+        })
     )
     patch_exchange(mocker)
 
@@ -1168,19 +1578,19 @@ def test_simplified_interface_sell(mocker, default_conf, caplog, capsys) -> None
     hyperopt.custom_hyperopt.generate_roi_table = MagicMock(return_value={})
 
     # TODO: buy_strategy_generator() is actually not called because
-    # run_optimizer_parallel() is mocked
+    # generate_optimizer() is mocked
     del hyperopt.custom_hyperopt.__class__.buy_strategy_generator
     del hyperopt.custom_hyperopt.__class__.indicator_space
 
     hyperopt.start()
 
-    parallel.assert_called_once()
+    generate_optimizer.assert_called_once()
 
     out, err = capsys.readouterr()
     assert 'Best result:\n\n*    1/1: foo result Objective: 1.00000\n' in out
-    assert dumper.called
-    # Should be called twice, once for historical candle data, once to save evaluations
-    assert dumper.call_count == 2
+    # Should be called once for historical candle data, evaluations are appended to the store
+    assert dumper.call_count == 1
+    assert append_mock.call_count == 1
     assert hasattr(hyperopt.backtesting.strategy, "advise_sell")
     assert hasattr(hyperopt.backtesting.strategy, "advise_buy")
     assert hasattr(hyperopt, "max_open_trades")
@@ -1217,6 +1627,81 @@ def test_simplified_interface_failed(mocker, default_conf, caplog, capsys, metho
     hyperopt.custom_hyperopt.generate_roi_table = MagicMock(return_value={})
 
     delattr(hyperopt.custom_hyperopt.__class__, method)
+    if method.endswith('_strategy_generator'):
+        # Strategy generators are only used without conditions
+        delattr(hyperopt.custom_hyperopt.__class__, f'{space}_conditions')
 
     with pytest.raises(OperationalException, match=f"The '{space}' space is included into *"):
         hyperopt.start()
+
+
+def test_hyperopt_remote_config(mocker, default_conf) -> None:
+    patch_exchange(mocker)
+    default_conf.update({'hyperopt': 'DefaultHyperOpt', 'spaces': ['default'],
+                         'hyperopt_coordinator': '0.0.0.0:8765',
+                         'hyperopt_worker': '127.0.0.1:8765'})
+    with pytest.raises(OperationalException, match=r'Hyperopt can either run as coordinator.*'):
+        Hyperopt(default_conf)
+
+    del default_conf['hyperopt_coordinator']
+    clean_mock = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.clean_hyperopt')
+    hyperopt = Hyperopt(default_conf)
+    # Workers keep the coordinator's results, and their own data file
+    assert clean_mock.call_count == 0
+    assert hyperopt.data_pickle_file.name.startswith('hyperopt_tickerdata_worker_')
+    with pytest.raises(OperationalException, match=r'.*Please set `hyperopt_remote_secret`.*'):
+        hyperopt.start_worker()
+
+
+def test_start_worker_evaluates_epochs(mocker, hyperopt, testdatadir) -> None:
+    processed = load_data(testdatadir, '5m', ['UNITTEST/BTC'])
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._prepare_data', return_value=processed)
+    run_worker_mock = mocker.patch('freqtrade.optimize.hyperopt.run_worker')
+    hyperopt.config.update({'hyperopt_worker': '127.0.0.1:8765',
+                            'hyperopt_remote_secret': 'secret', 'hyperopt_min_trades': 1})
+    hyperopt.data_pickle_file = MagicMock()
+
+    hyperopt.start_worker()
+    assert run_worker_mock.call_count == 1
+    assert run_worker_mock.call_args[0][:3] == (hyperopt, ('127.0.0.1', 8765), b'secret')
+    setup = run_worker_mock.call_args[0][3]
+    assert setup == hyperopt.get_remote_setup(processed)
+    assert setup['data'] == {'UNITTEST/BTC': len(processed['UNITTEST/BTC'])}
+    assert len(setup['dimensions']) == len(hyperopt.dimensions)
+    assert hyperopt.data_pickle_file.unlink.call_count == 1
+
+
+def test_run_optimizer_parallel_coordinator(mocker, hyperopt, testdatadir) -> None:
+    def generate_optimizer(params, current, pruning_thresholds):
+        return {'loss': 10 - current, 'params': params}
+
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+                 MagicMock(side_effect=generate_optimizer, __name__='generate_optimizer'))
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.print_results')
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._save_results')
+    mocker.patch('freqtrade.optimize.hyperopt.REMOTE_POLL_INTERVAL', 0.05)
+    processed = load_data(testdatadir, '5m', ['UNITTEST/BTC'])
+    hyperopt.config['hyperopt_min_trades'] = 1
+    hyperopt.backtesting.fee = 0.0025
+    hyperopt.total_epochs = 6
+    hyperopt.random_state = 1
+    hyperopt.dimensions = hyperopt.hyperopt_space()
+    hyperopt.opt = hyperopt.get_optimizer(hyperopt.dimensions, 1)
+    setup = hyperopt.get_remote_setup(processed)
+
+    coordinator = HyperoptCoordinator(('127.0.0.1', 0), b'secret', setup)
+    workers = [threading.Thread(target=run_worker, daemon=True,
+                                args=(hyperopt, coordinator.address, b'secret', setup))
+               for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    try:
+        hyperopt.run_optimizer_parallel(coordinator, 1, MagicMock())
+    finally:
+        coordinator.shutdown()
+    for worker in workers:
+        worker.join(timeout=10)
+
+    assert [epoch['current_epoch'] for epoch in hyperopt.epochs] == [1, 2, 3, 4, 5, 6]
+    assert [epoch['loss'] for epoch in hyperopt.epochs] == [9, 8, 7, 6, 5, 4]
+    assert len(hyperopt.opt.yi) == 6
@@ -0,0 +1,76 @@
+# pragma pylint: disable=missing-docstring, W0212, C0103
+import numpy as np
+import pandas as pd
+import pytest
+
+import freqtrade.vendor.qtpylib.indicators as qtpylib
+from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt_conditions import (Condition, ConditionEvaluator,
+                                                    populate_conditions)
+
+
+@pytest.fixture(scope='function')
+def dataframe():
+    return pd.DataFrame({
+        'close': [1.0, 2.0, 3.0, 2.0, 1.0, 2.0, np.nan, 3.0],
+        'sar': [2.0, 2.5, 2.5, 2.5, 1.5, 1.5, 1.5, 2.0],
+        'rsi': [10, 20, 30, 40, 50, 60, 70, 80],
+    })
+
+
+@pytest.mark.parametrize("condition,expected", [
+    (Condition('rsi', '<', 30), lambda df: df['rsi'] < 30),
+    (Condition('rsi', '<=', 30), lambda df: df['rsi'] <= 30),
+    (Condition('rsi', '>', 30), lambda df: df['rsi'] > 30),
+    (Condition('rsi', '>=', 30), lambda df: df['rsi'] >= 30),
+    (Condition('rsi', '==', 30), lambda df: df['rsi'] == 30),
+    (Condition('close', '<', 'sar'), lambda df: df['close'] < df['sar']),
+    (Condition('close', '>', 'sar'), lambda df: df['close'] > df['sar']),
+    (Condition('close', 'crossed_above', 'sar'),
+     lambda df: qtpylib.crossed_above(df['close'], df['sar'])),
+    (Condition('close', 'crossed_below', 'sar'),
+     lambda df: qtpylib.crossed_below(df['close'], df['sar'])),
+    (Condition('close', 'crossed_above', 1.5),
+     lambda df: qtpylib.crossed_above(df['close'], 1.5)),
+    (Condition('sar', 'crossed_below', 2.0),
+     lambda df: qtpylib.crossed_below(df['sar'], 2.0)),
+])
+def test_condition_evaluator(dataframe, condition, expected) -> None:
+    evaluator = ConditionEvaluator(dataframe)
+    result = evaluator.evaluate([condition])
+    assert result.dtype == bool
+    assert result.tolist() == expected(dataframe).tolist()
+
+
+def test_condition_evaluator_combined(dataframe) -> None:
+    evaluator = ConditionEvaluator(dataframe)
+    conditions = [Condition('rsi', '>', 15), Condition('close', 'crossed_above', 'sar')]
+    assert evaluator.evaluate(conditions).tolist() == [
+        False, False, True, False, False, True, False, False]
+    # Results of former evaluations are not overwritten
+    first = evaluator.evaluate([Condition('rsi', '<', 35)])
+    evaluator.evaluate([Condition('rsi', '>', 35)])
+    assert first.tolist() == [True, True, True, False, False, False, False, False]
+    # Columns are converted once
+    assert evaluator.column('rsi') is evaluator.column('rsi')
+    assert evaluator.column('rsi').dtype == np.float64
+
+    assert not evaluator.evaluate([]).any()
+    assert len(evaluator.evaluate([])) == len(dataframe)
+
+
+def test_condition_evaluator_invalid(dataframe) -> None:
+    evaluator = ConditionEvaluator(dataframe)
+    with pytest.raises(OperationalException, match=r"Condition on column 'macd', which is not.*"):
+        evaluator.evaluate([Condition('macd', '>', 0)])
+    with pytest.raises(OperationalException, match=r"Invalid condition operator 'above'.*"):
+        evaluator.evaluate([Condition('rsi', 'above', 0)])
+
+
+def test_populate_conditions(dataframe) -> None:
+    dataframe['buy'] = 0
+    result = populate_conditions(dataframe, [Condition('rsi', '<', 35)], 'buy')
+    assert result['buy'].tolist() == [1, 1, 1, 0, 0, 0, 0, 0]
+
+    result = populate_conditions(dataframe, [], 'sell')
+    assert 'sell' not in result
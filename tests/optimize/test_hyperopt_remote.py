@@ -0,0 +1,189 @@
+# pragma pylint: disable=missing-docstring, W0212, C0103
+import multiprocessing
+import threading
+import time
+from concurrent.futures import wait
+from multiprocessing.connection import Client
+
+import pytest
+
+from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt_remote import (HyperoptCoordinator,
+                                                parse_address, run_worker)
+from tests.conftest import log_has, log_has_re
+
+
+AUTHKEY = b'secret'
+SETUP = {'strategy': 'DefaultStrategy', 'dimensions': ['Integer(low=1, high=3)']}
+
+
+class FakeHyperopt:
+    """ Evaluates 'epochs' the way Hyperopt.generate_optimizer() is called by workers """
+
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+
+    def generate_optimizer(self, point, current):
+        time.sleep(self.delay)
+        if point == 'fail':
+            raise ValueError('Bad point')
+        return {'loss': point * 2, 'current': current}
+
+
+def start_worker(coordinator, hyperopt=None, setup=SETUP, authkey=AUTHKEY):
+    worker = threading.Thread(target=run_worker, daemon=True,
+                              args=(hyperopt or FakeHyperopt(), coordinator.address,
+                                    authkey, setup))
+    worker.start()
+    return worker
+
+
+def wait_for_workers(coordinator, num_workers):
+    for _ in range(100):
+        if coordinator.num_workers == num_workers:
+            return
+        time.sleep(0.05)
+    raise AssertionError(f"{coordinator.num_workers} workers connected")
+
+
+@pytest.fixture(scope='function')
+def coordinator():
+    coordinator = HyperoptCoordinator(('127.0.0.1', 0), AUTHKEY, SETUP)
+    yield coordinator
+    coordinator.shutdown()
+
+
+def _process_worker(address, epochs):
+    # Entry point of worker processes, reports the number of epochs each process evaluated
+    epochs.put(run_worker(FakeHyperopt(delay=0.05), address, AUTHKEY, SETUP))
+
+
+@pytest.mark.parametrize("address,expected", [
+    ('127.0.0.1:8765', ('127.0.0.1', 8765)),
+    ('0.0.0.0:80', ('0.0.0.0', 80)),
+    ('box.local:1234', ('box.local', 1234)),
+])
+def test_parse_address(address, expected) -> None:
+    assert parse_address(address) == expected
+
+
+@pytest.mark.parametrize("address", ['127.0.0.1', ':8765', '127.0.0.1:port', ''])
+def test_parse_address_invalid(address) -> None:
+    with pytest.raises(OperationalException, match=r'Invalid address.*'):
+        parse_address(address)
+
+
+def test_coordinator_workers(coordinator, caplog) -> None:
+    hyperopt = FakeHyperopt()
+    futures = [coordinator.submit(hyperopt.generate_optimizer, point, current)
+               for current, point in enumerate(range(10), 1)]
+    assert coordinator.num_workers == 0
+
+    workers = [start_worker(coordinator), start_worker(coordinator)]
+    done, not_done = wait(futures, timeout=10)
+    assert not not_done
+    assert [f.result() for f in futures] == [{'loss': point * 2, 'current': current}
+                                             for current, point in enumerate(range(10), 1)]
+    assert coordinator.num_workers == 2
+    assert log_has_re(r'Hyperopt worker .* connected \(2 connected\)\.', caplog)
+
+    coordinator.shutdown()
+    for worker in workers:
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+    assert log_has_re(r'Hyperopt worker done, evaluated [0-9]+ epochs?\.', caplog)
+    with pytest.raises(RuntimeError, match=r'cannot schedule new futures after shutdown'):
+        coordinator.submit(hyperopt.generate_optimizer, 1, 1)
+
+
+def test_coordinator_worker_error(coordinator) -> None:
+    hyperopt = FakeHyperopt()
+    start_worker(coordinator)
+    future = coordinator.submit(hyperopt.generate_optimizer, 'fail', 1)
+    with pytest.raises(OperationalException, match=r'(?s)Hyperopt worker .* failed.*Bad point'):
+        future.result(timeout=10)
+    # The worker continues with the next epoch
+    assert coordinator.submit(hyperopt.generate_optimizer, 2, 2).result(timeout=10)['loss'] == 4
+
+
+def test_coordinator_lost_worker(coordinator, caplog) -> None:
+    hyperopt = FakeHyperopt()
+    # Worker taking an epoch, and dying before returning its result
+    conn = Client(coordinator.address, authkey=AUTHKEY)
+    conn.send(('hello', 'dying', SETUP))
+    assert conn.recv() == ('welcome', )
+    future = coordinator.submit(hyperopt.generate_optimizer, 3, 1)
+    assert conn.recv() == ('epoch', 'generate_optimizer', (3, 1))
+    conn.close()
+    wait_for_workers(coordinator, 0)
+    assert log_has_re(r'Lost hyperopt worker dying: .*', caplog)
+    assert future.running()
+
+    # Joining worker takes over the epoch
+    start_worker(coordinator)
+    assert future.result(timeout=10) == {'loss': 6, 'current': 1}
+
+
+def test_coordinator_worker_timeout(mocker, coordinator, caplog) -> None:
+    mocker.patch('freqtrade.optimize.hyperopt_remote.WORKER_TIMEOUT', 0.2)
+    mocker.patch('freqtrade.optimize.hyperopt_remote.HEARTBEAT_INTERVAL', 0.05)
+    hyperopt = FakeHyperopt(delay=0.5)
+    # Slow, but alive worker
+    start_worker(coordinator, hyperopt)
+    assert coordinator.submit(hyperopt.generate_optimizer, 1, 1).result(timeout=10)['loss'] == 2
+    assert not log_has_re(r'Lost hyperopt worker.*', caplog)
+
+    # Unresponsive worker
+    conn = Client(coordinator.address, authkey=AUTHKEY)
+    conn.send(('hello', 'stuck', SETUP))
+    wait_for_workers(coordinator, 2)
+    coordinator.submit(hyperopt.generate_optimizer, 2, 2)
+    coordinator.submit(hyperopt.generate_optimizer, 3, 3)
+    wait_for_workers(coordinator, 1)
+    assert log_has('Lost hyperopt worker stuck: No heartbeat for 0.2 seconds.', caplog)
+    conn.close()
+
+
+def test_worker_rejected(coordinator, caplog) -> None:
+    with pytest.raises(OperationalException, match=r'Hyperopt coordinator rejected this worker.*'):
+        run_worker(FakeHyperopt(), coordinator.address, AUTHKEY, {**SETUP, 'strategy': 'Other'})
+    assert log_has_re(r'Rejected hyperopt worker .*: its configuration, data or hyperopt '
+                      r'spaces differ.*', caplog)
+
+    with pytest.raises(OperationalException, match=r'.*rejected the secret.*'):
+        run_worker(FakeHyperopt(), coordinator.address, b'wrong', SETUP)
+    assert coordinator.num_workers == 0
+
+
+def test_worker_no_coordinator(mocker, caplog) -> None:
+    coordinator = HyperoptCoordinator(('127.0.0.1', 0), AUTHKEY, SETUP)
+    address = coordinator.address
+    coordinator.shutdown()
+    mocker.patch('freqtrade.optimize.hyperopt_remote.time.sleep')
+
+    with pytest.raises(OperationalException, match=r'Could not connect to the hyperopt .*'):
+        run_worker(FakeHyperopt(), address, AUTHKEY, SETUP, connect_timeout=0.5)
+    assert log_has(f'Waiting for the hyperopt coordinator at {address[0]}:{address[1]} ...',
+                   caplog)
+
+
+def test_coordinator_worker_processes(coordinator) -> None:
+    hyperopt = FakeHyperopt()
+    ctx = multiprocessing.get_context('spawn')
+    epochs = ctx.Queue()
+    workers = [ctx.Process(target=_process_worker, args=(coordinator.address, epochs))
+               for _ in range(3)]
+    for worker in workers:
+        worker.start()
+
+    futures = [coordinator.submit(hyperopt.generate_optimizer, point, point)
+               for point in range(30)]
+    done, not_done = wait(futures, timeout=60)
+    assert not not_done
+    assert [f.result()['loss'] for f in futures] == [point * 2 for point in range(30)]
+
+    coordinator.shutdown()
+    assert sum(epochs.get(timeout=30) for _ in workers) == 30
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
@@ -0,0 +1,126 @@
+# pragma pylint: disable=missing-docstring, W0212, C0103
+import numpy as np
+import pytest
+from skopt.space import Categorical, Integer, Real
+
+from freqtrade.optimize.hyperopt_samplers import (HaltonSampler, RandomSampler, Sampler,
+                                                  TPESampler, WindowedOptimizer,
+                                                  _from_unit, _to_unit,
+                                                  _van_der_corput)
+
+
+DIMENSIONS = [
+    Integer(10, 40, name='rsi-value'),
+    Real(-0.3, -0.02, name='stoploss'),
+    Real(0.001, 1, prior='log-uniform', name='scale'),
+    Categorical(['bb_lower', 'macd_cross_signal', 'sar_reversal'], name='trigger'),
+]
+
+
+def loss(point):
+    return ((point[0] - 25) ** 2 / 100 + (point[1] + 0.1) ** 2 * 100
+            + abs(np.log10(point[2]) + 2) + (point[3] != 'sar_reversal'))
+
+
+def minimize(sampler, epochs):
+    for _ in range(epochs):
+        point = sampler.ask()
+        sampler.tell(point, loss(point))
+    return min(sampler.yi)
+
+
+@pytest.mark.parametrize("dimension,value,unit", [
+    (Integer(10, 40), 10, 0.5 / 31),
+    (Integer(10, 40), 40, 30.5 / 31),
+    (Real(-0.3, -0.02), -0.3, 0.0),
+    (Real(-0.3, -0.02), -0.02, 1.0),
+    (Real(0.001, 1, prior='log-uniform'), 0.1, 2 / 3),
+])
+def test_unit_interval(dimension, value, unit) -> None:
+    assert _to_unit(dimension, value) == pytest.approx(unit)
+    assert _from_unit(dimension, unit) == pytest.approx(value)
+
+
+def test_from_unit_categorical() -> None:
+    dimension = Categorical(['a', 'b', 'c'])
+    assert [_from_unit(dimension, u) for u in (0.0, 0.34, 0.9, 1.0)] == ['a', 'b', 'c', 'c']
+
+
+def test_van_der_corput() -> None:
+    assert [_van_der_corput(i, 2) for i in range(1, 5)] == [0.5, 0.25, 0.75, 0.125]
+    assert [_van_der_corput(i, 3) for i in range(1, 4)] == pytest.approx([1 / 3, 2 / 3, 1 / 9])
+
+
+@pytest.mark.parametrize("sampler", [
+    RandomSampler(DIMENSIONS, random_state=1),
+    HaltonSampler(DIMENSIONS, random_state=1),
+    TPESampler(DIMENSIONS, n_initial_points=5, random_state=1),
+    TPESampler(DIMENSIONS, n_initial_points=5, window=10, random_state=1),
+])
+def test_sampler(sampler) -> None:
+    minimize(sampler, 30)
+    assert len(sampler.Xi) == len(sampler.yi) == 30
+    for point in sampler.Xi:
+        assert all(value in dimension for value, dimension in zip(point, DIMENSIONS))
+        assert isinstance(point[0], int)
+        assert isinstance(point[1], float)
+
+    # Copies don't change the original
+    copy = sampler.copy(random_state=2)
+    copy.tell([copy.ask(), copy.ask()], [1.0, 2.0])
+    assert len(copy.yi) == 32
+    assert len(sampler.yi) == 30
+
+
+def test_sampler_without_ask() -> None:
+    class IncompleteSampler(Sampler):
+        pass
+
+    with pytest.raises(TypeError, match=r"abstract method.*ask"):
+        IncompleteSampler(DIMENSIONS)
+
+
+def test_halton_sampler() -> None:
+    sampler = HaltonSampler(DIMENSIONS, random_state=1)
+    assert sampler.bases == [2, 3, 5, 7]
+    points = [sampler.ask() for _ in range(2)]
+    # Without tell, the same point is suggested again
+    assert points[0] == points[1]
+    sampler.tell(points[0], 1.0)
+    assert sampler.ask() != points[0]
+    # Different random states start at different points of the sequence
+    assert HaltonSampler(DIMENSIONS, random_state=2).ask() != points[0]
+    assert HaltonSampler(DIMENSIONS, random_state=1).ask() == points[0]
+
+
+def test_tpe_sampler() -> None:
+    results = {name: [minimize(sampler(DIMENSIONS, random_state=seed), 150)
+                      for seed in range(3)]
+               for name, sampler in (('random', RandomSampler),
+                                     ('tpe', lambda *args, **kwargs: TPESampler(
+                                         *args, n_initial_points=20, **kwargs)))}
+    assert np.mean(results['tpe']) < np.mean(results['random'])
+
+    # Same random state, same points
+    samplers = [TPESampler(DIMENSIONS, n_initial_points=5, random_state=3) for _ in range(2)]
+    assert minimize(samplers[0], 20) == minimize(samplers[1], 20)
+    assert samplers[0].Xi == samplers[1].Xi
+
+
+def test_windowed_optimizer() -> None:
+    opt = WindowedOptimizer(DIMENSIONS[:2], base_estimator='ET', n_initial_points=3,
+                            random_state=1, window=5)
+    for i in range(4):
+        opt.tell(opt.ask(), float(i))
+    opt.tell([opt.ask(), opt.ask()], [4.0, 5.0])
+    # Only the most recent observations are kept for the model
+    assert opt.yi == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert len(opt.models) > 0
+    opt.tell(opt.ask(), 6.0)
+    assert opt.yi == [2.0, 3.0, 4.0, 5.0, 6.0]
+
+    opt = WindowedOptimizer(DIMENSIONS[:2], base_estimator='ET', n_initial_points=3,
+                            random_state=1)
+    for i in range(8):
+        opt.tell(opt.ask(), float(i))
+    assert len(opt.yi) == 8
@@ -0,0 +1,93 @@
+# pragma pylint: disable=missing-docstring, C0103
+from pathlib import Path
+
+import numpy as np
+import pytest
+from joblib import dump
+
+from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt_store import HyperoptResultStore
+from tests.conftest import log_has
+
+
+def test_store_append_load(hyperopt_results, tmpdir) -> None:
+    store = HyperoptResultStore(Path(tmpdir) / 'hyperopt_results.sqlite')
+    assert store.count() == 0
+    assert store.load() == []
+
+    store.append(hyperopt_results[:5])
+    store.append(hyperopt_results[5:])
+    assert store.count() == 12
+    assert store.load() == hyperopt_results
+    assert store.load(offset=3, limit=2) == hyperopt_results[3:5]
+    assert store.load(offset=10) == hyperopt_results[10:]
+
+
+@pytest.mark.parametrize('filteroptions,expected', [
+    ({'only_best': True}, [1, 5, 10]),
+    ({'only_profitable': True}, [2, 10]),
+    ({'only_best': True, 'only_profitable': True}, [10]),
+    ({'filter_min_trades': 1, 'filter_max_trades': 10}, [1, 10]),
+    ({'filter_min_avg_time': 2000}, [1, 5, 7, 8, 9, 10, 11]),
+    ({'filter_max_avg_time': 0}, []),
+    ({'filter_max_avg_profit': 0.5, 'filter_min_avg_profit': -1}, [2, 3, 5, 6, 7, 8, 9, 10]),
+    ({'filter_min_total_profit': 0.1}, [2, 10]),
+    ({'filter_max_total_profit': -1}, [1, 3, 5, 6, 7, 9, 11]),
+    ({'filter_min_trades': 0, 'filter_min_avg_time': None}, list(range(1, 13))),
+])
+def test_store_filters(hyperopt_results, tmpdir, filteroptions, expected) -> None:
+    store = HyperoptResultStore(Path(tmpdir) / 'hyperopt_results.sqlite')
+    store.append(hyperopt_results)
+
+    assert [epoch['current_epoch'] for epoch in store.load(filteroptions)] == expected
+    assert store.count(filteroptions) == len(expected)
+
+
+def test_store_numpy_metrics(hyperopt_results, tmpdir) -> None:
+    store = HyperoptResultStore(Path(tmpdir) / 'hyperopt_results.sqlite')
+    epoch = hyperopt_results[1]
+    epoch['loss'] = np.float64(epoch['loss'])
+    epoch['is_best'] = np.float64(epoch['loss']) < 100
+    epoch['results_metrics']['profit'] = np.float64(epoch['results_metrics']['profit'])
+    epoch['results_metrics']['duration'] = np.float64('nan')
+    store.append([epoch])
+
+    assert store.count({'only_best': True, 'only_profitable': True}) == 1
+    assert store.count({'filter_min_avg_time': 0}) == 0
+
+
+def test_store_pruned_epochs(hyperopt_results, tmpdir) -> None:
+    store = HyperoptResultStore(Path(tmpdir) / 'hyperopt_results.sqlite')
+    # Epoch 10 (profitable) pruned, with metrics of the shortened timerange in results_metrics
+    # as stored before rung_metrics were kept apart
+    hyperopt_results[9]['is_pruned'] = True
+    store.append(hyperopt_results)
+
+    assert [epoch['current_epoch'] for epoch in store.load({'only_profitable': True})] == [2]
+    assert [epoch['current_epoch']
+            for epoch in store.load({'filter_min_total_profit': 0.1})] == [2]
+    assert 10 not in [epoch['current_epoch'] for epoch in store.load({'filter_min_trades': 1})]
+    assert len(store.load()) == 12
+
+
+def test_store_import_legacy(hyperopt_results, tmpdir, caplog) -> None:
+    store = HyperoptResultStore(Path(tmpdir) / 'hyperopt_results.sqlite')
+    dump(hyperopt_results, store.legacy_file)
+
+    assert store.count() == 12
+    assert log_has(f"Imported 12 epochs from '{store.legacy_file}' "
+                   f"to '{store.results_file}'.", caplog)
+    assert store.load() == hyperopt_results
+
+    # Imported once only
+    store.append(hyperopt_results[:1])
+    assert store.count() == 13
+
+
+def test_store_import_legacy_incompatible(hyperopt_results, tmpdir) -> None:
+    store = HyperoptResultStore(Path(tmpdir) / 'hyperopt_results.sqlite')
+    del hyperopt_results[0]['is_best']
+    dump(hyperopt_results, store.legacy_file)
+
+    with pytest.raises(OperationalException, match=r'The file with Hyperopt results is .*'):
+        store.load()
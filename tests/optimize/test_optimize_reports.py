@@ -1,12 +1,19 @@
 from pathlib import Path
 
 import pandas as pd
+import pytest
 from arrow import Arrow
 
+from freqtrade.configuration import TimeRange
+from freqtrade.data.btanalysis import load_backtest_data
 from freqtrade.edge import PairInfo
+from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.optimize_reports import (
     generate_edge_table, generate_text_table, generate_text_table_sell_reason,
-    generate_text_table_strategy, store_backtest_result)
+    generate_text_table_strategy, generate_text_table_walk_forward,
+    generate_text_table_walk_forward_summary, store_backtest_result,
+    store_backtest_result_parquet)
+from freqtrade.optimize.walk_forward import WalkForwardResult, WalkForwardWindow
 from freqtrade.strategy.interface import SellType
 from tests.conftest import patch_exchange
 
@@ -109,6 +116,50 @@ def test_generate_text_table_strategy(default_conf, mocker):
     assert generate_text_table_strategy('BTC', 2, all_results=results) == result_str
 
 
+def test_generate_text_table_walk_forward(default_conf, mocker):
+    train = pd.DataFrame({
+        'pair': ['ETH/BTC', 'ETH/BTC'],
+        'profit_percent': [0.1, 0.2],
+        'profit_abs': [0.2, 0.4],
+        'trade_duration': [10, 30],
+    })
+    test = pd.DataFrame({
+        'pair': ['ETH/BTC', 'ETH/BTC', 'ETH/BTC'],
+        'profit_percent': [0.1, 0.0, -0.3],
+        'profit_abs': [0.1, 0.0, -0.3],
+        'trade_duration': [10, 20, 30],
+    })
+    window = WalkForwardWindow(train=TimeRange('date', 'date', 1515542400, 1515887999),
+                               test=TimeRange('date', 'date', 1515888000, 1516060799))
+    wf_results = [WalkForwardResult(window=window, train=train, test=test)]
+
+    result_str = (
+        '|   Window |                         Train Period |   Train Buys |   Train Cum Profit % |'
+        '                          Test Period |   Test Buys |   Test Avg Profit % |'
+        '   Test Cum Profit % |   Test Tot Profit BTC |   Wins |   Draws |   Losses |\n'
+        '|----------+--------------------------------------+--------------+----------------------+'
+        '--------------------------------------+-------------+---------------------+'
+        '---------------------+-----------------------+--------+---------+----------|\n'
+        '|        1 | 2018-01-10 00:00 -> 2018-01-14 00:00 |            2 |                30.00 |'
+        ' 2018-01-14 00:00 -> 2018-01-16 00:00 |           3 |               -6.67 |'
+        '              -20.00 |           -0.20000000 |      1 |       1 |        1 |'
+    )
+    assert generate_text_table_walk_forward('BTC', wf_results) == result_str
+
+    table = generate_text_table_walk_forward_summary('BTC', 2, wf_results)
+    assert table.count('|    Train |      2 |') == 1
+    assert table.count('|     Test |      3 |') == 1
+
+    # Rolling test windows only
+    wf_results = [WalkForwardResult(window=window._replace(train=None),
+                                    train=train.iloc[0:0], test=test)]
+    table = generate_text_table_walk_forward('BTC', wf_results)
+    assert table.splitlines()[2].split('|')[2].strip() == '-'
+    table = generate_text_table_walk_forward_summary('BTC', 2, wf_results)
+    assert 'Train' not in table
+    assert table.count('|     Test |      3 |') == 1
+
+
 def test_generate_edge_table(edge_conf, mocker):
 
     results = {}
@@ -191,3 +242,62 @@ def test_backtest_record(default_conf, fee, mocker):
             assert buy_index > oix
         oix = buy_index
         assert dur > 0
+
+
+def _backtest_results():
+    return pd.DataFrame({"pair": ["UNITTEST/BTC", "ETH/BTC", "UNITTEST/BTC", "ETH/BTC"],
+                         "profit_percent": [0.003312, 0.010801, 0.013803, 0.002780],
+                         "profit_abs": [0.000003, 0.000011, 0.000014, 0.000003],
+                         "open_time": [Arrow(2017, 11, 14, 19, 32, 00).datetime,
+                                       Arrow(2017, 11, 14, 21, 36, 00).datetime,
+                                       Arrow(2017, 11, 14, 22, 12, 00).datetime,
+                                       Arrow(2017, 11, 14, 22, 44, 00).datetime],
+                         "close_time": [Arrow(2017, 11, 14, 21, 35, 00).datetime,
+                                        Arrow(2017, 11, 14, 22, 10, 00).datetime,
+                                        Arrow(2017, 11, 14, 22, 43, 00).datetime,
+                                        Arrow(2017, 11, 14, 22, 58, 00).datetime],
+                         "open_rate": [0.002543, 0.003003, 0.003089, 0.003214],
+                         "close_rate": [0.002546, 0.003014, 0.003103, 0.003217],
+                         "open_index": [1, 119, 153, 185],
+                         "close_index": [118, 151, 184, 199],
+                         "trade_duration": [123, 34, 31, 14],
+                         "open_at_end": [False, False, False, True],
+                         "sell_reason": [SellType.ROI, SellType.STOP_LOSS,
+                                         SellType.ROI, SellType.FORCE_SELL]
+                         })
+
+
+def test_store_backtest_result_parquet(tmpdir):
+    results = _backtest_results()
+    filename = Path(tmpdir) / 'backtest-result.parquet'
+    store_backtest_result_parquet(filename, {'DefStrat': results, 'Strat2': results.iloc[:1],
+                                             'Strat3': results.iloc[:0]})
+    assert (filename / 'strategy=DefStrat' / 'pair_key=ETH_BTC').is_dir()
+    assert (filename / 'strategy=DefStrat' / 'pair_key=UNITTEST_BTC').is_dir()
+    assert not (filename / 'strategy=Strat3').exists()
+
+    # Same result as the json export
+    store_backtest_result(Path(tmpdir) / 'backtest-result.json', {'DefStrat': results})
+    expected = load_backtest_data(Path(tmpdir) / 'backtest-result.json')
+    bt_data = load_backtest_data(filename, strategy='DefStrat')
+    pd.testing.assert_frame_equal(bt_data, expected, check_dtype=False)
+
+    bt_data = load_backtest_data(str(filename))
+    assert len(bt_data) == 5
+    assert sorted(bt_data['strategy'].unique()) == ['DefStrat', 'Strat2']
+
+    bt_data = load_backtest_data(filename, strategy='DefStrat', pairs=['ETH/BTC'],
+                                 columns=['pair', 'profitperc'])
+    assert list(bt_data.columns) == ['pair', 'profitperc']
+    assert bt_data['pair'].tolist() == ['ETH/BTC', 'ETH/BTC']
+
+    # Storing a strategy again replaces its previous results
+    store_backtest_result_parquet(filename, {'DefStrat': results.iloc[:2]})
+    assert len(load_backtest_data(filename, strategy='DefStrat')) == 2
+    assert len(load_backtest_data(filename, strategy='Strat2')) == 1
+
+
+def test_store_backtest_result_parquet_no_pyarrow(mocker, tmpdir):
+    mocker.patch.dict('sys.modules', {'pyarrow': None})
+    with pytest.raises(OperationalException, match=r'.*Please install pyarrow.*'):
+        store_backtest_result_parquet(Path(tmpdir), {'DefStrat': _backtest_results()})
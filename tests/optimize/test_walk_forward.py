@@ -0,0 +1,135 @@
+# pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, PropertyMock
+
+import pandas as pd
+import pytest
+from arrow import Arrow
+
+from freqtrade.commands.optimize_commands import start_walk_forward
+from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.walk_forward import WalkForward
+from tests.conftest import (get_args, log_has, log_has_re, patch_exchange,
+                            patched_configuration_load_config_file)
+
+
+def _ts(date: str) -> int:
+    return int(datetime.strptime(date, '%Y-%m-%d %H:%M').replace(tzinfo=timezone.utc).timestamp())
+
+
+@pytest.fixture(scope='function')
+def wf_conf(default_conf, mocker, testdatadir):
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.pairlist.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['UNITTEST/BTC', 'ETH/BTC']))
+    default_conf.update({
+        'datadir': testdatadir,
+        'ticker_interval': '5m',
+        'timerange': '20180110-20180120',
+        'fee': 0.0025,
+        'wf_train_days': 4,
+        'wf_test_days': 2,
+    })
+    return default_conf
+
+
+def test_start_walk_forward(mocker, fee, default_conf, caplog) -> None:
+    start_mock = MagicMock()
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.optimize.walk_forward.WalkForward.start', start_mock)
+    patched_configuration_load_config_file(mocker, default_conf)
+
+    args = [
+        'walk-forward',
+        '--config', 'config.json',
+        '--strategy', 'DefaultStrategy',
+        '--wf-train-days', '10',
+        '--wf-test-days', '5',
+        '--wf-jobs', '2',
+    ]
+    pargs = get_args(args)
+    start_walk_forward(pargs)
+    assert log_has('Starting freqtrade in Walk-forward mode', caplog)
+    assert log_has('Parameter --wf-test-days detected: 5 ...', caplog)
+    assert start_mock.call_count == 1
+
+
+def test_walk_forward_init_no_test_days(wf_conf) -> None:
+    del wf_conf['wf_test_days']
+    with pytest.raises(OperationalException, match=r'Walk-forward requires the length.*'):
+        WalkForward(wf_conf)
+
+
+def test_walk_forward_get_windows(wf_conf) -> None:
+    wf_conf['wf_step_days'] = 1
+    walk_forward = WalkForward(wf_conf)
+    min_date = Arrow(2018, 1, 10, 0, 0)
+    # Last candle of 2018-01-17
+    max_date = Arrow(2018, 1, 17, 23, 55)
+
+    windows = walk_forward.get_windows(min_date, max_date)
+    assert len(windows) == 3
+    assert windows[0].train.startts == _ts('2018-01-10 00:00')
+    assert windows[0].train.stopts == _ts('2018-01-14 00:00') - 1
+    assert windows[0].test.startts == _ts('2018-01-14 00:00')
+    assert windows[0].test.stopts == _ts('2018-01-16 00:00') - 1
+    assert windows[-1].train.startts == _ts('2018-01-12 00:00')
+    assert windows[-1].test.stopts == _ts('2018-01-18 00:00') - 1
+
+    # Rolling test windows without train period, step defaults to the test period
+    del wf_conf['wf_train_days']
+    del wf_conf['wf_step_days']
+    walk_forward = WalkForward(wf_conf)
+    windows = walk_forward.get_windows(min_date, max_date)
+    assert len(windows) == 4
+    assert all(window.train is None for window in windows)
+    assert [window.test.startts for window in windows] == [
+        _ts('2018-01-10 00:00'), _ts('2018-01-12 00:00'),
+        _ts('2018-01-14 00:00'), _ts('2018-01-16 00:00')]
+
+    assert walk_forward.get_windows(min_date, Arrow(2018, 1, 11, 0, 0)) == []
+
+
+@pytest.mark.parametrize("fork_available", [True, False])
+def test_walk_forward_start(wf_conf, mocker, caplog, fork_available) -> None:
+    show_mock = mocker.patch('freqtrade.optimize.walk_forward.show_walk_forward_results')
+
+    walk_forward = WalkForward(wf_conf)
+    indicator_mock = mocker.spy(walk_forward.backtesting.strategy, 'advise_indicators')
+    walk_forward.start()
+    sequential = show_mock.call_args[0][1]
+    # Indicators are populated once per pair, not once per window
+    assert indicator_mock.call_count == 2
+    assert log_has_re(r'Running walk-forward analysis on 2 windows from .*', caplog)
+
+    if not fork_available:
+        mocker.patch('freqtrade.misc.multiprocessing.get_all_start_methods',
+                     return_value=['spawn'])
+    wf_conf['wf_jobs'] = 2
+    walk_forward = WalkForward(wf_conf)
+    walk_forward.start()
+    parallel = show_mock.call_args[0][1]
+    if not fork_available:
+        assert log_has_re(r"Parallel walk-forward requires the 'fork' start method.*", caplog)
+
+    assert len(sequential) == len(parallel) == 2
+    for seq, par in zip(sequential, parallel):
+        assert seq.window == par.window
+        assert len(seq.train) > 0
+        assert len(seq.test) > 0
+        pd.testing.assert_frame_equal(seq.train, par.train)
+        pd.testing.assert_frame_equal(seq.test, par.test)
+        # Trades open within their period
+        assert (seq.test.open_time >= datetime.fromtimestamp(
+            seq.window.test.startts, tz=timezone.utc)).all()
+        assert (seq.train.open_time <= datetime.fromtimestamp(
+            seq.window.train.stopts, tz=timezone.utc)).all()
+
+
+def test_walk_forward_start_not_enough_data(wf_conf, mocker) -> None:
+    wf_conf['wf_train_days'] = 30
+    walk_forward = WalkForward(wf_conf)
+    with pytest.raises(OperationalException, match=r'Not enough data for one walk-forward.*'):
+        walk_forward.start()
@@ -511,6 +511,20 @@ def test_setup_configuration_with_stratlist(mocker, default_conf, caplog) -> Non
     assert log_has('Parameter --export detected: {} ...'.format(config['export']), caplog)
 
 
+def test_setup_configuration_export_parquet(mocker, default_conf) -> None:
+    patched_configuration_load_config_file(mocker, default_conf)
+
+    arglist = ['backtesting', '--config', 'config.json', '--export', 'parquet']
+    config = Configuration(Arguments(arglist).get_parsed_arg(), RunMode.BACKTEST).get_config()
+    assert config['export'] == 'parquet'
+    assert config['exportfilename'].name == 'backtest-result.parquet'
+
+    arglist = ['backtesting', '--config', 'config.json', '--export', 'parquet',
+               '--export-filename', 'user_data/backtest_results/today']
+    config = Configuration(Arguments(arglist).get_parsed_arg(), RunMode.BACKTEST).get_config()
+    assert config['exportfilename'] == Path('user_data/backtest_results/today')
+
+
 def test_hyperopt_with_arguments(mocker, default_conf, caplog) -> None:
     patched_configuration_load_config_file(mocker, default_conf)
 
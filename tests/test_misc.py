@@ -1,17 +1,22 @@
 # pragma pylint: disable=missing-docstring,C0103
 
 import datetime
+import os
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
 from freqtrade.data.converter import ohlcv_to_dataframe
+from freqtrade import misc
 from freqtrade.misc import (datesarray_to_datetimearray, file_dump_json,
-                            file_load_json, format_ms_time, pair_to_filename,
+                            file_load_json, fork_map, format_ms_time,
+                            pair_to_filename,
                             plural, render_template,
                             render_template_with_fallback, safe_value_fallback,
                             shorten_date)
+from tests.conftest import log_has, log_has_re
 
 
 def test_shorten_date() -> None:
@@ -160,3 +165,30 @@ def test_render_template_fallback(mocker):
     )
     assert isinstance(val, str)
     assert 'if self.dp' in val
+
+
+@pytest.mark.parametrize("fork_available", [True, False])
+def test_fork_map(mocker, caplog, fork_available) -> None:
+    if not fork_available:
+        mocker.patch('freqtrade.misc.multiprocessing.get_all_start_methods',
+                     return_value=['spawn'])
+    # Inherited by forked workers, locks can't be pickled
+    lock = threading.Lock()
+
+    def square_with_pid(item):
+        with lock:
+            return item * item, os.getpid()
+
+    results = fork_map(square_with_pid, range(5), 2, 'squaring')
+    assert [result for result, _ in results] == [0, 1, 4, 9, 16]
+    pids = {pid for _, pid in results}
+    if fork_available:
+        assert os.getpid() not in pids
+        assert log_has("Running squaring of 5 items using 2 worker processes", caplog)
+    else:
+        assert pids == {os.getpid()}
+        assert log_has_re(r"Parallel squaring requires the 'fork' start method.*", caplog)
+    assert misc._fork_state == {}
+
+    # One job maps in this process
+    assert fork_map(square_with_pid, [3], 2, 'squaring') == [(9, os.getpid())]
@@ -8,7 +8,7 @@ from sqlalchemy import create_engine
 
 from freqtrade import constants
 from freqtrade.exceptions import OperationalException
-from freqtrade.persistence import Trade, clean_dry_run_db, init
+from freqtrade.persistence import BacktestTrade, Trade, clean_dry_run_db, init
 from tests.conftest import log_has, create_mock_trades
 
 
@@ -979,3 +979,61 @@ def test_get_best_pair(fee):
     assert len(res) == 2
     assert res[0] == 'ETC/BTC'
     assert res[1] == 0.005
+
+
+@pytest.mark.parametrize('open_rate,stake_amount,fee', [
+    (0.00001099, 0.001, 0.0025),
+    (0.0102, 0.01, 0.001),
+    (8850.12, 100, 0.00075),
+    (1.0, 0.05, 0.0),
+    (0.00000123, 5, 0.002),
+])
+def test_backtest_trade_profit_parity(open_rate, stake_amount, fee):
+    kwargs = dict(pair='ETH/BTC', open_rate=open_rate, open_date=arrow.utcnow().datetime,
+                  stake_amount=stake_amount, amount=stake_amount / open_rate,
+                  fee_open=fee, fee_close=fee)
+    trade = Trade(exchange='bittrex', **kwargs)
+    bt_trade = BacktestTrade(**kwargs)
+
+    assert bt_trade.open_trade_price == trade.open_trade_price
+    for factor in [0.01, 0.5, 0.9, 0.99, 0.9975, 1, 1.0025, 1.0051, 1.01, 1.2, 1.5, 3]:
+        rate = open_rate * factor
+        assert bt_trade.calc_profit_ratio(rate) == trade.calc_profit_ratio(rate)
+        assert bt_trade.calc_profit(rate=rate) == trade.calc_profit(rate=rate)
+        assert (bt_trade.calc_profit_ratio(rate, fee=0.003)
+                == trade.calc_profit_ratio(rate, fee=0.003))
+        assert bt_trade.calc_profit(rate=rate, fee=0.003) == trade.calc_profit(rate=rate, fee=0.003)
+    # No close_rate set
+    assert bt_trade.calc_close_trade_price() == 0.0
+
+
+def test_backtest_trade_adjust_stop_loss():
+    trade = BacktestTrade(pair='ETH/BTC', open_rate=1, open_date=arrow.utcnow().datetime,
+                          stake_amount=0.001, amount=5, fee_open=0.0025, fee_close=0.0025)
+    assert not hasattr(trade, '__dict__')
+
+    trade.adjust_stop_loss(trade.open_rate, 0.05, True)
+    assert trade.stop_loss == 0.95
+    assert trade.stop_loss_pct == -0.05
+    assert trade.initial_stop_loss == 0.95
+    assert trade.initial_stop_loss_pct == -0.05
+
+    # Lower rate - should not change
+    trade.adjust_stop_loss(0.96, 0.05)
+    assert trade.stop_loss == 0.95
+
+    # Higher than open rate
+    trade.adjust_stop_loss(1.3, -0.1)
+    assert round(trade.stop_loss, 8) == 1.17
+    assert trade.stop_loss_pct == -0.1
+    assert trade.initial_stop_loss == 0.95
+    assert trade.initial_stop_loss_pct == -0.05
+
+    #  Initial is true but stop_loss set - so doesn't do anything
+    trade.adjust_stop_loss(1.7, 0.1, True)
+    assert round(trade.stop_loss, 8) == 1.17
+
+    trade.adjust_min_max_rates(0.91)
+    trade.adjust_min_max_rates(1.1)
+    assert trade.max_rate == 1.1
+    assert trade.min_rate == 0.91
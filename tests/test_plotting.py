@@ -13,6 +13,7 @@ from freqtrade.configuration import TimeRange
 from freqtrade.data import history
 from freqtrade.data.btanalysis import create_cum_profit, load_backtest_data
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.optimize_reports import store_backtest_result_parquet
 from freqtrade.plot.plotting import (add_indicators, add_profit,
                                      create_plotconfig,
                                      generate_candlestick_graph,
@@ -21,6 +22,7 @@ from freqtrade.plot.plotting import (add_indicators, add_profit,
                                      load_and_plot_trades, plot_profit,
                                      plot_trades, store_plot_file)
 from freqtrade.resolvers import StrategyResolver
+from freqtrade.strategy.interface import SellType
 from tests.conftest import get_args, log_has, log_has_re
 
 
@@ -62,6 +64,32 @@ def test_init_plotscript(default_conf, mocker, testdatadir):
     assert "ADA/BTC" in ret["ohlcv"]
 
 
+def test_init_plotscript_parquet(default_conf, testdatadir, tmpdir, caplog):
+    trades = load_backtest_data(testdatadir / "backtest-result_test.json")
+    results = trades.rename(columns={'profitperc': 'profit_percent',
+                                     'duration': 'trade_duration'})
+    results['open_index'] = results['index'] + 1
+    results['sell_reason'] = results['sell_reason'].map(SellType)
+    exportdir = Path(tmpdir) / 'backtest-result.parquet'
+    store_backtest_result_parquet(exportdir, {'DefaultStrategy': results,
+                                              'OtherStrategy': results.iloc[:10]})
+
+    default_conf.update({'timerange': "20180110-20180112", 'trade_source': "file",
+                         'datadir': testdatadir, 'exportfilename': exportdir,
+                         'pairs': ["TRX/BTC", "ADA/BTC"]})
+    del default_conf['strategy']
+    with pytest.raises(OperationalException,
+                       match=r"Backtest results contain trades of multiple strategies "
+                             r"\(DefaultStrategy, OtherStrategy\)\..*--strategy.*"):
+        init_plotscript(default_conf)
+
+    default_conf['strategy'] = 'OtherStrategy'
+    ret = init_plotscript(default_conf)
+    assert log_has("Using backtest results of strategy OtherStrategy.", caplog)
+    assert 'strategy' not in ret['trades']
+    assert len(ret['trades']) <= 10
+
+
 def test_add_indicators(default_conf, testdatadir, caplog):
     pair = "UNITTEST/BTC"
     timerange = TimeRange(None, 'line', 0, -1000)